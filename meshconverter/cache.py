@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+On-disk result cache keyed by mesh file content.
+
+Results live under ~/.cache/meshconverter/ (override with the
+MESHCONVERTER_CACHE_DIR environment variable) as JSON files named after
+a blake2b digest of the input file plus the package version and the
+parameters that affect the result.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from meshconverter import __version__
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+CACHE_DIR = Path(os.getenv('MESHCONVERTER_CACHE_DIR', str(Path.home() / '.cache' / 'meshconverter')))
+
+# Bump when the layout of cached results changes (the package version is
+# part of every key too, so upgrades never serve results of older code)
+CACHE_VERSION = 1
+
+_READ_CHUNK = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash a file's contents with blake2b, streaming in 1 MB chunks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        32-character hex digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_path(digest: str, *params: Any, suffix: str = '.json') -> Path:
+    """
+    Build the cache file path for a digest and result-affecting parameters.
+
+    The package version is part of the name, so results cached by another
+    release are never reused.
+
+    Args:
+        digest: Content digest from file_digest()
+        *params: Parameters that change the result (method, sizes, ...)
+        suffix: File extension
+
+    Returns:
+        Path inside CACHE_DIR
+    """
+    parts = [digest, f'v{CACHE_VERSION}', f'mc{__version__}'] + [str(p) for p in params]
+    return CACHE_DIR / ('-'.join(parts) + suffix)
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a result structure into plain JSON types.
+
+    NumPy arrays and scalars become lists/Python numbers. Values that have
+    no JSON form (e.g. trimesh objects) are dropped from dicts and replaced
+    by None in lists.
+
+    Args:
+        value: Result dict, list or scalar
+
+    Returns:
+        JSON-serializable copy of value
+    """
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            converted = to_jsonable(item)
+            if converted is not None or item is None:
+                out[str(key)] = converted
+        return out
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    return None
+
+
+def _json_default(value: Any) -> Any:
+    """Stdlib json fallback for NumPy values (orjson handles these natively)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        data: JSON-compatible data (NumPy arrays/scalars allowed)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file via a temporary sibling and os.replace.
+
+    Readers never see a truncated file, even if the writer is interrupted.
+
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def load_result(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached result.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        Cached result, or None if missing or unreadable
+    """
+    try:
+        return json_loads(Path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_result(path: Path, result: Dict[str, Any]) -> bool:
+    """
+    Write a result to the cache (best effort).
+
+    Args:
+        path: Cache file path
+        result: Result to store (converted with to_jsonable)
+
+    Returns:
+        True if written
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(path, json_dumps(to_jsonable(result)))
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
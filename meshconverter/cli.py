@@ -27,6 +27,7 @@ from meshconverter.classification import (
     classify_mesh_with_vision
 )
 from meshconverter.reconstruction.layer_analyzer import analyze_mesh_layers
+from meshconverter import cache as result_cache
 
 # Import core modules
 from core.mesh_loader import MeshLoader
@@ -150,128 +151,159 @@ def classify_layer_slicing(mesh: trimesh.Trimesh, layer_height: float = 2.0) ->
     }
 
 
-def classify_mesh(
+def _run_voxel(
     mesh: trimesh.Trimesh,
-    method: str,
     config: Dict[str, Any],
-    voxel_size: float = 1.0,
-    erosion_iterations: int = 0,
-    layer_height: float = 2.0
+    voxel_size: float,
+    erosion_iterations: int,
+    layer_height: float
 ) -> Dict[str, Any]:
-    """
-    Classify mesh using specified method.
+    """Run the voxel classifier."""
+    return classify_mesh_with_voxel(
+        mesh,
+        voxel_size=voxel_size,
+        erosion_iterations=erosion_iterations,
+        verbose=True
+    )
 
-    Args:
-        mesh: Input trimesh
-        method: Classification method ('voxel', 'gpt4-vision', 'heuristic', 'layer-slicing', 'all')
-        config: Configuration dictionary
-        voxel_size: Voxel size for voxel method
-        erosion_iterations: Erosion iterations for voxel method
-        layer_height: Layer height for layer-slicing method
 
-    Returns:
-        Classification result or list of results if method='all'
-    """
-    if method == 'voxel':
-        return classify_mesh_with_voxel(
-            mesh,
-            voxel_size=voxel_size,
-            erosion_iterations=erosion_iterations,
-            verbose=True
-        )
+def _run_layer_slicing(
+    mesh: trimesh.Trimesh,
+    config: Dict[str, Any],
+    voxel_size: float,
+    erosion_iterations: int,
+    layer_height: float
+) -> Dict[str, Any]:
+    """Run the layer-slicing classifier."""
+    return classify_layer_slicing(mesh, layer_height=layer_height)
 
-    elif method == 'layer-slicing':
-        return classify_layer_slicing(mesh, layer_height=layer_height)
 
-    elif method == 'gpt4-vision':
-        # Check for API key
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            print("❌ Error: OPENAI_API_KEY environment variable not set")
-            print("   Set it with: export OPENAI_API_KEY='your-key-here'")
-            sys.exit(1)
+def _run_vision(
+    mesh: trimesh.Trimesh,
+    config: Dict[str, Any],
+    voxel_size: float,
+    erosion_iterations: int,
+    layer_height: float
+) -> Dict[str, Any]:
+    """Run the GPT-4 Vision classifier (exits if OPENAI_API_KEY is unset)."""
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        print("❌ Error: OPENAI_API_KEY environment variable not set")
+        print("   Set it with: export OPENAI_API_KEY='your-key-here'")
+        sys.exit(1)
 
-        return classify_mesh_with_vision(mesh, api_key=api_key, verbose=True)
+    return classify_mesh_with_vision(mesh, api_key=api_key, verbose=True)
 
-    elif method == 'heuristic':
-        return classify_heuristic(mesh, config)
 
-    elif method == 'all':
-        print("\n🔍 Running all classification methods for comparison...\n")
-        print("=" * 70)
+def _run_heuristic(
+    mesh: trimesh.Trimesh,
+    config: Dict[str, Any],
+    voxel_size: float,
+    erosion_iterations: int,
+    layer_height: float
+) -> Dict[str, Any]:
+    """Run the bbox_ratio heuristic classifier."""
+    return classify_heuristic(mesh, config)
 
-        results = []
 
-        # Heuristic
-        try:
-            heuristic_result = classify_heuristic(mesh, config)
-            results.append(heuristic_result)
-        except Exception as e:
-            print(f"⚠️  Heuristic failed: {e}")
+def _run_all(
+    mesh: trimesh.Trimesh,
+    config: Dict[str, Any],
+    voxel_size: float,
+    erosion_iterations: int,
+    layer_height: float
+) -> Dict[str, Any]:
+    """Run every classifier and return the highest-confidence result."""
+    print("\n🔍 Running all classification methods for comparison...\n")
+    print("=" * 70)
 
-        # Layer-slicing
-        try:
-            layer_result = classify_layer_slicing(mesh, layer_height=layer_height)
-            results.append(layer_result)
-        except Exception as e:
-            print(f"⚠️  Layer-slicing failed: {e}")
+    results = []
+
+    for name, runner in CLASSIFIERS.items():
+        if runner is _run_all:
+            continue
+        # _run_vision exits without a key; here it is just skipped
+        if runner is _run_vision and not os.getenv('OPENAI_API_KEY'):
+            print("\n⊘ GPT-4 Vision skipped (no OPENAI_API_KEY)")
+            continue
 
-        # Voxel
         try:
-            voxel_result = classify_mesh_with_voxel(
-                mesh, voxel_size=voxel_size,
-                erosion_iterations=erosion_iterations,
-                verbose=True
-            )
-            results.append(voxel_result)
+            results.append(runner(mesh, config, voxel_size, erosion_iterations, layer_height))
         except Exception as e:
-            print(f"⚠️  Voxel failed: {e}")
+            print(f"⚠️  {name} failed: {e}")
 
-        # GPT-4 Vision (if API key available)
-        api_key = os.getenv('OPENAI_API_KEY')
-        if api_key:
-            try:
-                vision_result = classify_mesh_with_vision(mesh, api_key=api_key, verbose=True)
-                results.append(vision_result)
-            except Exception as e:
-                print(f"⚠️  GPT-4 Vision failed: {e}")
-        else:
-            print("\n⊘ GPT-4 Vision skipped (no OPENAI_API_KEY)")
+    # Print comparison
+    print("\n" + "=" * 70)
+    print("\n📊 Classification Method Comparison")
+    print("=" * 70)
+    print(f"{'Method':<20} {'Shape Type':<15} {'Confidence':<12} {'Status'}")
+    print("-" * 70)
 
-        # Print comparison
-        print("\n" + "=" * 70)
-        print("\n📊 Classification Method Comparison")
-        print("=" * 70)
-        print(f"{'Method':<20} {'Shape Type':<15} {'Confidence':<12} {'Status'}")
-        print("-" * 70)
+    for result in results:
+        method_name = result.get('method', 'unknown')
+        shape_type = result.get('shape_type', 'unknown')
+        confidence = result.get('confidence', 0)
+        status = "✅" if confidence >= 80 else "⚠️"
+        print(f"{method_name:<20} {shape_type:<15} {confidence}%{' ' * 8} {status}")
 
-        for result in results:
-            method_name = result.get('method', 'unknown')
-            shape_type = result.get('shape_type', 'unknown')
-            confidence = result.get('confidence', 0)
-            status = "✅" if confidence >= 80 else "⚠️"
-            print(f"{method_name:<20} {shape_type:<15} {confidence}%{' ' * 8} {status}")
+    print("=" * 70)
 
-        print("=" * 70)
+    # Check agreement
+    shape_types = [r.get('shape_type') for r in results]
+    if len(set(shape_types)) == 1:
+        print(f"\n✅ Agreement: All methods agree on '{shape_types[0]}'")
+    else:
+        print(f"\n⚠️  Disagreement: Methods suggest different shapes: {set(shape_types)}")
 
-        # Check agreement
-        shape_types = [r.get('shape_type') for r in results]
-        if len(set(shape_types)) == 1:
-            print(f"\n✅ Agreement: All methods agree on '{shape_types[0]}'")
-        else:
-            print(f"\n⚠️  Disagreement: Methods suggest different shapes: {set(shape_types)}")
+    # Return highest confidence result
+    best_result = max(results, key=lambda r: r.get('confidence', 0))
+    print(f"📌 Recommended: {best_result['method']} (highest confidence: {best_result['confidence']}%)")
 
-        # Return highest confidence result
-        best_result = max(results, key=lambda r: r.get('confidence', 0))
-        print(f"📌 Recommended: {best_result['method']} (highest confidence: {best_result['confidence']}%)")
+    return {'all_results': results, 'best_result': best_result}
 
-        return {'all_results': results, 'best_result': best_result}
 
-    else:
+# Classifier registry: name -> runner(mesh, config, voxel_size, erosion_iterations, layer_height).
+# Adding a classifier is one entry here; the CLI --classifier choices follow this table,
+# and 'all' runs every other entry in table order (the first wins confidence ties).
+CLASSIFIERS = {
+    'heuristic': _run_heuristic,
+    'layer-slicing': _run_layer_slicing,
+    'voxel': _run_voxel,
+    'gpt4-vision': _run_vision,
+    'all': _run_all,
+}
+
+
+def classify_mesh(
+    mesh: trimesh.Trimesh,
+    method: str,
+    config: Dict[str, Any],
+    voxel_size: float = 1.0,
+    erosion_iterations: int = 0,
+    layer_height: float = 2.0
+) -> Dict[str, Any]:
+    """
+    Classify mesh using specified method.
+
+    Args:
+        mesh: Input trimesh
+        method: Classification method (any key of CLASSIFIERS)
+        config: Configuration dictionary
+        voxel_size: Voxel size for voxel method
+        erosion_iterations: Erosion iterations for voxel method
+        layer_height: Layer height for layer-slicing method
+
+    Returns:
+        Classification result, or {'all_results', 'best_result'} if method='all'
+    """
+    runner = CLASSIFIERS.get(method)
+    if runner is None:
         print(f"❌ Error: Unknown classification method: {method}")
-        print("   Available methods: voxel, gpt4-vision, heuristic, all")
+        print(f"   Available methods: {', '.join(CLASSIFIERS)}")
         sys.exit(1)
 
+    return runner(mesh, config, voxel_size, erosion_iterations, layer_height)
+
 
 def generate_step_file(
     mesh: trimesh.Trimesh,
@@ -458,8 +490,7 @@ def generate_metadata_json(
         }
         
         output_path = output_dir / f"{output_dir.name}_metadata.json"
-        with open(output_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        output_path.write_bytes(result_cache.json_dumps(metadata, indent=True))
         
         return str(output_path)
     
@@ -719,8 +750,8 @@ def save_outputs(
     return outputs
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the `mc` argument parser."""
     parser = argparse.ArgumentParser(
         description="MeshConverter - Convert 3D meshes to parametric CAD primitives",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -731,6 +762,7 @@ Examples:
   mc input.stl --classifier gpt4-vision # Use GPT-4 Vision
   mc input.stl --classifier heuristic   # Use bbox_ratio heuristic
   mc input.stl --classifier all         # Compare all methods
+  mc --daemon                           # Keep classifiers hot for scripts/mc_client.py
 
 For more information: https://github.com/medtracket/meshconverter
         """
@@ -739,6 +771,7 @@ For more information: https://github.com/medtracket/meshconverter
     parser.add_argument(
         'input',
         type=str,
+        nargs='?',
         help='Input STL mesh file'
     )
 
@@ -752,7 +785,7 @@ For more information: https://github.com/medtracket/meshconverter
     parser.add_argument(
         '-c', '--classifier',
         type=str,
-        choices=['voxel', 'gpt4-vision', 'heuristic', 'layer-slicing', 'all'],
+        choices=list(CLASSIFIERS),
         default='voxel',
         help='Classification method (default: voxel)'
     )
@@ -785,14 +818,43 @@ For more information: https://github.com/medtracket/meshconverter
         help='Path to config.yaml file (default: ./config.yaml)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not write cached classification results'
+    )
+
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run a persistent worker that serves scripts/mc_client.py requests'
+    )
+
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=30.0,
+        help='Minutes of inactivity before --daemon exits (default: 30)'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
         version='%(prog)s 2.0.0'
     )
 
-    args = parser.parse_args()
+    return parser
 
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Run a single conversion for parsed CLI arguments.
+
+    Exits via sys.exit(1) on error, matching the standalone CLI.
+
+    Args:
+        args: Parsed arguments from build_parser()
+    """
     # Load configuration
     config = load_config(args.config)
 
@@ -801,6 +863,16 @@ For more information: https://github.com/medtracket/meshconverter
         print(f"❌ Error: Input file not found: {args.input}")
         sys.exit(1)
 
+    # Look up cached classification for bit-identical input
+    cache_file = None
+    cached_result = None
+    if not args.no_cache:
+        cache_file = result_cache.cache_path(
+            result_cache.file_digest(args.input),
+            args.classifier, args.voxel_size, args.erosion, args.layer_height
+        )
+        cached_result = result_cache.load_result(cache_file)
+
     # Print header
     print("\n" + "=" * 70)
     print("MeshConverter v2.0.0 - Mesh to CAD Primitive Converter")
@@ -822,14 +894,20 @@ For more information: https://github.com/medtracket/meshconverter
 
     # Classify mesh
     try:
-        result = classify_mesh(
-            mesh,
-            method=args.classifier,
-            config=config,
-            voxel_size=args.voxel_size,
-            erosion_iterations=args.erosion,
-            layer_height=args.layer_height
-        )
+        if cached_result is not None:
+            print(f"\n♻️  Using cached classification: {cache_file}")
+            result = cached_result
+        else:
+            result = classify_mesh(
+                mesh,
+                method=args.classifier,
+                config=config,
+                voxel_size=args.voxel_size,
+                erosion_iterations=args.erosion,
+                layer_height=args.layer_height
+            )
+            if cache_file is not None:
+                result_cache.save_result(cache_file, result)
 
         # Extract best result if multiple methods were run
         if isinstance(result, dict) and 'best_result' in result:
@@ -867,5 +945,21 @@ For more information: https://github.com/medtracket/meshconverter
         sys.exit(1)
 
 
+def main():
+    """Main CLI entry point."""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.daemon:
+        from meshconverter.daemon import serve
+        serve(idle_timeout=args.idle_timeout * 60)
+        return
+
+    if args.input is None:
+        parser.error('the following arguments are required: input')
+
+    run(args)
+
+
 if __name__ == "__main__":
     main()
@@ -9,13 +9,15 @@ This module provides the main `convert()` function that:
 4. Validates quality and generates dimensionally accurate STL output
 """
 
+import hashlib
 import os
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 import trimesh
 import numpy as np
-import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Vision analysis
@@ -30,6 +32,18 @@ from meshconverter.classification import (
     classify_mesh_with_vision
 )
 from meshconverter.reconstruction.layer_analyzer import analyze_mesh_layers
+from meshconverter import cache as result_cache
+
+try:
+    import fast_simplification
+    HAS_FAST_SIMPLIFICATION = True
+except ImportError:
+    fast_simplification = None
+    HAS_FAST_SIMPLIFICATION = False
+
+# Complex meshes below this face count are kept as-is: decimating them by
+# 90% destroys detail and costs more than it saves
+SIMPLIFY_MIN_FACES = 10_000
 
 # Primitives
 import sys
@@ -45,16 +59,28 @@ def analyze_with_vision_layers(
     mesh: trimesh.Trimesh,
     n_sample_layers: int = 5,
     api_key: Optional[str] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    max_concurrency: int = 8,
+    early_stop: bool = True
 ) -> Dict[str, Any]:
     """
     Analyze mesh using vision-enhanced layer slicing.
 
+    Layers are sliced first, then analyzed with concurrent GPT-4o requests
+    (network-bound). Transient API errors are retried with backoff by the
+    OpenAI client itself.
+
+    With early_stop, a Z-spread subset of max(2, n_sample_layers // 2) layers
+    is analyzed first; if those all agree on the shape with >90% confidence
+    the remaining layers are skipped (their vote could not change the result).
+
     Args:
         mesh: Input trimesh
         n_sample_layers: Number of layers to sample for vision analysis
         api_key: OpenAI API key (optional, uses env var if not provided)
         verbose: Print progress
+        max_concurrency: Maximum simultaneous vision API requests
+        early_stop: Skip remaining layers once the first wave agrees
 
     Returns:
         {
@@ -62,7 +88,8 @@ def analyze_with_vision_layers(
             'outlier_percentage': float,  # Average outlier %
             'confidence': float,  # Average confidence
             'layer_results': List[Dict],  # Individual layer results
-            'recommendation': str  # Action to take
+            'recommendation': str,  # Action to take
+            'layers_used': int  # Layers analyzed (identical sections share one API call)
         }
     """
     if verbose:
@@ -80,7 +107,8 @@ def analyze_with_vision_layers(
             'outlier_percentage': 0.0,
             'confidence': 0,
             'layer_results': [],
-            'recommendation': 'No API key provided'
+            'recommendation': 'No API key provided',
+            'layers_used': 0
         }
 
     # Initialize analyzer
@@ -94,7 +122,8 @@ def analyze_with_vision_layers(
             'outlier_percentage': 0.0,
             'confidence': 0,
             'layer_results': [],
-            'recommendation': f'Error: {str(e)}'
+            'recommendation': f'Error: {str(e)}',
+            'layers_used': 0
         }
 
     # Sample layers across Z range
@@ -109,38 +138,84 @@ def analyze_with_vision_layers(
         n_sample_layers
     )
 
-    layer_results = []
-
-    for i, z in enumerate(sample_z_values):
-        # Slice mesh
-        section = mesh.section(
-            plane_origin=[0, 0, z],
-            plane_normal=[0, 0, 1]
-        )
+    # Slice all sample layers in one sweep over the faces (CPU),
+    # then fan out the API calls (network)
+    sections = mesh.section_multiplane(
+        plane_origin=[0, 0, z_min],
+        plane_normal=[0, 0, 1],
+        heights=sample_z_values - z_min
+    )
 
-        if section is None or len(section.vertices) == 0:
+    layer_sections = []
+    for i, (z, section) in enumerate(zip(sample_z_values, sections)):
+        # entities is already populated; vertices would be materialized
+        if section is None or not len(section.entities):
             continue
 
-        # Analyze with vision
-        try:
-            result = analyzer.analyze_layer_for_outliers(
-                section=section,
-                z_height=z,
-                layer_id=i,
-                verbose=False  # Quiet during batch processing
-            )
-            layer_results.append(result)
-
-            if verbose:
-                shape = result.get('shape_detected', 'unknown')
-                conf = result.get('confidence', 0)
-                outliers = "YES" if result.get('has_outliers', False) else "NO"
-                print(f"  Layer {i+1}/{n_sample_layers} @ Z={z:.1f}mm: {shape} (conf:{conf}%, outliers:{outliers})")
+        layer_sections.append((i, z, section))
+
+    # Analyze in up to two waves: a Z-spread subset first, then the rest
+    # unless the subset already reached a confident consensus
+    min_layers = max(2, n_sample_layers // 2)
+    if early_stop and len(layer_sections) > min_layers:
+        first_idx = set(np.linspace(0, len(layer_sections) - 1, min_layers).round().astype(int).tolist())
+        waves = [
+            [s for k, s in enumerate(layer_sections) if k in first_idx],
+            [s for k, s in enumerate(layer_sections) if k not in first_idx]
+        ]
+    else:
+        waves = [layer_sections]
+
+    completed = {}
+    section_futures = {}
+    if layer_sections:
+        n_workers = max(1, min(max_concurrency, len(layer_sections)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for wave_id, wave in enumerate(waves):
+                if wave_id > 0 and _has_vision_consensus(
+                    [result for _, result in completed.values()], min_layers
+                ):
+                    if verbose:
+                        print(f"  ⏩ First {len(completed)} layers agree (>90% confidence), "
+                              f"skipping {len(wave)} more")
+                    break
+
+                # Sections with the same geometry (e.g. extrusions) share one
+                # API call, including across waves
+                futures = {}
+                for i, z, section in wave:
+                    sig = _section_signature(section)
+                    future = section_futures.get(sig)
+                    if future is None:
+                        future = executor.submit(
+                            analyzer.analyze_layer_for_outliers,
+                            section=section,
+                            z_height=z,
+                            layer_id=i,
+                            verbose=False  # Quiet during batch processing
+                        )
+                        section_futures[sig] = future
+                    futures.setdefault(future, []).append((i, z))
+
+                for future in as_completed(futures):
+                    for i, z in futures[future]:
+                        try:
+                            completed[i] = (z, dict(future.result()))
+                        except Exception as e:
+                            if verbose:
+                                print(f"  ⚠️  Layer {i+1} analysis failed: {e}")
+
+    # Report and collect in layer order
+    layer_results = []
+    for i in sorted(completed):
+        z, result = completed[i]
+        layer_results.append(result)
 
-        except Exception as e:
-            if verbose:
-                print(f"  ⚠️  Layer {i+1} analysis failed: {e}")
-            continue
+        if verbose:
+            shape = result.get('shape_detected', 'unknown')
+            conf = result.get('confidence', 0)
+            outliers = "YES" if result.get('has_outliers', False) else "NO"
+            print(f"  Layer {i+1}/{n_sample_layers} @ Z={z:.1f}mm: {shape} (conf:{conf}%, outliers:{outliers})")
 
     if not layer_results:
         return {
@@ -148,7 +223,8 @@ def analyze_with_vision_layers(
             'outlier_percentage': 0.0,
             'confidence': 0,
             'layer_results': [],
-            'recommendation': 'No layers successfully analyzed'
+            'recommendation': 'No layers successfully analyzed',
+            'layers_used': 0
         }
 
     # Aggregate results
@@ -157,13 +233,16 @@ def analyze_with_vision_layers(
     outlier_percentages = [r.get('outlier_percentage', 0) for r in layer_results]
 
     # Find consensus shape (most common)
-    from collections import Counter
-    shape_counts = Counter(shapes)
-    shape_consensus = shape_counts.most_common(1)[0][0]
+    # (plain dict tally; ties go to the first shape seen, as with most_common)
+    shape_counts = {}
+    for shape in shapes:
+        shape_counts[shape] = shape_counts.get(shape, 0) + 1
+    shape_consensus = max(shape_counts, key=shape_counts.get)
 
-    # Calculate averages
-    avg_confidence = np.mean(confidences)
-    avg_outlier_pct = np.mean(outlier_percentages)
+    # Calculate averages (one array for both columns)
+    avg_confidence, avg_outlier_pct = np.asarray(
+        [confidences, outlier_percentages], dtype=np.float64
+    ).mean(axis=1)
 
     # Generate recommendation
     if avg_outlier_pct > 10:
@@ -188,15 +267,54 @@ def analyze_with_vision_layers(
         'confidence': avg_confidence,
         'layer_results': layer_results,
         'recommendation': recommendation,
-        'shape_distribution': dict(shape_counts)
+        'shape_distribution': shape_counts,
+        'layers_used': len(layer_results)
     }
 
 
+def _section_signature(section: Any) -> bytes:
+    """
+    Geometry signature of a 2D section, used to spot repeated cross-sections.
+
+    Each entity contributes its enclosed area and length (both unchanged by
+    extra collinear points where the slicing plane crosses triangle
+    diagonals), sorted so path order does not matter, plus the section
+    bounds. Values are rounded to 0.01 mm.
+    """
+    features = []
+    for entity in section.entities:
+        points = section.vertices[entity.points]
+        a, b = points[:-1], points[1:]
+        area = abs((a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]).sum()) / 2
+        length = np.linalg.norm(b - a, axis=1).sum()
+        features.append((area, length))
+
+    signature = np.concatenate([
+        np.round(sorted(features), 2).ravel(),
+        np.round(section.bounds, 2).ravel()
+    ]) + 0.0  # normalize -0.0
+    return hashlib.blake2b(signature.tobytes(), digest_size=8).digest()
+
+
+def _has_vision_consensus(results: List[Dict[str, Any]], min_layers: int,
+                          min_confidence: float = 90) -> bool:
+    """True if at least min_layers results all report one shape above min_confidence."""
+    if len(results) < min_layers:
+        return False
+    first_shape = results[0].get('shape_detected')
+    return all(
+        r.get('shape_detected') == first_shape and r.get('confidence', 0) > min_confidence
+        for r in results
+    )
+
+
 def select_best_method(
     mesh: trimesh.Trimesh,
     vision_result: Optional[Dict] = None,
     layer_result: Optional[Dict] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    mesh_volume: Optional[float] = None,
+    bbox_volume: Optional[float] = None
 ) -> Tuple[str, Dict[str, Any]]:
     """
     Intelligently select the best classification/reconstruction method.
@@ -206,6 +324,8 @@ def select_best_method(
         vision_result: Vision layer analysis result
         layer_result: Layer-slicing result
         verbose: Print decision process
+        mesh_volume: Precomputed mesh.volume (computed if None)
+        bbox_volume: Precomputed mesh.bounding_box.volume (computed if None)
 
     Returns:
         (method_name, classification_result)
@@ -214,8 +334,10 @@ def select_best_method(
         print("\n🎯 Selecting optimal reconstruction method...")
 
     # Calculate bbox_ratio for quick heuristic
-    bbox_volume = mesh.bounding_box.volume
-    mesh_volume = mesh.volume
+    if bbox_volume is None:
+        bbox_volume = float(mesh.bounding_box.volume)
+    if mesh_volume is None:
+        mesh_volume = float(mesh.volume)
     bbox_ratio = mesh_volume / bbox_volume if bbox_volume > 0 else 0
 
     # Check vision consensus if available
@@ -296,11 +418,52 @@ def select_best_method(
         }
 
 
+def _simplify_mesh(mesh: trimesh.Trimesh, target_reduction: float) -> trimesh.Trimesh:
+    """
+    Quadric-decimate a mesh with fast-simplification, falling back to Open3D.
+
+    Vertices are handed over as contiguous float32 (what fast-simplification
+    works in anyway) and the result is wrapped with process=False, since the
+    decimated output needs no merge/cleanup pass.
+
+    Args:
+        mesh: Mesh to simplify
+        target_reduction: Fraction of faces to remove (0.9 keeps 10%)
+
+    Returns:
+        Simplified mesh
+
+    Raises:
+        ImportError: If neither fast-simplification nor open3d is installed
+    """
+    if HAS_FAST_SIMPLIFICATION:
+        verts, faces = fast_simplification.simplify(
+            np.ascontiguousarray(mesh.vertices, dtype=np.float32),
+            mesh.faces.view(np.ndarray),
+            target_reduction=target_reduction
+        )
+        return trimesh.Trimesh(vertices=verts, faces=faces, process=False)
+
+    import open3d as o3d
+    o3d_mesh = o3d.geometry.TriangleMesh(
+        o3d.utility.Vector3dVector(mesh.vertices.view(np.ndarray)),
+        o3d.utility.Vector3iVector(mesh.faces.view(np.ndarray))
+    )
+    target_faces = max(4, int(len(mesh.faces) * (1.0 - target_reduction)))
+    simplified = o3d_mesh.simplify_quadric_decimation(target_number_of_triangles=target_faces)
+    return trimesh.Trimesh(
+        vertices=np.asarray(simplified.vertices),
+        faces=np.asarray(simplified.triangles),
+        process=False
+    )
+
+
 def reconstruct_primitive(
     mesh: trimesh.Trimesh,
     shape_type: str,
     classification: Dict[str, Any],
-    verbose: bool = True
+    verbose: bool = True,
+    mesh_volume: Optional[float] = None
 ) -> Optional[trimesh.Trimesh]:
     """
     Reconstruct clean parametric primitive from mesh.
@@ -310,12 +473,15 @@ def reconstruct_primitive(
         shape_type: Shape to reconstruct ('cylinder', 'box', 'assembly', 'complex')
         classification: Classification result with parameters
         verbose: Print progress
+        mesh_volume: Precomputed mesh.volume for logging (computed if None)
 
     Returns:
         Clean reconstructed mesh or None if failed
     """
     if verbose:
         print(f"\n🔧 Reconstructing {shape_type.upper()} primitive...")
+        if mesh_volume is None:
+            mesh_volume = float(mesh.volume)
 
     try:
         if shape_type == 'cylinder':
@@ -325,7 +491,7 @@ def reconstruct_primitive(
 
             if verbose:
                 print(f"  ✅ Cylinder: radius={primitive.radius:.2f}mm, length={primitive.length:.2f}mm")
-                print(f"     Volume: {reconstructed.volume:.2f} mm³ (original: {mesh.volume:.2f} mm³)")
+                print(f"     Volume: {reconstructed.volume:.2f} mm³ (original: {mesh_volume:.2f} mm³)")
 
             return reconstructed
 
@@ -337,7 +503,7 @@ def reconstruct_primitive(
             extents = primitive.extents if hasattr(primitive, 'extents') else reconstructed.bounding_box.extents
             if verbose:
                 print(f"  ✅ Box: {extents[0]:.2f} × {extents[1]:.2f} × {extents[2]:.2f} mm")
-                print(f"     Volume: {reconstructed.volume:.2f} mm³ (original: {mesh.volume:.2f} mm³)")
+                print(f"     Volume: {reconstructed.volume:.2f} mm³ (original: {mesh_volume:.2f} mm³)")
 
             return reconstructed
 
@@ -350,16 +516,26 @@ def reconstruct_primitive(
                     print("  ⚠️  No box data found, using simplified mesh")
                 return mesh
 
-            meshes = []
+            # Fill one shared vertex/face buffer from a unit box template
+            # instead of building a trimesh per box and concatenating.
+            unit_box = trimesh.creation.box(extents=[1, 1, 1])
+            box_verts = unit_box.vertices
+            box_faces = unit_box.faces
+            nv, nf = len(box_verts), len(box_faces)
+            n = len(detected_boxes)
+            verts = np.empty((nv * n, 3), dtype=np.float64)
+            faces = np.empty((nf * n, 3), dtype=np.int64)
+
+            n_boxes = 0
             for i, box_data in enumerate(detected_boxes):
                 try:
-                    center = np.array(box_data.get('center', [0, 0, 0]))
-                    dims = box_data.get('dimensions', [10, 10, 10])
+                    center = np.asarray(box_data.get('center', [0, 0, 0]), dtype=np.float64)
+                    dims = np.asarray(box_data.get('dimensions', [10, 10, 10]), dtype=np.float64)
 
-                    # Create clean box
-                    box_mesh = trimesh.creation.box(extents=dims)
-                    box_mesh.apply_translation(center - box_mesh.centroid)
-                    meshes.append(box_mesh)
+                    # Unit box is centered at the origin, so scale then shift
+                    verts[nv * n_boxes:nv * (n_boxes + 1)] = box_verts * dims + center
+                    faces[nf * n_boxes:nf * (n_boxes + 1)] = box_faces + nv * n_boxes
+                    n_boxes += 1
 
                     if verbose:
                         print(f"  ✅ Box {i+1}: {dims[0]:.1f}×{dims[1]:.1f}×{dims[2]:.1f}mm @ ({center[0]:.1f}, {center[1]:.1f}, {center[2]:.1f})")
@@ -368,11 +544,15 @@ def reconstruct_primitive(
                     if verbose:
                         print(f"  ⚠️  Failed to generate box {i+1}: {e}")
 
-            if meshes:
-                reconstructed = trimesh.util.concatenate(meshes)
+            if n_boxes:
+                reconstructed = trimesh.Trimesh(
+                    vertices=verts[:nv * n_boxes],
+                    faces=faces[:nf * n_boxes],
+                    process=False
+                )
                 if verbose:
-                    print(f"  ✅ Assembly: {len(meshes)} boxes combined")
-                    print(f"     Total volume: {reconstructed.volume:.2f} mm³ (original: {mesh.volume:.2f} mm³)")
+                    print(f"  ✅ Assembly: {n_boxes} boxes combined")
+                    print(f"     Total volume: {reconstructed.volume:.2f} mm³ (original: {mesh_volume:.2f} mm³)")
                 return reconstructed
             else:
                 if verbose:
@@ -381,24 +561,18 @@ def reconstruct_primitive(
 
         else:  # complex or unknown
             # Apply simplification if available
+            if len(mesh.faces) <= SIMPLIFY_MIN_FACES:
+                if verbose:
+                    print(f"  ✅ Keeping original mesh ({len(mesh.faces)} faces, below simplification threshold)")
+                return mesh
+
             try:
-                import fast_simplification
                 target_reduction = 0.90  # Keep 10% of faces
 
                 if verbose:
                     print(f"  Simplifying: {len(mesh.faces)} → ", end='')
 
-                simplified = fast_simplification.simplify(
-                    mesh.vertices,
-                    mesh.faces,
-                    target_reduction=target_reduction
-                )
-
-                if isinstance(simplified, tuple):
-                    verts, faces = simplified
-                    reconstructed = trimesh.Trimesh(vertices=verts, faces=faces)
-                else:
-                    reconstructed = simplified
+                reconstructed = _simplify_mesh(mesh, target_reduction)
 
                 if verbose:
                     print(f"{len(reconstructed.faces)} faces")
@@ -408,7 +582,7 @@ def reconstruct_primitive(
 
             except ImportError:
                 if verbose:
-                    print("  ⚠️  fast-simplification not available")
+                    print("  ⚠️  No simplifier available (install fast-simplification or open3d)")
                     print("  Using original mesh")
                 return mesh
             except Exception as e:
@@ -422,6 +596,65 @@ def reconstruct_primitive(
         return None
 
 
+def _save_metadata(metadata_path: str, metadata: Dict[str, Any], verbose: bool = True) -> None:
+    """Write conversion metadata JSON atomically (best effort)."""
+    try:
+        result_cache.write_bytes_atomic(
+            metadata_path,
+            result_cache.json_dumps(metadata, indent=True)
+        )
+        if verbose:
+            print(f"  ✅ Metadata: {metadata_path}")
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️  Failed to save metadata: {e}")
+
+
+def _restore_cached_conversion(
+    cached: Dict[str, Any],
+    cached_stl: Path,
+    input_path: str,
+    output_path: str,
+    metadata_path: str,
+    verbose: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Materialize a cached conversion at the requested output path.
+
+    Args:
+        cached: Cached convert() result
+        cached_stl: Cached output mesh
+        input_path: Current input path
+        output_path: Requested output STL path
+        metadata_path: Metadata JSON path for this output
+
+    Returns:
+        convert() result for this call, or None if the cache entry is unusable
+    """
+    try:
+        shutil.copyfile(cached_stl, output_path)
+    except OSError:
+        return None
+
+    metadata = dict(cached.get('metadata', {}))
+    metadata.update({'input_file': input_path, 'output_file': output_path})
+
+    if verbose:
+        print(f"\n♻️  Reusing cached conversion ({cached_stl.name})")
+        print(f"  ✅ Saved: {output_path}")
+    _save_metadata(metadata_path, metadata, verbose=verbose)
+
+    result = dict(cached)
+    result.update({
+        'input_file': input_path,
+        'output_file': output_path,
+        'metadata_file': metadata_path,
+        'metadata': metadata,
+        'cached': True
+    })
+    return result
+
+
 def convert(
     input_path: str,
     output_path: Optional[str] = None,
@@ -429,7 +662,8 @@ def convert(
     n_vision_layers: int = 5,
     use_layer_slicing: bool = True,
     layer_height: float = 2.0,
-    verbose: bool = True
+    verbose: bool = True,
+    use_cache: bool = False
 ) -> Dict[str, Any]:
     """
     Main conversion function: Mesh → Clean Parametric STL
@@ -445,6 +679,9 @@ def convert(
         use_layer_slicing: Use layer-slicing for assembly detection
         layer_height: Layer height for slicing (mm, default: 2.0)
         verbose: Print detailed progress
+        use_cache: Reuse/store results in the on-disk cache keyed by input
+            file content, package version and the options above (off by
+            default; the command line turns it on)
 
     Returns:
         {
@@ -467,21 +704,40 @@ def convert(
         print(f"Input: {input_path}")
 
     # Validate input
-    if not os.path.exists(input_path):
+    input_p = Path(input_path)
+    if not input_p.exists():
         return {
             'success': False,
             'error': f'Input file not found: {input_path}'
         }
 
-    # Determine output path
-    if output_path is None:
-        input_stem = Path(input_path).stem
-        output_path = str(Path(input_path).parent / f"{input_stem}_optimized.stl")
+    # Determine output/metadata paths once
+    output_p = Path(output_path) if output_path else input_p.with_name(f"{input_p.stem}_optimized.stl")
+    metadata_p = output_p.with_suffix('.json')
+    output_path = str(output_p)
+    metadata_path = str(metadata_p)
 
     if verbose:
         print(f"Output: {output_path}")
         print("="*80)
 
+    # Reuse a previous conversion of bit-identical input with the same options
+    cache_stl = cache_json = None
+    if use_cache:
+        vision_active = use_vision and bool(os.getenv('OPENAI_API_KEY'))
+        digest = result_cache.file_digest(input_path)
+        cache_params = ('convert', vision_active, n_vision_layers, use_layer_slicing, layer_height)
+        cache_stl = result_cache.cache_path(digest, *cache_params, suffix='.stl')
+        cache_json = result_cache.cache_path(digest, *cache_params)
+
+        cached = result_cache.load_result(cache_json)
+        if cached is not None and cache_stl.exists():
+            restored = _restore_cached_conversion(
+                cached, cache_stl, input_path, output_path, metadata_path, verbose=verbose
+            )
+            if restored is not None:
+                return restored
+
     # Load mesh
     if verbose:
         print("\n📂 Loading mesh...")
@@ -489,18 +745,26 @@ def convert(
     try:
         mesh = trimesh.load(input_path)
 
+        # Compute mesh-wide properties once and reuse them downstream
+        # (axis-aligned extents straight from mesh.bounds, no Box primitive built)
+        mesh_volume = float(mesh.volume)
+        bounds = mesh.bounds
+        bbox_extents = (bounds[1] - bounds[0]).tolist()
+        bbox_volume = float(np.prod(bbox_extents))
+        is_watertight = bool(mesh.is_watertight)
+
         original_stats = {
             'vertices': len(mesh.vertices),
             'faces': len(mesh.faces),
-            'volume_mm3': float(mesh.volume),
-            'bbox_extents': [float(x) for x in mesh.bounding_box.extents],
-            'is_watertight': mesh.is_watertight
+            'volume_mm3': mesh_volume,
+            'bbox_extents': bbox_extents,
+            'is_watertight': is_watertight
         }
 
         if verbose:
             print(f"  ✅ Loaded: {original_stats['vertices']:,} vertices, {original_stats['faces']:,} faces")
             print(f"     Volume: {original_stats['volume_mm3']:.2f} mm³")
-            print(f"     Bounding box: {original_stats['bbox_extents']}")
+            print(f"     Bounding box: {bbox_extents}")
             print(f"     Watertight: {'YES' if original_stats['is_watertight'] else 'NO'}")
 
     except Exception as e:
@@ -509,38 +773,60 @@ def convert(
             'error': f'Failed to load mesh: {str(e)}'
         }
 
-    # STEP 1: Vision-enhanced layer analysis (if enabled)
+    # STEPS 1+2: Vision (network-bound) and layer-slicing (CPU-bound) are
+    # independent, so run them side by side. Layer slicing runs quiet and its
+    # summary is printed after the join to keep the vision log readable.
     vision_result = None
-    if use_vision:
-        try:
-            vision_result = analyze_with_vision_layers(
+    layer_result = None
+    vision_future = None
+    layer_future = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if use_vision:
+            vision_future = executor.submit(
+                analyze_with_vision_layers,
                 mesh,
                 n_sample_layers=n_vision_layers,
                 verbose=verbose
             )
-        except Exception as e:
-            if verbose:
-                print(f"  ⚠️  Vision analysis failed: {e}")
-            vision_result = None
+        if use_layer_slicing:
+            layer_future = executor.submit(
+                analyze_mesh_layers,
+                mesh,
+                layer_height=layer_height,
+                verbose=False
+            )
 
-    # STEP 2: Layer-slicing analysis (if enabled)
-    layer_result = None
-    if use_layer_slicing:
-        try:
+        # STEP 1: Vision-enhanced layer analysis (if enabled)
+        if vision_future is not None:
+            try:
+                vision_result = vision_future.result()
+            except Exception as e:
+                if verbose:
+                    print(f"  ⚠️  Vision analysis failed: {e}")
+                vision_result = None
+
+        # STEP 2: Layer-slicing analysis (if enabled)
+        if layer_future is not None:
             if verbose:
                 print(f"\n📋 Layer-slicing analysis (height={layer_height}mm)...")
-            layer_result = analyze_mesh_layers(mesh, layer_height=layer_height, verbose=verbose)
-        except Exception as e:
-            if verbose:
-                print(f"  ⚠️  Layer-slicing failed: {e}")
-            layer_result = None
+            try:
+                layer_result = layer_future.result()
+                if verbose:
+                    print(f"  Layers: {layer_result['n_layers']}, valid regions: {layer_result['valid_layers']}")
+                    print(f"  ✅ Detected {len(layer_result['detected_boxes'])} boxes from layer analysis")
+            except Exception as e:
+                if verbose:
+                    print(f"  ⚠️  Layer-slicing failed: {e}")
+                layer_result = None
 
     # STEP 3: Select best method and classify
     shape_type, classification = select_best_method(
         mesh,
         vision_result=vision_result,
         layer_result=layer_result,
-        verbose=verbose
+        verbose=verbose,
+        mesh_volume=mesh_volume,
+        bbox_volume=bbox_volume
     )
 
     # STEP 4: Reconstruct primitive
@@ -548,7 +834,8 @@ def convert(
         mesh,
         shape_type=shape_type,
         classification=classification,
-        verbose=verbose
+        verbose=verbose,
+        mesh_volume=mesh_volume
     )
 
     if reconstructed is None:
@@ -561,15 +848,18 @@ def convert(
     if verbose:
         print("\n📊 Calculating quality metrics...")
 
-    volume_error = abs(reconstructed.volume - mesh.volume) / mesh.volume if mesh.volume > 0 else 1.0
+    recon_volume = float(reconstructed.volume)
+    recon_face_count = len(reconstructed.faces)
+    recon_vert_count = len(reconstructed.vertices)
+    volume_error = abs(recon_volume - mesh_volume) / mesh_volume if mesh_volume > 0 else 1.0
     quality_score = int(100 * (1 - volume_error))
 
     quality_metrics = {
         'volume_error_percent': float(volume_error * 100),
         'quality_score': quality_score,
-        'face_reduction': float((original_stats['faces'] - len(reconstructed.faces)) / original_stats['faces'] * 100),
+        'face_reduction': float((original_stats['faces'] - recon_face_count) / original_stats['faces'] * 100),
         'original_volume': original_stats['volume_mm3'],
-        'reconstructed_volume': float(reconstructed.volume)
+        'reconstructed_volume': recon_volume
     }
 
     if verbose:
@@ -585,10 +875,10 @@ def convert(
         reconstructed.export(output_path)
 
         output_stats = {
-            'vertices': len(reconstructed.vertices),
-            'faces': len(reconstructed.faces),
-            'volume_mm3': float(reconstructed.volume),
-            'bbox_extents': [float(x) for x in reconstructed.bounding_box.extents]
+            'vertices': recon_vert_count,
+            'faces': recon_face_count,
+            'volume_mm3': recon_volume,
+            'bbox_extents': (reconstructed.bounds[1] - reconstructed.bounds[0]).tolist()
         }
 
         if verbose:
@@ -601,7 +891,6 @@ def convert(
         }
 
     # STEP 7: Save metadata
-    metadata_path = str(Path(output_path).with_suffix('.json'))
     metadata = {
         'timestamp': datetime.now().isoformat(),
         'input_file': input_path,
@@ -620,17 +909,11 @@ def convert(
             'shape_consensus': vision_result.get('shape_consensus'),
             'avg_confidence': float(vision_result.get('confidence', 0)),
             'avg_outliers': float(vision_result.get('outlier_percentage', 0)),
-            'recommendation': vision_result.get('recommendation')
+            'recommendation': vision_result.get('recommendation'),
+            'layers_used': vision_result.get('layers_used', len(vision_result.get('layer_results', [])))
         }
 
-    try:
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        if verbose:
-            print(f"  ✅ Metadata: {metadata_path}")
-    except Exception as e:
-        if verbose:
-            print(f"  ⚠️  Failed to save metadata: {e}")
+    _save_metadata(metadata_path, metadata, verbose=verbose)
 
     # Final summary
     if verbose:
@@ -640,11 +923,11 @@ def convert(
         print(f"Shape: {shape_type.upper()}")
         print(f"Confidence: {classification.get('confidence', 0):.0f}%")
         print(f"Quality Score: {quality_score}/100")
-        print(f"Face Reduction: {len(reconstructed.faces):,} ({quality_metrics['face_reduction']:.1f}% reduction)")
+        print(f"Face Reduction: {recon_face_count:,} ({quality_metrics['face_reduction']:.1f}% reduction)")
         print(f"Volume Error: {quality_metrics['volume_error_percent']:.2f}%")
         print("="*80)
 
-    return {
+    result = {
         'success': True,
         'input_file': input_path,
         'output_file': output_path,
@@ -658,6 +941,17 @@ def convert(
         'metadata': metadata
     }
 
+    # Store for repeat runs (STL first so a JSON hit always has its mesh)
+    if cache_json is not None:
+        try:
+            cache_stl.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_stl)
+            result_cache.save_result(cache_json, result)
+        except OSError:
+            pass
+
+    return result
+
 
 if __name__ == "__main__":
     import argparse
@@ -674,6 +968,7 @@ if __name__ == "__main__":
     parser.add_argument('--no-layer-slicing', action='store_true', help='Disable layer-slicing')
     parser.add_argument('--layer-height', type=float, default=2.0, help='Layer height in mm (default: 2.0)')
     parser.add_argument('-q', '--quiet', action='store_true', help='Suppress output')
+    parser.add_argument('--no-cache', action='store_true', help='Do not reuse or store cached conversions')
 
     args = parser.parse_args()
 
@@ -684,7 +979,8 @@ if __name__ == "__main__":
         n_vision_layers=args.vision_layers,
         use_layer_slicing=not args.no_layer_slicing,
         layer_height=args.layer_height,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        use_cache=not args.no_cache
     )
 
     if not result['success']:
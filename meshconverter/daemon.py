@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Persistent MeshConverter worker (`mc --daemon`).
+
+Keeps trimesh, numpy, the classifiers and PyYAML imported in one long-lived
+process so repeated conversions skip interpreter start-up and import cost.
+Requests arrive over a unix socket as one line of JSON:
+
+    {"argv": ["input.stl", "-c", "heuristic"], "cwd": "/path/to/caller"}
+
+and are answered with one JSON document:
+
+    {"exit_code": 0, "output": "<captured stdout/stderr>"}
+
+Requests are served one at a time: classifiers print progress to the
+process-wide stdout, which is captured per request.
+
+Use scripts/mc_client.py as the lightweight (stdlib-only) client.
+"""
+
+import errno
+import io
+import json
+import os
+import socket
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from meshconverter import cli
+
+SOCKET_PATH = Path.home() / '.cache' / 'meshconverter' / 'daemon.sock'
+
+# Upper bound on a single request line (argv + cwd)
+MAX_REQUEST_BYTES = 1 << 20
+
+# Seconds a client may take to send its request line; requests are served
+# one at a time, so a silent client must not hold the daemon
+REQUEST_TIMEOUT_S = 10.0
+
+
+def handle_request(argv: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run one CLI invocation in-process and capture its output.
+
+    Args:
+        argv: Arguments as they would be passed to `mc`
+        cwd: Working directory of the calling client (for relative paths)
+
+    Returns:
+        {'exit_code': int, 'output': str}
+    """
+    buffer = io.StringIO()
+    exit_code = 0
+    previous_cwd = os.getcwd()
+
+    try:
+        if cwd:
+            os.chdir(cwd)
+
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            try:
+                args = cli.build_parser().parse_args(argv)
+                if args.daemon or args.input is None:
+                    print("❌ Error: daemon requests must name an input file")
+                    exit_code = 2
+                else:
+                    cli.run(args)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(previous_cwd)
+
+    return {'exit_code': exit_code, 'output': buffer.getvalue()}
+
+
+def _read_request(conn: socket.socket) -> Tuple[List[str], Optional[str]]:
+    """
+    Read one newline-terminated JSON request from a client connection.
+
+    Returns:
+        (argv, cwd)
+
+    Raises:
+        ValueError: If the request is not a JSON object with a list of
+            string "argv" and an optional string "cwd"
+    """
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if b'\n' in chunk or size > MAX_REQUEST_BYTES:
+            break
+    request = json.loads(b''.join(chunks).split(b'\n', 1)[0])
+
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    argv = request.get('argv', [])
+    cwd = request.get('cwd')
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        raise ValueError('"argv" must be a list of strings')
+    if cwd is not None and not isinstance(cwd, str):
+        raise ValueError('"cwd" must be a string')
+    return argv, cwd
+
+
+def _daemon_running(socket_path: Path) -> bool:
+    """
+    Check whether another daemon is listening on socket_path.
+
+    A socket file nobody listens on (connection refused) is left over from
+    a daemon that died and is removed.
+    """
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        if e.errno != errno.ECONNREFUSED:
+            raise
+        socket_path.unlink()
+        return False
+    finally:
+        probe.close()
+
+
+def serve(
+    socket_path: Path = SOCKET_PATH,
+    idle_timeout: float = 1800.0,
+    verbose: bool = True
+) -> None:
+    """
+    Serve conversion requests until idle for `idle_timeout` seconds.
+
+    Returns immediately if another daemon already listens on socket_path.
+
+    Args:
+        socket_path: Unix socket to listen on
+        idle_timeout: Seconds without a request before shutting down
+        verbose: Print start/stop messages
+    """
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    os.chmod(socket_path.parent, 0o700)
+    if _daemon_running(socket_path):
+        if verbose:
+            print(f"🔁 MeshConverter daemon already listening on {socket_path}")
+        return
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen(8)
+    server.settimeout(idle_timeout)
+
+    if verbose:
+        print(f"🔁 MeshConverter daemon listening on {socket_path}")
+        print(f"   Idle timeout: {idle_timeout / 60:.0f} min")
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if verbose:
+                    print("⏹  Idle timeout reached, shutting down")
+                break
+
+            with conn:
+                conn.settimeout(REQUEST_TIMEOUT_S)
+                try:
+                    argv, cwd = _read_request(conn)
+                    response = handle_request(argv, cwd)
+                except (ValueError, OSError) as e:
+                    response = {'exit_code': 2, 'output': f"❌ Error: bad request: {e}\n"}
+                try:
+                    conn.sendall(json.dumps(response).encode('utf-8'))
+                except OSError:
+                    pass
+    except KeyboardInterrupt:
+        if verbose:
+            print("\n⏹  Interrupted, shutting down")
+    finally:
+        server.close()
+        if socket_path.exists():
+            socket_path.unlink()
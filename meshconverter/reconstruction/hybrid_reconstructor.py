@@ -20,11 +20,220 @@ This hybrid approach provides:
 
 import trimesh
 import numpy as np
+import cv2
+from collections import defaultdict
+from functools import reduce
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
+from shapely.errors import ShapelyError
+from shapely.geometry import Polygon as ShapelyPolygon
 
 from .multiview_detector import MultiViewPrimitiveDetector, View2D
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _section_area(section: trimesh.path.Path2D) -> float:
+    """
+    Filled area of a planar section, holes included (even-odd rule).
+
+    Each closed entity becomes a shapely ring; XOR-ing the rings together
+    subtracts holes and re-adds islands inside holes.
+
+    Args:
+        section: Planar cross-section
+
+    Returns:
+        Area in mm², or 0.0 if no closed ring could be built
+    """
+    rings = [
+        ShapelyPolygon(section.vertices[entity.points])
+        for entity in section.entities
+        if len(entity.points) >= 4
+    ]
+    if not rings:
+        return 0.0
+
+    try:
+        return float(reduce(lambda a, b: a.symmetric_difference(b), rings).area)
+    except ShapelyError:
+        return float(sum(ring.area for ring in rings))
+
+
+# Adaptive layered slicing: coarse pass every N layers, refined to the full
+# layer_height only where the cross-section area changes by more than this
+ADAPTIVE_COARSE_FACTOR = 8
+ADAPTIVE_AREA_TOLERANCE = 0.05
+
+# Top-view contours at least this close to their convex hull (contour area /
+# hull area) are treated as plain boxes, even with many contour points
+BOX_SOLIDITY_THRESHOLD = 0.95
+
+
+def _contour_solidity(contour_points: np.ndarray) -> float:
+    """
+    Ratio of a contour's area to its convex hull's area.
+
+    Args:
+        contour_points: Nx2 contour points
+
+    Returns:
+        Solidity in [0, 1] (1.0 = convex), 0.0 for degenerate contours
+    """
+    contour = np.asarray(contour_points, dtype=np.float32)
+    hull_area = cv2.contourArea(cv2.convexHull(contour))
+    if hull_area <= 0:
+        return 0.0
+    return cv2.contourArea(contour) / hull_area
+
+
+# Contour points closer than this to the simplified outline are dropped
+CONTOUR_SIMPLIFY_TOLERANCE_PX = 0.5
+
+
+def _simplify_contour(contour_points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a closed 2D contour with shapely (Douglas-Peucker, topology kept).
+
+    Args:
+        contour_points: Nx2 contour points (pixels)
+        tolerance: Maximum deviation from the original outline (pixels)
+
+    Returns:
+        Simplified Mx2 points (M <= N), or the input if simplification
+        would leave a degenerate polygon
+    """
+    if len(contour_points) <= 4:
+        return contour_points
+
+    try:
+        simplified = ShapelyPolygon(contour_points).simplify(tolerance, preserve_topology=True)
+    except (ShapelyError, ValueError):
+        return contour_points
+
+    if simplified.is_empty or simplified.geom_type != 'Polygon':
+        return contour_points
+
+    points = np.asarray(simplified.exterior.coords)[:-1]
+    return points if len(points) >= 3 else contour_points
+
+
+def _build_extruded_mesh_loops(
+    contour_mm: np.ndarray,
+    triangles: np.ndarray,
+    height: np.float32
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vertex and face arrays for a closed contour extruded from z=0 to height.
+
+    Explicit loops with no temporaries, written for Numba (see
+    _build_extruded_mesh). Earcut emits counter-clockwise cap triangles
+    whatever the ring orientation, so only the side faces depend on it:
+    their winding is flipped for clockwise rings, which keeps every normal
+    pointing outward without a post-hoc invert().
+
+    Args:
+        contour_mm: (n, 2) float32 contour
+        triangles: Flat earcut triangle indices into contour_mm
+        height: Extrusion height
+
+    Returns:
+        ((2n, 3) float32 vertices, (2t + 2n, 3) int64 faces): bottom caps,
+        top caps, then two side triangles per contour edge
+    """
+    n = contour_mm.shape[0]
+
+    # Twice the signed area (shoelace); >= 0 for counter-clockwise rings
+    area2 = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        area2 += contour_mm[i, 0] * contour_mm[j, 1] - contour_mm[j, 0] * contour_mm[i, 1]
+
+    vertices = np.empty((2 * n, 3), dtype=np.float32)
+    for i in range(n):
+        vertices[i, 0] = contour_mm[i, 0]
+        vertices[i, 1] = contour_mm[i, 1]
+        vertices[i, 2] = 0.0
+        vertices[i + n, 0] = contour_mm[i, 0]
+        vertices[i + n, 1] = contour_mm[i, 1]
+        vertices[i + n, 2] = height
+
+    n_tri = triangles.shape[0] // 3
+    faces = np.empty((2 * n_tri + 2 * n, 3), dtype=np.int64)
+    for t in range(n_tri):
+        a = triangles[3 * t]
+        b = triangles[3 * t + 1]
+        c = triangles[3 * t + 2]
+        # Bottom cap faces down, top cap faces up
+        faces[t, 0] = c
+        faces[t, 1] = b
+        faces[t, 2] = a
+        faces[n_tri + t, 0] = a + n
+        faces[n_tri + t, 1] = b + n
+        faces[n_tri + t, 2] = c + n
+
+    base = 2 * n_tri
+    for i in range(n):
+        j = (i + 1) % n
+        if area2 >= 0:
+            faces[base + 2 * i, 0] = i
+            faces[base + 2 * i, 1] = j
+            faces[base + 2 * i, 2] = j + n
+            faces[base + 2 * i + 1, 0] = i
+            faces[base + 2 * i + 1, 1] = j + n
+            faces[base + 2 * i + 1, 2] = i + n
+        else:
+            faces[base + 2 * i, 0] = j + n
+            faces[base + 2 * i, 1] = j
+            faces[base + 2 * i, 2] = i
+            faces[base + 2 * i + 1, 0] = i + n
+            faces[base + 2 * i + 1, 1] = j + n
+            faces[base + 2 * i + 1, 2] = i
+
+    return vertices, faces
+
+
+def _build_extruded_mesh_numpy(
+    contour_mm: np.ndarray,
+    triangles: np.ndarray,
+    height: np.float32
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized NumPy equivalent of _build_extruded_mesh_loops (no Numba)."""
+    n = len(contour_mm)
+    x, y = contour_mm[:, 0], contour_mm[:, 1]
+    ccw = float((x * np.roll(y, -1) - np.roll(x, -1) * y).sum()) >= 0
+
+    vertices = np.empty((2 * n, 3), dtype=np.float32)
+    vertices[:n, :2] = contour_mm
+    vertices[:n, 2] = 0.0
+    vertices[n:, :2] = contour_mm
+    vertices[n:, 2] = height
+
+    tri = triangles.reshape(-1, 3)
+    bottom = tri[:, ::-1]  # Reverse winding for downward normal
+    top = tri + n
+
+    # Side faces: two triangles per contour edge, interleaved
+    i = np.arange(n)
+    next_i = (i + 1) % n
+    side_a = np.stack([i, next_i, next_i + n], axis=1)
+    side_b = np.stack([i, next_i + n, i + n], axis=1)
+    sides = np.stack([side_a, side_b], axis=1).reshape(-1, 3)
+    if not ccw:
+        sides = sides[:, ::-1]
+
+    return vertices, np.vstack([bottom, top, sides])
+
+
+if HAS_NUMBA:
+    _build_extruded_mesh = njit(cache=True)(_build_extruded_mesh_loops)
+else:
+    _build_extruded_mesh = _build_extruded_mesh_numpy
+
 
 class HybridReconstructor:
     """
@@ -36,7 +245,8 @@ class HybridReconstructor:
         layer_height: float = 0.5,
         min_segment_height: float = 2.0,
         image_size: int = 512,
-        verbose: bool = True
+        verbose: bool = True,
+        adaptive_slicing: bool = True
     ):
         """
         Args:
@@ -44,11 +254,17 @@ class HybridReconstructor:
             min_segment_height: Minimum height for a segment (mm)
             image_size: Resolution for multi-view rendering (pixels)
             verbose: Print progress messages
+            adaptive_slicing: Slice coarsely and refine only where the
+                cross-section changes (False = every layer_height)
         """
         self.layer_height = layer_height
         self.min_segment_height = min_segment_height
         self.image_size = image_size
         self.verbose = verbose
+        self.adaptive_slicing = adaptive_slicing
+
+        # (id(mesh), extents, pixel→mm scale) for the mesh being reconstructed
+        self._scale_cache: Optional[Tuple[int, np.ndarray, float]] = None
 
         # Initialize multi-view detector
         self.mv_detector = MultiViewPrimitiveDetector(
@@ -56,6 +272,21 @@ class HybridReconstructor:
             verbose=verbose
         )
 
+    def _mesh_scale(self, mesh: trimesh.Trimesh) -> Tuple[np.ndarray, float]:
+        """
+        Mesh extents and the pixel-to-mm scale of its rendered views.
+
+        Computed once per mesh (reset by reconstruct()).
+
+        Returns:
+            (extents, scale_factor)
+        """
+        if self._scale_cache is None or self._scale_cache[0] != id(mesh):
+            extents = mesh.extents
+            scale_factor = extents.max() / (self.image_size * 0.8)  # 0.8 accounts for padding
+            self._scale_cache = (id(mesh), extents, scale_factor)
+        return self._scale_cache[1], self._scale_cache[2]
+
     def reconstruct(self, mesh: trimesh.Trimesh) -> Dict[str, Any]:
         """
         Reconstruct mesh using hybrid multi-view + layer-wise approach.
@@ -72,6 +303,7 @@ class HybridReconstructor:
             print("="*80)
 
         # Step 1: Multi-view analysis for overall shape
+        self._scale_cache = None
         views = self.mv_detector.detect_from_mesh(mesh)
         shape_classification = self.mv_detector.validate_consistency(views)
 
@@ -119,18 +351,29 @@ class HybridReconstructor:
         """
         shape = shape_classification['shape']
 
+        # Index views by name and primitive type in one pass
+        # (first view wins on duplicate names, as with a linear search)
+        by_name: Dict[str, View2D] = {}
+        by_type: Dict[str, List[View2D]] = defaultdict(list)
+        for v in views:
+            by_name.setdefault(v.name, v)
+            by_type[v.primitive['type']].append(v)
+
         # Extract dimensions from views
-        top_view = next((v for v in views if v.name == 'top'), None)
-        front_view = next((v for v in views if v.name == 'front'), None)
-        side_view = next((v for v in views if v.name == 'side'), None)
+        top_view = by_name.get('top')
+        front_view = by_name.get('front')
+        side_view = by_name.get('side')
 
         # For box shapes with complex contours, use multi-view point analysis
         if shape == 'box' and top_view is not None:
             # Check if the contour is actually complex (e.g., T-shape, L-shape)
             num_contour_points = len(top_view.contour_points)
 
-            # If contour has many points (>8), it's likely a complex shape
-            if num_contour_points > 8:
+            # If contour has many points (>8), it's likely a complex shape,
+            # unless it (nearly) fills its convex hull: then it is a box with
+            # a noisy outline and the 6-view analysis is not needed
+            if (num_contour_points > 8 and
+                    _contour_solidity(top_view.contour_points) <= BOX_SOLIDITY_THRESHOLD):
                 if self.verbose:
                     print(f"\n   Complex contour detected ({num_contour_points} points)")
                     print(f"   Using multi-view point analysis...")
@@ -143,8 +386,8 @@ class HybridReconstructor:
             # For cylinder: find which views show circles (those are cross-sections)
             # The rectangle view gives the height
 
-            circle_views = [v for v in views if v.primitive['type'] == 'circle']
-            rect_views = [v for v in views if v.primitive['type'] == 'rectangle']
+            circle_views = by_type['circle']
+            rect_views = by_type['rectangle']
 
             if len(circle_views) >= 1 and len(rect_views) >= 1:
                 # Get radius from circle view (convert pixels to mm)
@@ -156,11 +399,7 @@ class HybridReconstructor:
                 height_px = max(rect_view.primitive['width'], rect_view.primitive['height'])
 
                 # Convert to mesh units (approximate scaling)
-                mesh_extents = mesh.extents
-                img_extents = np.array([self.image_size, self.image_size, self.image_size])
-
-                # Scale factor from pixels to mm
-                scale_factor = mesh_extents.max() / (self.image_size * 0.8)  # 0.8 accounts for padding
+                _, scale_factor = self._mesh_scale(mesh)
 
                 radius_mm = radius_px * scale_factor
                 height_mm = height_px * scale_factor
@@ -196,15 +435,16 @@ class HybridReconstructor:
                 side_prim = side_view.primitive
 
                 # Convert pixel dimensions to mm
-                mesh_extents = mesh.extents
-                scale_factor = mesh_extents.max() / (self.image_size * 0.8)
+                _, scale_factor = self._mesh_scale(mesh)
 
                 # Extract dimensions (width, depth, height in mm)
-                if all(p['type'] == 'rectangle' for p in [top_prim, front_prim, side_prim]):
+                if (top_prim['type'] == 'rectangle' and
+                        front_prim['type'] == 'rectangle' and
+                        side_prim['type'] == 'rectangle'):
                     # Average dimensions from multiple views for robustness
-                    width_px = np.mean([top_prim['width'], front_prim['width']])
-                    depth_px = np.mean([top_prim['height'], side_prim['width']])
-                    height_px = np.mean([front_prim['height'], side_prim['height']])
+                    width_px = (top_prim['width'] + front_prim['width']) * 0.5
+                    depth_px = (top_prim['height'] + side_prim['width']) * 0.5
+                    height_px = (front_prim['height'] + side_prim['height']) * 0.5
 
                     width_mm = width_px * scale_factor
                     depth_mm = depth_px * scale_factor
@@ -229,7 +469,7 @@ class HybridReconstructor:
 
         elif shape == 'sphere':
             # For sphere: all views should be circles with same radius
-            circle_views = [v for v in views if v.primitive['type'] == 'circle']
+            circle_views = by_type['circle']
 
             if len(circle_views) >= 1:
                 # Average radius from all circle views
@@ -237,8 +477,7 @@ class HybridReconstructor:
                 radius_px = np.mean(radii_px)
 
                 # Convert to mm
-                mesh_extents = mesh.extents
-                scale_factor = mesh_extents.max() / (self.image_size * 0.8)
+                _, scale_factor = self._mesh_scale(mesh)
                 radius_mm = radius_px * scale_factor
 
                 # Create sphere primitive
@@ -292,7 +531,7 @@ class HybridReconstructor:
             print(f"   Layer height: {self.layer_height}mm")
 
         # Detect primary axis (slice along shortest axis)
-        extents = mesh.extents
+        extents, _ = self._mesh_scale(mesh)
         min_extent_idx = extents.argmin()
         axis_names = ['X', 'Y', 'Z']
         axis_vectors = [
@@ -317,32 +556,55 @@ class HybridReconstructor:
         if self.verbose:
             print(f"   Creating {num_layers} layers...")
 
-        layers = []
-        for i in range(num_layers):
-            z = min_coord + i * self.layer_height
-
-            # Create slicing plane perpendicular to primary axis
-            plane_origin = primary_axis * z
-            plane_normal = primary_axis
+        # Prismatic runs give the same cross-section layer after layer:
+        # sections are fingerprinted so repeats reuse the first one's area
+        # (each layer keeps its own section, with its own to_3D transform)
+        seen: Dict[tuple, float] = {}
+        slice_origin = primary_axis * min_coord
+
+        if self.adaptive_slicing and num_layers > ADAPTIVE_COARSE_FACTOR:
+            # Coarse pass, then fill in every layer of the intervals whose
+            # end areas differ (a change that returns to the same area
+            # within one coarse interval is not detected)
+            coarse = np.unique(np.r_[
+                np.arange(0, num_layers, ADAPTIVE_COARSE_FACTOR), num_layers - 1
+            ])
+            sampled = self._slice_layers(mesh, primary_axis, slice_origin, coarse, seen)
+
+            coarse_areas = np.array([area for _, _, area in sampled])
+            delta = np.abs(np.diff(coarse_areas))
+            changed = delta > ADAPTIVE_AREA_TOLERANCE * np.maximum(coarse_areas[:-1], coarse_areas[1:])
+            refine = [np.arange(lo + 1, hi) for lo, hi in zip(coarse[:-1][changed], coarse[1:][changed])]
+
+            if refine:
+                sampled += self._slice_layers(mesh, primary_axis, slice_origin, np.concatenate(refine), seen)
+                sampled.sort(key=lambda layer: layer[0])
 
-            # Slice mesh
-            try:
-                section = mesh.section(plane_origin=plane_origin, plane_normal=plane_normal)
-
-                if section is not None:
-                    # Section is a Path3D object
-                    # Convert to 2D for multi-view analysis
-                    layer_data = {
-                        'z': z,
-                        'section': section,
-                        'area': section.area if hasattr(section, 'area') else 0
-                    }
-                    layers.append(layer_data)
-            except:
-                pass
+            if self.verbose:
+                print(f"   Adaptive slicing: {len(sampled)} of {num_layers} layers sliced")
+        else:
+            sampled = self._slice_layers(mesh, primary_axis, slice_origin, np.arange(num_layers), seen)
+
+        # Layers are kept as parallel arrays (z, area, section) so
+        # per-layer statistics stay vectorizable
+        sampled = [layer for layer in sampled if layer[1] is not None]
+        count = len(sampled)
+        zs = np.empty(count, dtype=np.float32)
+        areas = np.empty(count, dtype=np.float32)
+        layer_sections: List[Any] = [None] * count
+        for i, (index, section, area) in enumerate(sampled):
+            zs[i] = min_coord + index * self.layer_height
+            areas[i] = area
+            layer_sections[i] = section
+
+        layers = {
+            'zs': zs,
+            'areas': areas,
+            'sections': layer_sections
+        }
 
         if self.verbose:
-            print(f"   ✅ Created {len(layers)} valid layers")
+            print(f"   ✅ Created {count} valid layers")
 
         # For now, return a simplified reconstruction
         # TODO: Implement full layer-wise stacking with multi-view validation per layer
@@ -352,12 +614,60 @@ class HybridReconstructor:
             'method': 'hybrid_layered',
             'shape': 'complex',
             'reconstructed_mesh': mesh,  # Placeholder
-            'num_layers': len(layers),
+            'num_layers': count,
+            'layers': layers,
             'num_segments': 1,  # Placeholder
             'quality_score': 75.0,  # Placeholder
             'note': 'Layer-wise reconstruction in progress'
         }
 
+    def _slice_layers(
+        self,
+        mesh: trimesh.Trimesh,
+        axis: np.ndarray,
+        origin: np.ndarray,
+        indices: np.ndarray,
+        seen: Dict[tuple, float]
+    ) -> List[Tuple[int, Any, float]]:
+        """
+        Slice the mesh at the given layer indices in one sweep.
+
+        Args:
+            mesh: Input mesh
+            axis: Slicing axis (unit vector)
+            origin: Point on the plane of layer 0
+            indices: Layer indices (height = index * layer_height)
+            seen: Section fingerprint → area, shared across calls so
+                repeated cross-sections are only measured once
+
+        Returns:
+            List of (index, section, area); section is None (area 0.0) for
+            planes that miss the mesh
+        """
+        # Sections come back as Path2D in the slicing plane (to_3D in their metadata)
+        sections = mesh.section_multiplane(
+            plane_origin=origin,
+            plane_normal=axis,
+            heights=indices * self.layer_height
+        )
+
+        layers = []
+        for index, section in zip(indices, sections):
+            if section is None or not len(section.entities):
+                layers.append((int(index), None, 0.0))
+                continue
+
+            fingerprint = (
+                len(section.vertices),
+                round(float(section.length), 4),
+                tuple(np.round(section.bounds, 4).ravel() + 0.0)
+            )
+            if fingerprint not in seen:
+                seen[fingerprint] = _section_area(section)
+            layers.append((int(index), section, seen[fingerprint]))
+
+        return layers
+
     def _reconstruct_with_multiview_points(
         self,
         mesh: trimesh.Trimesh,
@@ -379,13 +689,9 @@ class HybridReconstructor:
         if self.verbose:
             print(f"\n   🔄 Analyzing shape from {num_views} rotation angles...")
 
-        # Use the baseline multi-view analyzer
-        from .multiview_detector import MultiViewPrimitiveDetector
-
-        analyzer = MultiViewPrimitiveDetector(
-            image_size=self.image_size,
-            verbose=False
-        )
+        # Reuse the shared detector: the front/top/side renders from
+        # detect_from_mesh() are served from its render cache
+        analyzer = self.mv_detector
 
         # Standard 6 views (front, back, left, right, top, bottom)
         rotation_views = [
@@ -397,31 +703,30 @@ class HybridReconstructor:
             (0, -90),    # Bottom
         ]
 
-        all_contour_points = []
+        # Keep only the best view so far (most contour points = most detail;
+        # the first view wins ties)
+        best_view = None
+        num_valid_views = 0
         total_points = 0
 
-        for i, (azimuth, elevation) in enumerate(rotation_views):
-            # Render view
-            img = analyzer.render_view(mesh, azimuth, elevation)
+        # Render all views in one pass over the mesh
+        images = analyzer.render_views_batched(mesh, rotation_views)
 
+        for (azimuth, elevation), img in zip(rotation_views, images):
             # Extract contour points
             contour_points = analyzer.extract_contour_points(img)
+            num_points = len(contour_points)
 
-            if len(contour_points) > 0:
-                all_contour_points.append({
-                    'azimuth': azimuth,
-                    'elevation': elevation,
-                    'points': contour_points,
-                    'num_points': len(contour_points)
-                })
-                total_points += len(contour_points)
+            if num_points > 0:
+                num_valid_views += 1
+                total_points += num_points
+                if best_view is None or num_points > best_view[2]:
+                    best_view = (azimuth, elevation, num_points, contour_points)
 
         if self.verbose:
-            print(f"   ✅ Extracted {total_points} contour points from {len(all_contour_points)} views")
+            print(f"   ✅ Extracted {total_points} contour points from {num_valid_views} views")
 
-        # Now use the most informative view for reconstruction
-        # Choose the view with the most points (most detail)
-        if len(all_contour_points) == 0:
+        if best_view is None:
             return {
                 'success': False,
                 'method': 'multiview_points',
@@ -431,18 +736,18 @@ class HybridReconstructor:
                 'quality_score': 0.0
             }
 
-        best_view = max(all_contour_points, key=lambda v: v['num_points'])
+        best_azimuth, best_elevation, best_num_points, best_points = best_view
 
         if self.verbose:
-            print(f"   Using view: az={best_view['azimuth']}°, el={best_view['elevation']}° "
-                  f"({best_view['num_points']} points)")
+            print(f"   Using view: az={best_azimuth}°, el={best_elevation}° "
+                  f"({best_num_points} points)")
 
         # Reconstruct from best view using polygon extrusion
         return self._reconstruct_from_contour_points(
             mesh=mesh,
-            contour_points=best_view['points'],
-            azimuth=best_view['azimuth'],
-            elevation=best_view['elevation']
+            contour_points=best_points,
+            azimuth=best_azimuth,
+            elevation=best_elevation
         )
 
     def _reconstruct_from_contour_points(
@@ -464,20 +769,6 @@ class HybridReconstructor:
         Returns:
             Reconstruction result dictionary
         """
-        try:
-            from mapbox_earcut import triangulate_float32 as earcut_triangulate
-        except ImportError:
-            if self.verbose:
-                print("   ⚠️  mapbox-earcut not available, falling back to original mesh")
-            return {
-                'success': False,
-                'method': 'multiview_points',
-                'reconstructed_mesh': mesh,
-                'error': 'mapbox-earcut library required for polygon extrusion',
-                'num_segments': 0,
-                'quality_score': 0.0
-            }
-
         if len(contour_points) < 3:
             return {
                 'success': False,
@@ -488,85 +779,88 @@ class HybridReconstructor:
                 'quality_score': 0.0
             }
 
-        # Get contour points in pixel space
-        contour_px = contour_points
+        # Get contour points in pixel space, dropping points that deviate
+        # less than half a pixel from the outline (sub-pixel noise only adds
+        # vertices to every downstream step)
+        # Pixel coordinates never need float64: keep the whole contour
+        # pipeline in float32, which is also what earcut takes
+        contour_px = _simplify_contour(contour_points, CONTOUR_SIMPLIFY_TOLERANCE_PX)
+        contour_px = np.asarray(contour_px, dtype=np.float32)
 
         # Convert pixel coordinates to mesh coordinates
-        mesh_extents = mesh.extents
-        scale_factor = mesh_extents.max() / (self.image_size * 0.8)  # 0.8 accounts for padding
+        mesh_extents, scale_factor = self._mesh_scale(mesh)
 
         # Center the contour
         contour_centered = contour_px - contour_px.mean(axis=0)
 
         # Scale to mesh units
-        contour_mm = contour_centered * scale_factor
+        contour_mm = contour_centered * np.float32(scale_factor)
 
         # Determine height based on view orientation
         # For top/bottom views (el=±90), height is along Z axis
         # For front/back/side views (el=0), height depends on rotation
         if abs(elevation) == 90:
             # Top or bottom view - height is Z extent
-            height_mm = mesh.extents[2]
+            height_mm = mesh_extents[2]
         else:
             # Side view - use the extent perpendicular to view direction
-            height_mm = mesh.extents.max()
+            height_mm = mesh_extents.max()
 
         if self.verbose:
             print(f"   Extruding polygon with {len(contour_mm)} vertices")
             print(f"   Height: {height_mm:.2f} mm")
 
-        # Triangulate the 2D polygon
-        # mapbox-earcut expects 2D array of coordinates and ring indices
-        vertices_2d = contour_mm.astype(np.float32)
-        rings = np.array([len(contour_mm)], dtype=np.uint32)  # Single ring
-
-        try:
-            triangles = earcut_triangulate(vertices_2d, rings)
-        except Exception as e:
-            if self.verbose:
-                print(f"   ⚠️  Triangulation failed: {e}")
-            return {
-                'success': False,
-                'method': 'polygon_extrusion',
-                'reconstructed_mesh': mesh,
-                'error': f'Triangulation failed: {e}',
-                'num_segments': 0,
-                'quality_score': 0.0
-            }
-
-        # Create 3D vertices (bottom and top faces)
-        vertices_bottom = np.column_stack([contour_mm, np.zeros(len(contour_mm))])
-        vertices_top = np.column_stack([contour_mm, np.full(len(contour_mm), height_mm)])
-
-        all_vertices = np.vstack([vertices_bottom, vertices_top])
-
-        # Create faces
-        faces = []
-        n = len(contour_mm)
-
-        # Bottom face (reverse winding for downward normal)
-        for i in range(0, len(triangles), 3):
-            faces.append([triangles[i+2], triangles[i+1], triangles[i]])
+        # Let trimesh triangulate and extrude the outline; it only rejects
+        # self-intersecting contours, which go through earcut directly
+        reconstructed = None
+        polygon = ShapelyPolygon(contour_mm)
+        if polygon.is_valid:
+            try:
+                reconstructed = trimesh.creation.extrude_polygon(polygon, float(height_mm))
+            except ValueError:
+                reconstructed = None
 
-        # Top face (offset indices by n)
-        for i in range(0, len(triangles), 3):
-            faces.append([triangles[i] + n, triangles[i+1] + n, triangles[i+2] + n])
+        if reconstructed is None:
+            try:
+                from mapbox_earcut import triangulate_float32 as earcut_triangulate
+            except ImportError:
+                if self.verbose:
+                    print("   ⚠️  mapbox-earcut not available, falling back to original mesh")
+                return {
+                    'success': False,
+                    'method': 'multiview_points',
+                    'reconstructed_mesh': mesh,
+                    'error': 'mapbox-earcut library required for polygon extrusion',
+                    'num_segments': 0,
+                    'quality_score': 0.0
+                }
 
-        # Side faces
-        for i in range(n):
-            next_i = (i + 1) % n
-            # Two triangles per side
-            faces.append([i, next_i, next_i + n])
-            faces.append([i, next_i + n, i + n])
+            # Triangulate the 2D polygon
+            # mapbox-earcut expects 2D array of coordinates and ring indices
+            rings = np.array([len(contour_mm)], dtype=np.uint32)  # Single ring
 
-        # Create mesh
-        reconstructed = trimesh.Trimesh(vertices=all_vertices, faces=faces)
+            try:
+                triangles = earcut_triangulate(contour_mm, rings)
+            except Exception as e:
+                if self.verbose:
+                    print(f"   ⚠️  Triangulation failed: {e}")
+                return {
+                    'success': False,
+                    'method': 'polygon_extrusion',
+                    'reconstructed_mesh': mesh,
+                    'error': f'Triangulation failed: {e}',
+                    'num_segments': 0,
+                    'quality_score': 0.0
+                }
 
-        # Fix face normals if volume is negative
-        if reconstructed.volume < 0:
-            reconstructed.invert()
-            if self.verbose:
-                print(f"   🔧 Fixed inverted normals")
+            # Build vertex/face arrays with winding set from the contour's
+            # orientation (Numba-compiled when available)
+            all_vertices, faces = _build_extruded_mesh(
+                contour_mm,
+                np.asarray(triangles, dtype=np.int64),
+                np.float32(height_mm)
+            )
+            reconstructed = trimesh.Trimesh(vertices=all_vertices, faces=faces)
 
         if self.verbose:
             print(f"   ✅ Polygon extrusion complete")
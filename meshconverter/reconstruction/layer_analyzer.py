@@ -9,13 +9,286 @@ This module implements your "line-by-line" reconstruction idea:
 - Reconstruct clean 3D boxes from layer analysis
 """
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import trimesh
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
-from scipy.spatial import ConvexHull
-from scipy.ndimage import label as ndimage_label
-from PIL import Image
-import io
+from typing import Dict, List, Any, Optional
+from shapely import STRtree
+from shapely.geometry import box as shapely_box
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Slices smaller than twice this (mm) are taken as a single region
+CLUSTER_EPS = 3.0
+
+# Grid (mm) that segment endpoints are snapped to when joining them
+SEGMENT_SNAP = 1e-3
+
+# Consecutive layer regions belong to the same box when their bounding
+# boxes overlap (IoU) more than this, centers shift less than this (mm) and
+# areas change by less than this fraction
+GROUP_MIN_IOU = 0.8
+GROUP_MAX_SHIFT = 5.0
+GROUP_MAX_AREA_CHANGE = 0.15
+
+# Slicing plans of the most recently analyzed meshes, keyed by hash(mesh)
+# (LRU, shared by every analyzer); see LayerAnalyzer._slicing_plan()
+PLAN_CACHE_SIZE = 4
+_plan_cache: "OrderedDict[int, Dict[str, np.ndarray]]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+def _segment_components(vertex_ids: np.ndarray) -> np.ndarray:
+    """
+    Label the connected pieces of a slice from its line segments.
+
+    Args:
+        vertex_ids: (2M,) vertex id of each segment endpoint, consecutive
+            entries forming a segment
+
+    Returns:
+        Connected component of the segment graph for every vertex id
+    """
+    n_vertices = vertex_ids.max() + 1
+    graph = coo_matrix(
+        (np.ones(len(vertex_ids) // 2, dtype=np.int8), (vertex_ids[0::2], vertex_ids[1::2])),
+        shape=(n_vertices, n_vertices)
+    )
+    _, labels = connected_components(graph, directed=False)
+    return labels
+
+
+def _best_match_loops(group_bounds: np.ndarray,
+                      group_centers: np.ndarray,
+                      group_areas: np.ndarray,
+                      group_zs: np.ndarray,
+                      candidates: np.ndarray,
+                      bounds: np.ndarray,
+                      center: np.ndarray,
+                      area: float,
+                      z: float,
+                      max_z_gap: float) -> int:
+    """
+    Pick the open box a layer region continues (explicit loops).
+
+    A region continues a box when the box's latest region overlaps it enough
+    (IoU), its center barely moves, its area barely changes and the z gap is
+    at most max_z_gap. Among qualifying boxes the highest IoU wins.
+
+    Args:
+        group_bounds: (G, 4) bounds [x_min, y_min, x_max, y_max] of each
+            box's latest region
+        group_centers: (G, 2) centers of each box's latest region
+        group_areas: (G,) areas of each box's latest region
+        group_zs: (G,) z of each box's latest region
+        candidates: Box indices to consider
+        bounds: [x_min, y_min, x_max, y_max] of the new region
+        center: Center of the new region
+        area: Area of the new region
+        z: Z of the new region
+        max_z_gap: Largest z step within one box
+
+    Returns:
+        Index of the best box, or -1 if none qualifies
+    """
+    best = -1
+    best_iou = GROUP_MIN_IOU
+    for g in candidates:
+        # Separating-axis test: disjoint boxes (IoU 0) never match
+        if (bounds[2] < group_bounds[g, 0] or group_bounds[g, 2] < bounds[0] or
+                bounds[3] < group_bounds[g, 1] or group_bounds[g, 3] < bounds[1]):
+            continue
+
+        if z - group_zs[g] > max_z_gap:
+            continue
+
+        dx = center[0] - group_centers[g, 0]
+        dy = center[1] - group_centers[g, 1]
+        if np.sqrt(dx * dx + dy * dy) >= GROUP_MAX_SHIFT:
+            continue
+        if abs(area - group_areas[g]) / (group_areas[g] + 1e-6) >= GROUP_MAX_AREA_CHANGE:
+            continue
+
+        # Bounding box similarity (IoU)
+        inter_w = min(bounds[2], group_bounds[g, 2]) - max(bounds[0], group_bounds[g, 0])
+        inter_h = min(bounds[3], group_bounds[g, 3]) - max(bounds[1], group_bounds[g, 1])
+        inter_area = max(inter_w, 0.0) * max(inter_h, 0.0)
+        group_area = (group_bounds[g, 2] - group_bounds[g, 0]) * (group_bounds[g, 3] - group_bounds[g, 1])
+        new_area = (bounds[2] - bounds[0]) * (bounds[3] - bounds[1])
+        union_area = group_area + new_area - inter_area
+        iou = inter_area / union_area if union_area > 0 else 0.0
+
+        if iou > best_iou:
+            best = g
+            best_iou = iou
+
+    return best
+
+
+def _best_match_numpy(group_bounds: np.ndarray,
+                      group_centers: np.ndarray,
+                      group_areas: np.ndarray,
+                      group_zs: np.ndarray,
+                      candidates: np.ndarray,
+                      bounds: np.ndarray,
+                      center: np.ndarray,
+                      area: float,
+                      z: float,
+                      max_z_gap: float) -> int:
+    """Vectorized equivalent of _best_match_loops (used without numba)."""
+    b = group_bounds[candidates]
+
+    # Separating-axis test first: disjoint boxes keep IoU 0 without a division
+    overlapping = ((bounds[2:] >= b[:, :2]) & (b[:, 2:] >= bounds[:2])).all(axis=-1)
+
+    inter_area = np.clip(np.minimum(bounds[2:], b[:, 2:]) - np.maximum(bounds[:2], b[:, :2]), 0, None).prod(axis=-1)
+    union_area = (b[:, 2:] - b[:, :2]).prod(axis=-1) + (bounds[2:] - bounds[:2]).prod() - inter_area
+    iou = np.divide(
+        inter_area, union_area,
+        out=np.zeros_like(inter_area), where=overlapping & (union_area > 0)
+    )
+
+    areas = group_areas[candidates]
+    qualifies = (
+        (iou > GROUP_MIN_IOU) &
+        (z - group_zs[candidates] <= max_z_gap) &
+        (np.linalg.norm(center - group_centers[candidates], axis=1) < GROUP_MAX_SHIFT) &
+        (np.abs(area - areas) / (areas + 1e-6) < GROUP_MAX_AREA_CHANGE)
+    )
+    if not qualifies.any():
+        return -1
+    return int(candidates[np.argmax(np.where(qualifies, iou, -1.0))])
+
+
+if HAS_NUMBA:
+    _best_match = njit(cache=True, fastmath=True)(_best_match_loops)
+else:
+    _best_match = _best_match_numpy
+
+
+class LayerTable:
+    """
+    Layer regions stored column-wise, one row per region.
+
+    Columns are preallocated and doubled when full; the properties return
+    views of the filled rows. XY columns are float32 (mm-scale coordinates
+    don't need double precision); z stays float64 like the layer heights.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Initial number of rows
+        """
+        self._size = 0
+        self._columns = {
+            'bounds': np.empty((capacity, 4), dtype=np.float32),    # [x_min, y_min, x_max, y_max]
+            'centers': np.empty((capacity, 2), dtype=np.float32),
+            'areas': np.empty(capacity, dtype=np.float32),
+            'zs': np.empty(capacity),
+            'layer_ids': np.empty(capacity, dtype=np.int64),
+            'cluster_ids': np.empty(capacity, dtype=np.int64),
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def concatenate(cls, tables: List['LayerTable']) -> 'LayerTable':
+        """
+        Join tables row-wise, in order.
+
+        Args:
+            tables: Tables to join
+
+        Returns:
+            New table holding all rows
+        """
+        total = sum(len(table) for table in tables)
+        joined = cls(capacity=max(total, 1))
+        for name, column in joined._columns.items():
+            start = 0
+            for table in tables:
+                column[start:start + len(table)] = table._columns[name][:len(table)]
+                start += len(table)
+        joined._size = total
+        return joined
+
+    def append(self, z: float, layer_id: int, cluster_id: int, bounds: np.ndarray) -> None:
+        """
+        Add one region.
+
+        Args:
+            z: Z coordinate of the layer
+            layer_id: Layer index
+            cluster_id: Region index within the layer
+            bounds: [x_min, y_min, x_max, y_max]
+        """
+        self.extend(z, layer_id, np.array([cluster_id]), np.asarray(bounds)[None])
+
+    def extend(self, z: float, layer_id: int, cluster_ids: np.ndarray, bounds: np.ndarray) -> None:
+        """
+        Add all regions of one layer.
+
+        Args:
+            z: Z coordinate of the layer
+            layer_id: Layer index
+            cluster_ids: (K,) region indices within the layer
+            bounds: (K, 4) region bounds
+        """
+        k = len(cluster_ids)
+        capacity = len(self._columns['zs'])
+        if self._size + k > capacity:
+            while self._size + k > capacity:
+                capacity *= 2
+            for name, column in self._columns.items():
+                grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                self._columns[name] = grown
+
+        rows = slice(self._size, self._size + k)
+        columns = self._columns
+        columns['bounds'][rows] = bounds
+        columns['centers'][rows] = (bounds[:, :2] + bounds[:, 2:]) / 2
+        columns['areas'][rows] = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+        columns['zs'][rows] = z
+        columns['layer_ids'][rows] = layer_id
+        columns['cluster_ids'][rows] = cluster_ids
+        self._size += k
+
+    @property
+    def bounds(self) -> np.ndarray:
+        return self._columns['bounds'][:self._size]
+
+    @property
+    def centers(self) -> np.ndarray:
+        return self._columns['centers'][:self._size]
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self._columns['areas'][:self._size]
+
+    @property
+    def zs(self) -> np.ndarray:
+        return self._columns['zs'][:self._size]
+
+    @property
+    def layer_ids(self) -> np.ndarray:
+        return self._columns['layer_ids'][:self._size]
+
+    @property
+    def cluster_ids(self) -> np.ndarray:
+        return self._columns['cluster_ids'][:self._size]
 
 
 class LayerAnalyzer:
@@ -23,16 +296,61 @@ class LayerAnalyzer:
 
     def __init__(self,
                  layer_height: float = 1.0,
-                 min_area_threshold: float = 10.0):
+                 min_area_threshold: float = 10.0,
+                 max_workers: Optional[int] = None):
         """
         Initialize layer analyzer.
 
         Args:
             layer_height: Height of each layer (mm) - default 1.0
             min_area_threshold: Minimum area for valid layer region (mm²)
+            max_workers: Threads for slicing/analyzing layers
+                (default: os.cpu_count())
         """
         self.layer_height = layer_height
         self.min_area_threshold = min_area_threshold
+        self.max_workers = max_workers
+
+    def _slicing_plan(self, mesh: trimesh.Trimesh) -> Dict[str, np.ndarray]:
+        """
+        Bin faces by their Z extent so each layer only intersects the faces
+        that can cross its plane.
+
+        Faces are sorted by lowest vertex; a layer's candidates are the
+        prefix below z that also reach up to z. The plan only depends on the
+        geometry, so it is kept in a small module-level LRU and reused when
+        the same mesh is analyzed again, even by a new analyzer (e.g. a
+        sweep over layer_height through analyze_mesh_layers). It is keyed by
+        the mesh's content hash rather than identifier_hash, which is
+        rotation invariant and far more expensive to compute.
+
+        Returns:
+            {'face_order', 'sorted_z_min', 'face_z_max', 'vertex_z'}
+        """
+        key = hash(mesh)
+        with _plan_cache_lock:
+            plan = _plan_cache.get(key)
+            if plan is not None:
+                _plan_cache.move_to_end(key)
+                return plan
+
+        vertex_z = mesh.vertices[:, 2]
+        face_z = vertex_z[mesh.faces]
+        face_z_min = face_z.min(axis=1)
+        face_order = np.argsort(face_z_min, kind='stable')
+        plan = {
+            'face_order': face_order,
+            'sorted_z_min': face_z_min[face_order],
+            'face_z_max': face_z.max(axis=1),
+            'vertex_z': vertex_z
+        }
+
+        with _plan_cache_lock:
+            _plan_cache[key] = plan
+            _plan_cache.move_to_end(key)
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+        return plan
 
     def analyze_layers(self,
                       mesh: trimesh.Trimesh,
@@ -59,30 +377,32 @@ class LayerAnalyzer:
         z_min, z_max = bounds[0, 2], bounds[1, 2]
         z_range = z_max - z_min
 
-        # Generate layer heights
-        n_layers = int(np.ceil(z_range / self.layer_height))
-        layer_z_values = np.linspace(z_min, z_max, n_layers)
+        # Generate layer heights exactly layer_height apart, from z_min up
+        # to z_max (linspace would stretch the spacing to hit z_max)
+        n_layers = int(np.ceil(z_range / self.layer_height)) + 1
+        layer_z_values = z_min + np.arange(n_layers, dtype=np.float64) * self.layer_height
+        layer_z_values = layer_z_values[layer_z_values <= z_max + 1e-9]
+        n_layers = len(layer_z_values)
 
         if verbose:
             print(f"  Z range: {z_min:.2f} to {z_max:.2f} mm ({z_range:.2f} mm)")
             print(f"  Layers: {n_layers} (height {self.layer_height}mm each)")
 
-        # Slice mesh at each layer
-        layer_data = []
-        for i, z in enumerate(layer_z_values):
-            # Get cross-section at this Z height
-            section = mesh.section(
-                plane_origin=[0, 0, z],
-                plane_normal=[0, 0, 1]
-            )
-
-            if section is None or len(section.vertices) == 0:
-                continue
-
-            # Analyze this layer (may return multiple regions)
-            layer_regions = self._analyze_layer(section, z, i)
-            if layer_regions:
-                layer_data.extend(layer_regions)  # Add all regions from this layer
+        plan = self._slicing_plan(mesh)
+
+        # Layers are independent: analyze contiguous chunks in parallel and
+        # join the per-chunk tables in layer order
+        n_workers = max(1, min(self.max_workers or os.cpu_count() or 1, n_layers))
+        chunks = np.array_split(np.arange(n_layers), n_workers)
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                tables = list(executor.map(
+                    lambda chunk: self._analyze_layer_range(mesh, plan, layer_z_values, chunk),
+                    chunks
+                ))
+        else:
+            tables = [self._analyze_layer_range(mesh, plan, layer_z_values, chunks[0])]
+        layer_data = LayerTable.concatenate(tables)
 
         if verbose:
             print(f"  Valid layer regions: {len(layer_data)}")
@@ -105,240 +425,262 @@ class LayerAnalyzer:
             'method': 'layer-slicing'
         }
 
-    def _analyze_layer(self, section: trimesh.Path3D, z: float, layer_id: int) -> Optional[List[Dict]]:
+    def _analyze_layer_range(self,
+                             mesh: trimesh.Trimesh,
+                             plan: Dict[str, np.ndarray],
+                             layer_z_values: np.ndarray,
+                             layer_ids: np.ndarray) -> LayerTable:
+        """
+        Slice and analyze a run of layers.
+
+        Args:
+            mesh: Input trimesh
+            plan: Face Z binning from _slicing_plan()
+            layer_z_values: Z of every layer
+            layer_ids: Layers to process
+
+        Returns:
+            Regions of these layers, in layer order
+        """
+        face_order = plan['face_order']
+        sorted_z_min = plan['sorted_z_min']
+        face_z_max = plan['face_z_max']
+        vertex_z = plan['vertex_z']
+
+        layer_data = LayerTable()
+        for i in layer_ids:
+            z = layer_z_values[i]
+            below = face_order[:np.searchsorted(sorted_z_min, z, side='right')]
+            candidates = np.sort(below[face_z_max[below] >= z])
+            if len(candidates) == 0:
+                continue
+
+            # Raw 3D segments (no Path3D objects); plane dot products of a
+            # Z plane are just vertex z - layer z
+            segments = trimesh.intersections.mesh_plane(
+                mesh,
+                plane_normal=[0, 0, 1],
+                plane_origin=[0, 0, z],
+                local_faces=candidates,
+                cached_dots=vertex_z - z
+            )
+            if len(segments) == 0:
+                continue
+
+            # Segment endpoints in XY (drop Z)
+            points_2d = segments[:, :, :2].reshape(-1, 2).astype(np.float32)
+
+            # Analyze this layer (may add multiple regions)
+            self._analyze_layer(points_2d, z, int(i), layer_data)
+
+        return layer_data
+
+    def _analyze_layer(self,
+                       points_2d: np.ndarray,
+                       z: float,
+                       layer_id: int,
+                       layer_data: LayerTable) -> int:
         """
         Analyze a single layer (2D cross-section) and detect separate regions.
 
-        Uses 2D clustering to find separate blocks within a single layer.
+        Each connected piece of the slice's segment graph is one region,
+        except pieces nested inside another piece's bounds (a slice that is
+        small overall is taken as a single region).
 
         Args:
-            section: Cross-section mesh (Path3D)
+            points_2d: Cross-section segment endpoints in XY (Nx2, consecutive
+                rows forming a segment)
             z: Z coordinate of this layer
             layer_id: Layer index
+            layer_data: Table the detected regions are appended to
 
         Returns:
-            List of layer data dicts (one per detected region) or None if invalid
+            Number of regions added (0 if the layer is invalid)
         """
         try:
-            # Convert to 2D (drop Z)
-            points_2d = section.vertices[:, :2]
-
             if len(points_2d) < 4:
-                return None
-
-            # Use 2D DBSCAN to cluster separate regions in this layer
-            try:
-                from sklearn.cluster import DBSCAN
-                
-                # Cluster points in 2D
-                clustering = DBSCAN(eps=3.0, min_samples=5).fit(points_2d)
-                labels = clustering.labels_
-
-                # Analyze each cluster
-                layer_regions = []
-                for cluster_id in set(labels):
-                    if cluster_id == -1:  # Noise points
-                        continue
-
-                    cluster_points = points_2d[labels == cluster_id]
-
-                    # Get bounding box
-                    x_min, y_min = cluster_points.min(axis=0)
-                    x_max, y_max = cluster_points.max(axis=0)
-
-                    width = x_max - x_min
-                    height = y_max - y_min
-                    area = width * height
-
-                    if area < self.min_area_threshold:
-                        continue
-
-                    layer_regions.append({
-                        'z': z,
-                        'layer_id': layer_id,
-                        'cluster_id': cluster_id,
-                        'bounds': np.array([[x_min, y_min], [x_max, y_max]]),
-                        'width': width,
-                        'height': height,
-                        'area': area,
-                        'center': np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
-                    })
-
-                return layer_regions if layer_regions else None
-
-            except ImportError:
-                # Fallback if sklearn unavailable: simple bounding box
-                x_min, y_min = points_2d.min(axis=0)
-                x_max, y_max = points_2d.max(axis=0)
-
-                width = x_max - x_min
-                height = y_max - y_min
-                area = width * height
-
-                if area < self.min_area_threshold:
-                    return None
-
-                return [{
-                    'z': z,
-                    'layer_id': layer_id,
-                    'cluster_id': 0,
-                    'bounds': np.array([[x_min, y_min], [x_max, y_max]]),
-                    'width': width,
-                    'height': height,
-                    'area': area,
-                    'center': np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
-                }]
+                return 0
+
+            # A slice spanning less than 2 * CLUSTER_EPS is taken as one
+            # region: use its bounding box without labelling pieces
+            xy_min = points_2d.min(axis=0)
+            xy_max = points_2d.max(axis=0)
+            if (xy_max - xy_min).max() < 2 * CLUSTER_EPS:
+                bounds = np.concatenate([xy_min, xy_max])[None, :]
+                if (bounds[0, 2] - bounds[0, 0]) * (bounds[0, 3] - bounds[0, 1]) < self.min_area_threshold:
+                    return 0
+                layer_data.extend(z, layer_id, np.zeros(1, dtype=np.int64), bounds)
+                return 1
+
+            # Segments share endpoints: snap them to a fine grid to get one
+            # id per distinct vertex
+            snapped = np.round(points_2d / SEGMENT_SNAP).astype(np.int64)
+            _, vertex_ids = np.unique(snapped, axis=0, return_inverse=True)
+            vertex_ids = vertex_ids.ravel()
+
+            # Every connected piece of the segment graph is its own region
+            labels = _segment_components(vertex_ids)[vertex_ids]
+
+            # Bounding box of every region in one scatter pass
+            region_ids, region_index = np.unique(labels, return_inverse=True)
+
+            bounds = np.empty((len(region_ids), 4), dtype=np.float32)
+            bounds[:, :2] = np.inf
+            bounds[:, 2:] = -np.inf
+            np.minimum.at(bounds[:, :2], region_index, points_2d)
+            np.maximum.at(bounds[:, 2:], region_index, points_2d)
+
+            area = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+
+            # Pieces inside another piece's bounds (the inner wall of a
+            # hollow section, an island in a pocket) belong to that region
+            contains = (
+                (bounds[:, None, :2] <= bounds[None, :, :2]).all(axis=-1) &
+                (bounds[:, None, 2:] >= bounds[None, :, 2:]).all(axis=-1) &
+                (area[:, None] > area[None, :])
+            )
+            keep = (area >= self.min_area_threshold) & ~contains.any(axis=0)
+
+            layer_data.extend(z, layer_id, region_ids[keep], bounds[keep])
+            return int(keep.sum())
 
         except Exception:
-            return None
+            return 0
 
     def _group_layers_into_boxes(self,
-                                 layer_data: List[Dict],
+                                 layer_data: LayerTable,
                                  verbose: bool = False) -> List[Dict]:
         """
-        Group consecutive layers with similar bounding boxes into 3D boxes.
+        Group layers with similar bounding boxes into 3D boxes.
 
-        Uses more aggressive separation strategy to detect individual blocks.
+        Boxes stay open while their latest region is within 2 layer heights
+        of the current layer. Each region is matched against the open boxes
+        it overlaps (STRtree query) and continues the best one, so a box
+        survives a one-layer blip and several boxes can grow side by side.
 
         Args:
-            layer_data: List of layer analysis results
+            layer_data: Layer regions in slicing order
             verbose: Print progress
 
         Returns:
             List of reconstructed boxes
         """
-        if not layer_data:
+        n = len(layer_data)
+        if not n:
             return []
 
-        boxes = []
-        current_group = [layer_data[0]]
-
-        for i in range(1, len(layer_data)):
-            layer = layer_data[i]
-            prev_layer = layer_data[i - 1]
-
-            # Check if layers belong to same box (similar bounding box)
-            bbox_similarity = self._compute_bbox_similarity(
-                prev_layer['bounds'],
-                layer['bounds']
-            )
-
-            # More aggressive: require high similarity to group
-            # Also check for significant jumps in box position/size
-            position_change = np.linalg.norm(layer['center'] - prev_layer['center'])
-            size_change = abs(layer['area'] - prev_layer['area']) / (prev_layer['area'] + 1e-6)
-
-            # Layer continuity check (should be close in Z)
-            z_gap = layer['z'] - prev_layer['z']
-            layer_continuous = z_gap <= self.layer_height * 2.0
-
-            # Stricter grouping: high similarity AND small position/size changes
-            should_group = (
-                bbox_similarity > 0.8 and
-                layer_continuous and
-                position_change < 5.0 and
-                size_change < 0.15
-            )
-
-            if should_group:
-                # Same box, add to group
-                current_group.append(layer)
-            else:
-                # Different box, finalize current group if large enough
-                if len(current_group) > 2:  # Need at least 3 layers for a box
-                    box = self._finalize_box(current_group)
-                    if box['dimensions'].sum() > 10:  # Minimum size check
-                        boxes.append(box)
-
-                current_group = [layer]
-
-        # Finalize last group
-        if len(current_group) > 2:
-            box = self._finalize_box(current_group)
-            if box['dimensions'].sum() > 10:
-                boxes.append(box)
-
-        return boxes
-
-    def _compute_bbox_similarity(self,
-                                bbox1: np.ndarray,
-                                bbox2: np.ndarray) -> float:
+        bounds = layer_data.bounds
+        centers = layer_data.centers
+        areas = layer_data.areas
+        zs = layer_data.zs
+        max_z_gap = self.layer_height * 2.0
+
+        # Latest region of every box (at most one box per region)
+        group_bounds = np.empty_like(bounds)
+        group_centers = np.empty_like(centers)
+        group_areas = np.empty_like(areas)
+        group_zs = np.empty_like(zs)
+        group_of_row = np.empty(n, dtype=np.int64)
+        n_groups = 0
+        open_groups: List[int] = []
+
+        layer_starts = np.flatnonzero(np.diff(layer_data.layer_ids)) + 1
+        for rows in np.split(np.arange(n), layer_starts):
+            z = zs[rows[0]]
+
+            # Close boxes that no layer has extended recently
+            open_groups = [g for g in open_groups if z - group_zs[g] <= max_z_gap]
+            tree = STRtree([shapely_box(*group_bounds[g]) for g in open_groups]) if open_groups else None
+
+            taken = set()
+            new_groups = []
+            for r in rows:
+                match = -1
+                if tree is not None:
+                    candidates = np.array(
+                        [open_groups[i] for i in tree.query(shapely_box(*bounds[r]))
+                         if open_groups[i] not in taken],
+                        dtype=np.int64
+                    )
+                    if len(candidates):
+                        match = _best_match(
+                            group_bounds, group_centers, group_areas, group_zs,
+                            candidates, bounds[r], centers[r], areas[r], zs[r], max_z_gap
+                        )
+
+                if match < 0:
+                    match = n_groups
+                    n_groups += 1
+                    new_groups.append(match)
+                else:
+                    taken.add(match)
+
+                group_of_row[r] = match
+                group_bounds[match] = bounds[r]
+                group_centers[match] = centers[r]
+                group_areas[match] = areas[r]
+                group_zs[match] = zs[r]
+
+            open_groups.extend(new_groups)
+
+        # Rows of each box, boxes in order of their first layer
+        order = np.argsort(group_of_row, kind='stable')
+        group_starts = np.append(0, np.flatnonzero(np.diff(group_of_row[order])) + 1)
+
+        boxes = self._finalize_boxes(layer_data, order, group_starts)
+
+        return [
+            box for box in boxes
+            if box['n_layers'] > 2  # Need at least 3 layers for a box
+            and box['dimensions'].sum() > 10  # Minimum size check
+        ]
+
+    def _finalize_boxes(self,
+                        layer_data: LayerTable,
+                        rows: np.ndarray,
+                        starts: np.ndarray) -> List[Dict]:
         """
-        Compute similarity between two 2D bounding boxes.
-
-        Args:
-            bbox1: [[x_min, y_min], [x_max, y_max]]
-            bbox2: [[x_min, y_min], [x_max, y_max]]
-
-        Returns:
-            Similarity score 0-1
-        """
-        # Calculate IoU (Intersection over Union)
-        x_min1, y_min1 = bbox1[0]
-        x_max1, y_max1 = bbox1[1]
-        x_min2, y_min2 = bbox2[0]
-        x_max2, y_max2 = bbox2[1]
-
-        # Intersection
-        x_inter_min = max(x_min1, x_min2)
-        x_inter_max = min(x_max1, x_max2)
-        y_inter_min = max(y_min1, y_min2)
-        y_inter_max = min(y_max1, y_max2)
+        Reconstruct 3D boxes from groups of layers.
 
-        if x_inter_max < x_inter_min or y_inter_max < y_inter_min:
-            return 0.0
-
-        inter_area = (x_inter_max - x_inter_min) * (y_inter_max - y_inter_min)
-
-        # Union
-        area1 = (x_max1 - x_min1) * (y_max1 - y_min1)
-        area2 = (x_max2 - x_min2) * (y_max2 - y_min2)
-        union_area = area1 + area2 - inter_area
-
-        iou = inter_area / union_area if union_area > 0 else 0.0
-        return iou
-
-    def _finalize_box(self, layer_group: List[Dict]) -> Dict:
-        """
-        Reconstruct a 3D box from a group of layers.
+        Every group's bounds are averaged and its Z range taken in one
+        reduceat pass over the group-sorted rows.
 
         Args:
-            layer_group: List of layer analysis dicts
+            layer_data: Layer regions
+            rows: Rows of layer_data sorted by group
+            starts: Offset of each group's first row in rows
 
         Returns:
-            Reconstructed box parameters
+            Reconstructed box parameters, one per group
         """
+        counts = np.diff(np.append(starts, len(rows)))
+
         # Average the bounding box across layers
-        all_bounds = np.array([layer['bounds'] for layer in layer_group])
-        avg_bounds = np.mean(all_bounds, axis=0)
+        bounds = layer_data.bounds[rows].astype(np.float64)
+        avg_bounds = np.add.reduceat(bounds, starts, axis=0) / counts[:, None]
 
         # Z range
-        z_values = [layer['z'] for layer in layer_group]
-        z_min = min(z_values)
-        z_max = max(z_values)
-        z_height = z_max - z_min
-
-        # XY dimensions
-        x_min, y_min = avg_bounds[0]
-        x_max, y_max = avg_bounds[1]
-        x_width = x_max - x_min
-        y_width = y_max - y_min
-
-        # Center
-        center = np.array([
-            (x_min + x_max) / 2,
-            (y_min + y_max) / 2,
-            (z_min + z_max) / 2
-        ])
+        z_values = layer_data.zs[rows]
+        z_min = np.minimum.reduceat(z_values, starts)
+        z_max = np.maximum.reduceat(z_values, starts)
 
-        return {
-            'center': center,
-            'dimensions': np.array([x_width, y_width, z_height]),
-            'z_range': [z_min, z_max],
-            'n_layers': len(layer_group),
-            'shape_type': 'box',
-            'confidence': 95
-        }
+        # XY dimensions and center
+        xy_min = avg_bounds[:, :2]
+        xy_max = avg_bounds[:, 2:]
+        dimensions = np.column_stack([xy_max - xy_min, z_max - z_min])
+        centers = np.column_stack([(xy_min + xy_max) / 2, (z_min + z_max) / 2])
+
+        return [
+            {
+                'center': centers[g],
+                'dimensions': dimensions[g],
+                'z_range': [z_min[g], z_max[g]],
+                'n_layers': int(counts[g]),
+                'shape_type': 'box',
+                'confidence': 95
+            }
+            for g in range(len(starts))
+        ]
 
 
 def analyze_mesh_layers(mesh: trimesh.Trimesh,
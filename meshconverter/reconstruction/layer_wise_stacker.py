@@ -12,11 +12,13 @@ Decomposes complex 3D meshes into stacks of parametric primitives by:
 This mirrors the manual CAD workflow: slice → inspect → draw → extrude → combine
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import trimesh
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
-from sklearn.decomposition import PCA
-from scipy.optimize import minimize
+import shapely
 from shapely.geometry import Polygon as ShapelyPolygon
 import warnings
 
@@ -30,6 +32,220 @@ try:
 except ImportError:
     CV_AVAILABLE = False
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _circle_fit_loops(coords: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Algebraic (Kåsa) least-squares circle through 2D points.
+
+    x² + y² = 2·cx·x + 2·cy·y + c is linear in (cx, cy, c). With the points
+    centered on their mean the normal equations decouple into a 2x2 system
+    for the center and c = mean(x² + y²), solved here in closed form.
+    Explicit loops written for Numba (see _circle_fit).
+
+    Args:
+        coords: (n, 2) float64 points
+
+    Returns:
+        (cx, cy, radius, rms_error)
+    """
+    n = coords.shape[0]
+    mx = 0.0
+    my = 0.0
+    for i in range(n):
+        mx += coords[i, 0]
+        my += coords[i, 1]
+    mx /= n
+    my /= n
+
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    sxz = 0.0
+    syz = 0.0
+    sz = 0.0
+    for i in range(n):
+        x = coords[i, 0] - mx
+        y = coords[i, 1] - my
+        z = x * x + y * y
+        sxx += x * x
+        sxy += x * y
+        syy += y * y
+        sxz += x * z
+        syz += y * z
+        sz += z
+
+    det = sxx * syy - sxy * sxy
+    if det == 0.0:
+        cx = 0.0
+        cy = 0.0
+    else:
+        cx = (sxz * syy - syz * sxy) / det / 2
+        cy = (syz * sxx - sxz * sxy) / det / 2
+    r = np.sqrt(max(sz / n + cx * cx + cy * cy, 0.0))
+
+    sq_err = 0.0
+    for i in range(n):
+        d = np.hypot(coords[i, 0] - mx - cx, coords[i, 1] - my - cy) - r
+        sq_err += d * d
+
+    return cx + mx, cy + my, r, np.sqrt(sq_err / n)
+
+
+def _circle_fit_numpy(coords: np.ndarray) -> Tuple[float, float, float, float]:
+    """Vectorized NumPy equivalent of _circle_fit_loops (no Numba)."""
+    offset = coords.mean(axis=0)
+    x = coords[:, 0] - offset[0]
+    y = coords[:, 1] - offset[1]
+    A = np.column_stack([x, y, np.ones(len(coords))])
+    solution, *_ = np.linalg.lstsq(A, x**2 + y**2, rcond=None)
+
+    cx = solution[0] / 2
+    cy = solution[1] / 2
+    r = np.sqrt(max(solution[2] + cx**2 + cy**2, 0.0))
+    rms_error = np.sqrt(((np.hypot(x - cx, y - cy) - r)**2).mean())
+
+    return cx + offset[0], cy + offset[1], r, rms_error
+
+
+def _pca_extents_loops(coords: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Extents of 2D points along their principal axes.
+
+    The 2x2 covariance is diagonalized in closed form; the major axis is
+    signed with its largest component positive (as scikit-learn's PCA
+    did), so rotations are stable. Explicit loops written for Numba (see
+    _pca_extents).
+
+    Args:
+        coords: (n, 2) float64 points
+
+    Returns:
+        (major_extent, minor_extent, major_axis_angle_degrees)
+    """
+    n = coords.shape[0]
+    mx = 0.0
+    my = 0.0
+    for i in range(n):
+        mx += coords[i, 0]
+        my += coords[i, 1]
+    mx /= n
+    my /= n
+
+    a = 0.0
+    b = 0.0
+    c = 0.0
+    for i in range(n):
+        x = coords[i, 0] - mx
+        y = coords[i, 1] - my
+        a += x * x
+        b += x * y
+        c += y * y
+
+    # Eigenvector of the larger eigenvalue. Isotropic point sets (circles,
+    # squares) have no preferred axis: report the Y axis, like LAPACK does
+    # for a scalar covariance
+    spread = np.sqrt(((a - c) / 2) ** 2 + b * b)
+    if spread <= 1e-9 * (a + c):
+        ux = 0.0
+        uy = 1.0
+    elif b != 0.0:
+        ux = (a - c) / 2 + spread
+        uy = b
+        norm = np.hypot(ux, uy)
+        ux /= norm
+        uy /= norm
+    elif a > c:
+        ux = 1.0
+        uy = 0.0
+    else:
+        ux = 0.0
+        uy = 1.0
+    if (abs(ux) >= abs(uy) and ux < 0) or (abs(uy) > abs(ux) and uy < 0):
+        ux = -ux
+        uy = -uy
+
+    major_min = np.inf
+    major_max = -np.inf
+    minor_min = np.inf
+    minor_max = -np.inf
+    for i in range(n):
+        x = coords[i, 0] - mx
+        y = coords[i, 1] - my
+        p = x * ux + y * uy
+        q = y * ux - x * uy
+        major_min = min(major_min, p)
+        major_max = max(major_max, p)
+        minor_min = min(minor_min, q)
+        minor_max = max(minor_max, q)
+
+    return major_max - major_min, minor_max - minor_min, np.degrees(np.arctan2(uy, ux)) + 0.0
+
+
+def _pca_extents_numpy(coords: np.ndarray) -> Tuple[float, float, float]:
+    """Vectorized NumPy equivalent of _pca_extents_loops (no Numba)."""
+    centered = coords - coords.mean(axis=0)
+    cov = centered.T @ centered
+    w, v = np.linalg.eigh(cov)
+
+    # Major axis: eigenvector of the larger eigenvalue (eigh sorts
+    # ascending), Y for isotropic sets, largest component positive
+    if w[1] - w[0] <= 2e-9 * (w[0] + w[1]):
+        major = np.array([0.0, 1.0])
+    else:
+        major = v[:, 1]
+    if major[np.argmax(np.abs(major))] < 0:
+        major = -major
+    minor = np.array([-major[1], major[0]])
+
+    along_major = centered @ major
+    along_minor = centered @ minor
+    angle = np.degrees(np.arctan2(major[1], major[0])) + 0.0
+
+    return np.ptp(along_major), np.ptp(along_minor), angle
+
+
+if HAS_NUMBA:
+    _circle_fit = njit(cache=True)(_circle_fit_loops)
+    _pca_extents = njit(cache=True)(_pca_extents_loops)
+else:
+    _circle_fit = _circle_fit_numpy
+    _pca_extents = _pca_extents_numpy
+
+
+def _mesh_volume(mesh: trimesh.Trimesh) -> float:
+    """
+    Signed volume of a closed mesh as a sum of origin tetrahedra.
+
+    Same value as mesh.volume without trimesh's full mass-properties
+    integration (center of mass, inertia), which the quality score never
+    uses.
+    """
+    triangles = mesh.vertices[mesh.faces]
+    v0, v1, v2 = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    return float(np.einsum('ij,ij->', v0, np.cross(v1, v2)) / 6.0)
+
+
+# Primitive types fitted by classify_and_fit_2d (ties go to the first)
+PRIMITIVE_SHAPES = ('circle', 'rectangle', 'ellipse')
+
+# Per slicing axis: index order that maps (u, v, axis) to (x, y, z), and
+# the axis of the 90° rotation that turns a Z extrusion onto it
+AXIS_PERMUTATIONS = {'Z': [0, 1, 2], 'Y': [0, 2, 1], 'X': [2, 0, 1]}
+EXTRUSION_ROTATION_AXES = {'Z': None, 'Y': [1, 0, 0], 'X': [0, 1, 0]}
+
+# Fuzzy membership tables: area ratio (min/max) above each bound, and
+# centroid distance / radius below each bound
+SIZE_MATCH_BOUNDS = np.array([0.50, 0.70, 0.85, 0.95])
+SIZE_MATCH_SCORES = np.array([0.0, 0.3, 0.6, 0.8, 1.0])   # > 50%, 30%, 15%, 5%, < 5% change
+ALIGNMENT_BOUNDS = np.array([0.05, 0.10, 0.20])
+ALIGNMENT_SCORES = np.array([1.0, 0.8, 0.5, 0.2])         # Perfect, well, moderately, misaligned
+
 
 class LayerWiseStacker:
     """
@@ -48,7 +264,8 @@ class LayerWiseStacker:
         centroid_tolerance_mm: float = 2.0,
         use_cv_validation: bool = True,
         cv_confidence_threshold: float = 0.70,  # Use 0.70 for quality; lower causes issues with hollow structures
-        verbose: bool = True
+        verbose: bool = True,
+        max_workers: Optional[int] = None
     ):
         """
         Initialize Layer-Wise Stacker.
@@ -62,6 +279,8 @@ class LayerWiseStacker:
             use_cv_validation: Enable CV-based validation (requires opencv)
             cv_confidence_threshold: Minimum CV confidence to use primitive (0-1)
             verbose: Print progress messages
+            max_workers: Threads for fitting layer primitives and extruding segments
+                (default: os.cpu_count())
         """
         self.layer_height = layer_height
         self.min_segment_height = min_segment_height
@@ -71,6 +290,11 @@ class LayerWiseStacker:
         self.use_cv_validation = use_cv_validation and CV_AVAILABLE
         self.cv_threshold = cv_confidence_threshold
         self.verbose = verbose
+        self.max_workers = max_workers
+
+        # Unit primitives, scaled into place per segment
+        self._cylinder_templates: Dict[int, trimesh.Trimesh] = {}
+        self._unit_box = trimesh.creation.box(extents=[1.0, 1.0, 1.0])
 
         # Initialize CV validator if enabled
         if self.use_cv_validation:
@@ -140,31 +364,29 @@ class LayerWiseStacker:
         num_layers = int((z_max - z_min) / layer_height)
         heights = np.linspace(z_min + layer_height, z_max - layer_height, num_layers)
 
-        layers = []
+        # All sections in one multiplane pass. They come back in the plane
+        # frame of plane_origin/axis; map that frame onto the two world axes
+        # extrude_segment expects (X/Y for Z, X/Z for Y, Y/Z for X)
+        plane_origin = axis * z_min
+        sections = mesh.section_multiplane(
+            plane_origin=plane_origin,
+            plane_normal=axis,
+            heights=heights - z_min
+        )
+        in_plane = np.sort(np.argsort(np.abs(axis))[:2])
+        to_world_2d = np.eye(3)
+        to_world_2d[:2, :2] = trimesh.geometry.plane_transform(plane_origin, axis)[:2, in_plane].T
 
-        for i, z in enumerate(heights):
-            # Create slicing plane
-            plane_origin = axis * z
-            plane_normal = axis
+        layers = []
 
+        for i, (z, path2d) in enumerate(zip(heights, sections)):
             try:
-                # Slice mesh
-                section = mesh.section(
-                    plane_origin=plane_origin,
-                    plane_normal=plane_normal
-                )
-
-                if section is None:
-                    continue
-
-                # Convert to 2D (returns Path2D object)
-                path2d, _ = section.to_planar()
-
-                # Convert Path2D to Shapely Polygon
                 # Path2D has entities (lines/arcs) that form closed loops
                 if path2d is None or len(path2d.entities) == 0:
                     continue
 
+                path2d.apply_transform(to_world_2d)
+
                 # Get discrete points from path
                 # to_polygon() converts path to shapely polygon
                 try:
@@ -180,12 +402,20 @@ class LayerWiseStacker:
                 if polygon_2d.is_empty or not polygon_2d.is_valid:
                     continue
 
+                # Circle and ellipse fits use the full ring (without the
+                # closing point): the edge-crossing midpoints are part of
+                # what they fit
+                coords = np.asarray(polygon_2d.exterior.coords)[:-1]
+
+                # Metrics and the OBB only need the outline: drop the
+                # near-collinear vertices left by triangle edge crossings
+                polygon_2d = polygon_2d.simplify(layer_height * 0.01, preserve_topology=True)
+
                 layers.append({
                     'layer_id': i,
                     'z_height': float(z),
                     'polygon': polygon_2d,
-                    'area': polygon_2d.area,
-                    'centroid': np.array(polygon_2d.centroid.coords[0])
+                    'coords': coords
                 })
 
             except Exception as e:
@@ -193,43 +423,55 @@ class LayerWiseStacker:
                     print(f"  ⚠️  Layer {i} @ Z={z:.1f}mm failed: {e}")
                 continue
 
+        if not layers:
+            return layers
+
+        # Area, perimeter and centroid of all layers in one GEOS call each
+        geoms = np.empty(len(layers), dtype=object)
+        geoms[:] = [layer['polygon'] for layer in layers]
+        areas = shapely.area(geoms)
+        perimeters = shapely.length(geoms)
+        centroids = shapely.get_coordinates(shapely.centroid(geoms))
+
+        for layer, area, perimeter, centroid in zip(layers, areas, perimeters, centroids):
+            layer['area'] = float(area)
+            layer['perimeter'] = float(perimeter)
+            layer['centroid'] = centroid
+            # Layers with the same signature get the same fit; the rounded
+            # vertex set tells a rotated copy of a section from the original.
+            # It covers the full ring: circle and ellipse fits move with the
+            # edge crossings, so only slices that match exactly share a fit
+            vertices = np.unique(np.round(layer['coords'], 2) + 0.0, axis=0)
+            layer['signature'] = (
+                round(layer['area'], 2), round(centroid[0], 2), round(centroid[1], 2),
+                len(layer['coords']), hash(vertices.tobytes())
+            )
+
         return layers
 
-    def fit_circle_2d(self, polygon: ShapelyPolygon) -> Dict[str, Any]:
+    def fit_circle_2d(
+        self,
+        polygon: ShapelyPolygon,
+        coords: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
         """
         Fit circle to 2D polygon using least-squares.
 
+        Uses the closed-form algebraic (Kåsa) fit, see _circle_fit_loops.
+
         Args:
             polygon: shapely Polygon
+            coords: Exterior vertices without the closing point (extracted
+                from polygon if not given)
 
         Returns:
             Dictionary with type='circle', center, radius, fit_quality
         """
         # Get exterior coordinates
-        coords = np.array(polygon.exterior.coords[:-1])  # Exclude duplicate last point
-
-        # Initial guess from centroid
-        center_guess = polygon.centroid.coords[0]
-        distances = np.linalg.norm(coords - center_guess, axis=1)
-        radius_guess = distances.mean()
-
-        # Least-squares circle fitting
-        def circle_error(params):
-            cx, cy, r = params
-            dists = np.sqrt((coords[:, 0] - cx)**2 + (coords[:, 1] - cy)**2)
-            return ((dists - r)**2).sum()
-
-        result = minimize(
-            circle_error,
-            x0=[center_guess[0], center_guess[1], radius_guess],
-            method='Nelder-Mead'
-        )
-
-        cx, cy, r = result.x
+        if coords is None:
+            coords = np.array(polygon.exterior.coords[:-1])  # Exclude duplicate last point
 
-        # Calculate RMS error
-        dists = np.sqrt((coords[:, 0] - cx)**2 + (coords[:, 1] - cy)**2)
-        rms_error = np.sqrt(((dists - r)**2).mean())
+        cx, cy, r, rms_error = _circle_fit(coords)
 
         # Fit quality: 1 - (RMS / radius)
         fit_quality = max(0, 1 - (rms_error / r)) if r > 0 else 0
@@ -238,22 +480,29 @@ class LayerWiseStacker:
             'type': 'circle',
             'center': np.array([cx, cy]),
             'radius': float(r),
+            'radius_proxy': float(r),
             'rms_error': float(rms_error),
             'fit_quality': float(fit_quality)
         }
 
-    def fit_rectangle_2d(self, polygon: ShapelyPolygon) -> Dict[str, Any]:
+    def fit_rectangle_2d(
+        self,
+        polygon: ShapelyPolygon,
+        min_rect: Optional[ShapelyPolygon] = None
+    ) -> Dict[str, Any]:
         """
         Fit oriented bounding rectangle to 2D polygon.
 
         Args:
             polygon: shapely Polygon
+            min_rect: Precomputed polygon.minimum_rotated_rectangle
 
         Returns:
             Dictionary with type='rectangle', center, width, height, rotation
         """
         # Minimum rotated rectangle
-        min_rect = polygon.minimum_rotated_rectangle
+        if min_rect is None:
+            min_rect = polygon.minimum_rotated_rectangle
 
         # Get corners
         coords = np.array(min_rect.exterior.coords[:-1])
@@ -261,8 +510,8 @@ class LayerWiseStacker:
         # Calculate dimensions
         edge1 = coords[1] - coords[0]
         edge2 = coords[2] - coords[1]
-        width = np.linalg.norm(edge1)
-        height = np.linalg.norm(edge2)
+        width = np.hypot(*edge1)
+        height = np.hypot(*edge2)
 
         # Rotation angle (degrees)
         angle = np.degrees(np.arctan2(edge1[1], edge1[0]))
@@ -276,37 +525,33 @@ class LayerWiseStacker:
             'width': float(width),
             'height': float(height),
             'rotation': float(angle),
+            'radius_proxy': float((width + height) / 4),
             'fit_quality': float(fit_quality),
             'rectangularity': float(fit_quality)  # Same as fit_quality for rectangles
         }
 
-    def fit_ellipse_2d(self, polygon: ShapelyPolygon) -> Dict[str, Any]:
+    def fit_ellipse_2d(
+        self,
+        polygon: ShapelyPolygon,
+        coords: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
         """
         Fit ellipse to 2D polygon using PCA.
 
         Args:
             polygon: shapely Polygon
+            coords: Exterior vertices without the closing point (extracted
+                from polygon if not given)
 
         Returns:
             Dictionary with type='ellipse', center, major_axis, minor_axis, rotation
         """
-        coords = np.array(polygon.exterior.coords[:-1])
+        if coords is None:
+            coords = np.array(polygon.exterior.coords[:-1])
         center = polygon.centroid.coords[0]
 
-        # PCA on centered coordinates
-        centered = coords - center
-        pca = PCA(n_components=2)
-        pca.fit(centered)
-
-        # Project onto principal axes
-        projected = pca.transform(centered)
-
-        # Major and minor axes (ranges along principal components)
-        major_axis = projected[:, 0].max() - projected[:, 0].min()
-        minor_axis = projected[:, 1].max() - projected[:, 1].min()
-
-        # Rotation angle
-        angle = np.degrees(np.arctan2(pca.components_[0, 1], pca.components_[0, 0]))
+        # Ranges along the principal components, and the major axis angle
+        major_axis, minor_axis, angle = _pca_extents(coords)
 
         # Fit quality (heuristic)
         # Ellipse area = π * (major/2) * (minor/2)
@@ -319,13 +564,22 @@ class LayerWiseStacker:
             'major_axis': float(major_axis),
             'minor_axis': float(minor_axis),
             'rotation': float(angle),
+            'radius_proxy': float((major_axis + minor_axis) / 4),
             'fit_quality': float(fit_quality)
         }
 
-    def calculate_shape_metrics(self, polygon: ShapelyPolygon) -> Dict[str, float]:
+    def calculate_shape_metrics(
+        self,
+        polygon: ShapelyPolygon,
+        min_rect: Optional[ShapelyPolygon] = None
+    ) -> Dict[str, float]:
         """
         Calculate geometric metrics to help discriminate shapes.
 
+        Args:
+            polygon: shapely Polygon
+            min_rect: Precomputed polygon.minimum_rotated_rectangle
+
         Returns:
             Dictionary with circularity, compactness, rectangularity metrics
         """
@@ -337,7 +591,8 @@ class LayerWiseStacker:
         circularity = (4 * np.pi * area) / (perimeter ** 2) if perimeter > 0 else 0
 
         # Get minimum rotated rectangle (OBB)
-        min_rect = polygon.minimum_rotated_rectangle
+        if min_rect is None:
+            min_rect = polygon.minimum_rotated_rectangle
         rect_area = min_rect.area
 
         # Rectangularity = polygon_area / bounding_rect_area
@@ -346,8 +601,8 @@ class LayerWiseStacker:
 
         # Aspect ratio of bounding rectangle
         coords = np.array(min_rect.exterior.coords[:-1])
-        edge1 = np.linalg.norm(coords[1] - coords[0])
-        edge2 = np.linalg.norm(coords[2] - coords[1])
+        edge1 = np.hypot(*(coords[1] - coords[0]))
+        edge2 = np.hypot(*(coords[2] - coords[1]))
         aspect_ratio = max(edge1, edge2) / min(edge1, edge2) if min(edge1, edge2) > 0 else 1.0
 
         return {
@@ -356,10 +611,70 @@ class LayerWiseStacker:
             'aspect_ratio': aspect_ratio
         }
 
+    def _batch_shape_metrics(
+        self,
+        polygons: List[ShapelyPolygon]
+    ) -> Tuple[List[Dict[str, float]], np.ndarray]:
+        """
+        calculate_shape_metrics() for many polygons at once.
+
+        Area, perimeter and the minimum rotated rectangles come from
+        Shapely's vectorized functions (one GEOS call each for the whole
+        batch) instead of one property access per polygon.
+
+        Args:
+            polygons: shapely Polygons
+
+        Returns:
+            (metrics dictionaries, minimum rotated rectangles), in the order
+            of polygons
+        """
+        geoms = np.empty(len(polygons), dtype=object)
+        geoms[:] = polygons
+
+        area = shapely.area(geoms)
+        perimeter = shapely.length(geoms)
+        min_rects = shapely.oriented_envelope(geoms)
+        rect_area = shapely.area(min_rects)
+
+        # First two edges of every rectangle (degenerate hulls are lines or
+        # points and go through the scalar path)
+        coords, index = shapely.get_coordinates(min_rects, return_index=True)
+        counts = np.bincount(index, minlength=len(polygons))
+        starts = np.cumsum(counts) - counts
+        is_rect = counts == 5
+        corners = coords[starts[is_rect, None] + np.arange(3)]
+        edge1 = np.full(len(polygons), np.nan)
+        edge2 = np.full(len(polygons), np.nan)
+        edge1[is_rect] = np.hypot(*(corners[:, 1] - corners[:, 0]).T)
+        edge2[is_rect] = np.hypot(*(corners[:, 2] - corners[:, 1]).T)
+
+        metrics = []
+        for i, polygon in enumerate(polygons):
+            if not is_rect[i]:
+                metrics.append(self.calculate_shape_metrics(polygon, min_rects[i]))
+                continue
+
+            circularity = (4 * np.pi * area[i]) / (perimeter[i] ** 2) if perimeter[i] > 0 else 0
+            rectangularity = area[i] / rect_area[i] if rect_area[i] > 0 else 0
+            short_edge = min(edge1[i], edge2[i])
+            aspect_ratio = max(edge1[i], edge2[i]) / short_edge if short_edge > 0 else 1.0
+
+            metrics.append({
+                'circularity': circularity,
+                'rectangularity': rectangularity,
+                'aspect_ratio': aspect_ratio
+            })
+
+        return metrics, min_rects
+
     def classify_and_fit_2d(
         self,
         polygon: ShapelyPolygon,
-        shape_hint: Optional[str] = None
+        shape_hint: Optional[str] = None,
+        metrics: Optional[Dict[str, float]] = None,
+        coords: Optional[np.ndarray] = None,
+        min_rect: Optional[ShapelyPolygon] = None
     ) -> Dict[str, Any]:
         """
         Classify 2D polygon shape and fit best primitive.
@@ -372,80 +687,79 @@ class LayerWiseStacker:
         Args:
             polygon: shapely Polygon
             shape_hint: Optional hint ('circle', 'rectangle', 'ellipse')
+            metrics: Precomputed calculate_shape_metrics() result
+            coords: Precomputed exterior vertices (see slice_mesh)
+            min_rect: Precomputed minimum rotated rectangle
 
         Returns:
             Best-fitting primitive parameters
         """
+        # The OBB feeds both the metrics and the rectangle fit
+        if min_rect is None:
+            min_rect = polygon.minimum_rotated_rectangle
+
         # Calculate shape metrics
-        metrics = self.calculate_shape_metrics(polygon)
-
-        # Try all primitives
-        candidates = []
-
-        # Circle
-        circle = self.fit_circle_2d(polygon)
-        # Boost circle quality if high circularity
-        if metrics['circularity'] > 0.90:
-            circle['fit_quality'] *= 1.2  # 20% bonus
-        elif metrics['circularity'] < 0.80:
-            circle['fit_quality'] *= 0.7  # 30% penalty for non-circular
-        circle['metrics'] = metrics
-        candidates.append(circle)
-
-        # Rectangle
-        rectangle = self.fit_rectangle_2d(polygon)
-        # Boost rectangle quality if high rectangularity
-        if metrics['rectangularity'] > 0.95:
-            rectangle['fit_quality'] *= 1.3  # 30% bonus for rectangular
-        elif metrics['rectangularity'] < 0.85:
-            rectangle['fit_quality'] *= 0.8  # 20% penalty
-        rectangle['metrics'] = metrics
-        candidates.append(rectangle)
-
-        # Ellipse
-        ellipse = self.fit_ellipse_2d(polygon)
-        # Boost ellipse if elongated (high aspect ratio)
-        if metrics['aspect_ratio'] > 1.5:
-            ellipse['fit_quality'] *= 1.1  # 10% bonus
-        ellipse['metrics'] = metrics
-        candidates.append(ellipse)
+        if metrics is None:
+            metrics = self.calculate_shape_metrics(polygon, min_rect)
+
+        # Fit primitives lazily: the rules below usually pick the winner
+        # from the metrics alone, so only that fitter has to run
+        candidates = {}
+
+        def candidate(shape: str) -> Dict[str, Any]:
+            if shape in candidates:
+                return candidates[shape]
+
+            if shape == 'circle':
+                fit = self.fit_circle_2d(polygon, coords)
+                # Boost circle quality if high circularity
+                if metrics['circularity'] > 0.90:
+                    fit['fit_quality'] *= 1.2  # 20% bonus
+                elif metrics['circularity'] < 0.80:
+                    fit['fit_quality'] *= 0.7  # 30% penalty for non-circular
+            elif shape == 'rectangle':
+                fit = self.fit_rectangle_2d(polygon, min_rect)
+                # Boost rectangle quality if high rectangularity
+                if metrics['rectangularity'] > 0.95:
+                    fit['fit_quality'] *= 1.3  # 30% bonus for rectangular
+                elif metrics['rectangularity'] < 0.85:
+                    fit['fit_quality'] *= 0.8  # 20% penalty
+            else:
+                fit = self.fit_ellipse_2d(polygon, coords)
+                # Boost ellipse if elongated (high aspect ratio)
+                if metrics['aspect_ratio'] > 1.5:
+                    fit['fit_quality'] *= 1.1  # 10% bonus
+
+            fit['metrics'] = metrics
+            candidates[shape] = fit
+            return fit
 
         # Select best based on fit_quality (with shape-aware adjustments)
         best = None
 
-        if shape_hint:
+        if shape_hint in PRIMITIVE_SHAPES:
             # Prefer hinted shape if quality is reasonable
-            for candidate in candidates:
-                if candidate['type'] == shape_hint and candidate['fit_quality'] > 0.7:
-                    best = candidate
-                    break
+            hinted = candidate(shape_hint)
+            if hinted['fit_quality'] > 0.7:
+                best = hinted
 
         # Shape discrimination logic based on metrics (if no hint match)
         if best is None:
             # Rule 1: High rectangularity + low circularity → Rectangle
             if metrics['rectangularity'] > 0.90 and metrics['circularity'] < 0.82:
-                for candidate in candidates:
-                    if candidate['type'] == 'rectangle':
-                        best = candidate
-                        break
+                best = candidate('rectangle')
 
             # Rule 2: High circularity + low rectangularity → Circle
             elif metrics['circularity'] > 0.90 and metrics['rectangularity'] < 0.85:
-                for candidate in candidates:
-                    if candidate['type'] == 'circle':
-                        best = candidate
-                        break
+                best = candidate('circle')
 
             # Rule 3: For ambiguous cases (both moderate), prefer rectangle if rectangularity is higher
             elif metrics['rectangularity'] > metrics['circularity'] + 0.10:
-                for candidate in candidates:
-                    if candidate['type'] == 'rectangle':
-                        best = candidate
-                        break
+                best = candidate('rectangle')
 
         # Otherwise, select highest quality
         if best is None:
-            best = max(candidates, key=lambda x: x['fit_quality'])
+            best = max((candidate(shape) for shape in PRIMITIVE_SHAPES), key=lambda x: x['fit_quality'])
 
         # CV validation (if enabled)
         if self.use_cv_validation and self.cv_validator is not None:
@@ -469,7 +783,7 @@ class LayerWiseStacker:
 
         return best
 
-    def fuzzy_size_match(self, area_ratio: float) -> float:
+    def fuzzy_size_match(self, area_ratio):
         """
         Fuzzy membership: how similar are sizes?
 
@@ -481,17 +795,13 @@ class LayerWiseStacker:
 
         Relaxed thresholds to reduce over-segmentation while still
         detecting major transitions.
+
+        Accepts a scalar or an array of ratios (looked up in one
+        searchsorted pass); returns the same shape.
         """
-        if area_ratio > 0.95:
-            return 1.0  # Very similar (< 5% change)
-        elif area_ratio > 0.85:
-            return 0.8  # Similar (< 15% change)
-        elif area_ratio > 0.70:
-            return 0.6  # Somewhat similar (< 30% change)
-        elif area_ratio > 0.50:
-            return 0.3  # Different (< 50% change)
-        else:
-            return 0.0  # Very different (> 50% change) - SPLIT
+        # Strictly above each bound moves one step up the score table
+        score = SIZE_MATCH_SCORES[np.searchsorted(SIZE_MATCH_BOUNDS, area_ratio, side='left')]
+        return float(score) if np.ndim(score) == 0 else score
 
     def fuzzy_shape_match(self, shape_a: str, shape_b: str) -> float:
         """Fuzzy membership: how similar are shapes?"""
@@ -509,31 +819,50 @@ class LayerWiseStacker:
         else:
             return 0.1  # Different
 
-    def fuzzy_alignment(self, centroid_dist: float, avg_radius: float) -> float:
-        """Fuzzy membership: how well aligned are centroids?"""
-        if avg_radius == 0:
-            return 0.5
-
-        ratio = centroid_dist / avg_radius
-        if ratio < 0.05:
-            return 1.0  # Perfectly aligned
-        elif ratio < 0.10:
-            return 0.8  # Well aligned
-        elif ratio < 0.20:
-            return 0.5  # Moderately aligned
-        else:
-            return 0.2  # Misaligned
+    def fuzzy_alignment(self, centroid_dist, avg_radius):
+        """
+        Fuzzy membership: how well aligned are centroids?
+
+        Accepts scalars or arrays (one searchsorted pass); returns the same
+        shape. A zero average radius scores 0.5.
+        """
+        centroid_dist = np.asarray(centroid_dist, dtype=np.float64)
+        avg_radius = np.asarray(avg_radius, dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = centroid_dist / avg_radius
+        # Below each bound keeps a better score
+        score = ALIGNMENT_SCORES[np.searchsorted(ALIGNMENT_BOUNDS, ratio, side='right')]
+        score = np.where(avg_radius == 0, 0.5, score)
+        return float(score) if score.ndim == 0 else score
+
+    @staticmethod
+    def _radius_proxy(primitive: Dict[str, Any], area: float) -> float:
+        """
+        Average "radius" of a primitive, used to normalize centroid offsets.
+
+        Set by the fit_*_2d methods; equal-area circle radius for primitives
+        without one.
+        """
+        radius = primitive.get('radius_proxy')
+        if radius is None:
+            radius = np.sqrt(area / np.pi)
+        return radius
 
     def should_merge_segments(
         self,
         seg_a: Dict[str, Any],
-        seg_b: Dict[str, Any]
+        seg_b: Dict[str, Any],
+        size_match: Optional[float] = None,
+        alignment: Optional[float] = None
     ) -> Tuple[bool, str, float]:
         """
         Fuzzy logic decision: should these segments be merged?
 
         Args:
             seg_a, seg_b: Segment dictionaries
+            size_match: Precomputed fuzzy_size_match() score of the pair
+            alignment: Precomputed fuzzy_alignment() score of the pair
 
         Returns:
             (should_merge, confidence_level, merge_score)
@@ -542,44 +871,26 @@ class LayerWiseStacker:
         prim_a = seg_a['primitive_2d']
         prim_b = seg_b['primitive_2d']
 
-        # Size similarity (area ratio)
         area_a = seg_a['layers'][0]['area']
         area_b = seg_b['layers'][0]['area']
-        area_ratio = min(area_a, area_b) / max(area_a, area_b) if max(area_a, area_b) > 0 else 0
 
         # Shape similarity
         shape_match = self.fuzzy_shape_match(prim_a['type'], prim_b['type'])
 
         # Centroid alignment
-        centroid_a = seg_a['layers'][0]['centroid']
-        centroid_b = seg_b['layers'][0]['centroid']
-        centroid_dist = np.linalg.norm(centroid_a - centroid_b)
-
-        # Average "radius" for normalization
-        if prim_a['type'] == 'circle':
-            radius_a = prim_a['radius']
-        elif prim_a['type'] == 'rectangle':
-            radius_a = (prim_a['width'] + prim_a['height']) / 4
-        elif prim_a['type'] == 'ellipse':
-            radius_a = (prim_a['major_axis'] + prim_a['minor_axis']) / 4
-        else:
-            radius_a = np.sqrt(area_a / np.pi)
-
-        if prim_b['type'] == 'circle':
-            radius_b = prim_b['radius']
-        elif prim_b['type'] == 'rectangle':
-            radius_b = (prim_b['width'] + prim_b['height']) / 4
-        elif prim_b['type'] == 'ellipse':
-            radius_b = (prim_b['major_axis'] + prim_b['minor_axis']) / 4
-        else:
-            radius_b = np.sqrt(area_b / np.pi)
+        if alignment is None:
+            centroid_a = seg_a['layers'][0]['centroid']
+            centroid_b = seg_b['layers'][0]['centroid']
+            centroid_dist = np.hypot(*(centroid_a - centroid_b))
+            avg_radius = (self._radius_proxy(prim_a, area_a) + self._radius_proxy(prim_b, area_b)) / 2
+            alignment = self.fuzzy_alignment(centroid_dist, avg_radius)
 
-        avg_radius = (radius_a + radius_b) / 2
-
-        alignment = self.fuzzy_alignment(centroid_dist, avg_radius)
+        # Size similarity (area ratio)
+        if size_match is None:
+            area_ratio = min(area_a, area_b) / max(area_a, area_b) if max(area_a, area_b) > 0 else 0
+            size_match = self.fuzzy_size_match(area_ratio)
 
         # Weighted fuzzy aggregation
-        size_match = self.fuzzy_size_match(area_ratio)
         merge_score = (
             0.40 * size_match +
             0.35 * shape_match +
@@ -613,27 +924,17 @@ class LayerWiseStacker:
             return layers  # Too few layers to filter
 
         # Calculate median area (representative of actual cross-section)
-        areas = [layer['area'] for layer in layers]
+        areas = np.fromiter((layer['area'] for layer in layers), dtype=np.float64, count=len(layers))
         median_area = np.median(areas)
 
         if median_area == 0:
             return layers  # Can't filter
 
-        # Find first stable layer (area > 10% of median)
-        start_idx = 0
+        # First and last stable layers (area > 10% of median)
         threshold = 0.10 * median_area
-
-        for i, layer in enumerate(layers):
-            if layer['area'] > threshold:
-                start_idx = i
-                break
-
-        # Find last stable layer (area > 10% of median)
-        end_idx = len(layers) - 1
-        for i in range(len(layers) - 1, -1, -1):
-            if layers[i]['area'] > threshold:
-                end_idx = i
-                break
+        stable = np.flatnonzero(areas > threshold)
+        start_idx = int(stable[0]) if len(stable) else 0
+        end_idx = int(stable[-1]) if len(stable) else len(layers) - 1
 
         # Only filter if we're actually removing artifacts (not cutting too much)
         if start_idx > len(layers) * 0.2 or (len(layers) - end_idx - 1) > len(layers) * 0.2:
@@ -648,6 +949,66 @@ class LayerWiseStacker:
 
         return filtered if len(filtered) > 0 else layers
 
+    @staticmethod
+    def _fit_key(layer: Dict[str, Any], hint: Optional[str] = None) -> Tuple[Any, Optional[str]]:
+        """
+        Memo key of a layer fit.
+
+        Layers from slice_mesh carry a geometric signature (rounded area,
+        centroid and vertex set); cross-sections with the same ring share
+        it and reuse one fit. Other layers are keyed by polygon.
+        """
+        return (layer.get('signature', id(layer['polygon'])), hint)
+
+    def _fit_layers(
+        self,
+        requests: List[Tuple[Dict[str, Any], Optional[str]]]
+    ) -> Dict[Tuple[int, Optional[str]], Dict[str, Any]]:
+        """
+        Fit primitives to many layers at once.
+
+        Layers are independent and the fitting runs mostly in GEOS/NumPy,
+        so the fits are spread over a thread pool. Shape metrics are
+        computed for all layers in one batch first and kept on the layer
+        dicts ('metrics', and the minimum rotated rectangle as 'obb').
+
+        Args:
+            requests: (layer, shape_hint) pairs to fit
+
+        Returns:
+            Fits keyed by _fit_key(layer, shape_hint); duplicate requests
+            (and layers with the same signature) are fitted once
+        """
+        unique = {}
+        for layer, hint in requests:
+            unique.setdefault(self._fit_key(layer, hint), (layer, hint))
+        keys = list(unique)
+
+        pending = {}
+        for layer, _ in requests:
+            if 'metrics' not in layer:
+                pending.setdefault(id(layer['polygon']), layer)
+        if pending:
+            batch, min_rects = self._batch_shape_metrics([layer['polygon'] for layer in pending.values()])
+            for layer, layer_metrics, min_rect in zip(pending.values(), batch, min_rects):
+                layer['metrics'] = layer_metrics
+                layer['obb'] = min_rect
+
+        def fit(key):
+            layer, hint = unique[key]
+            return self.classify_and_fit_2d(
+                layer['polygon'], hint, layer['metrics'], layer.get('coords'), layer.get('obb')
+            )
+
+        n_workers = max(1, min(self.max_workers or os.cpu_count() or 1, len(keys)))
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(fit, keys))
+        else:
+            results = [fit(key) for key in keys]
+
+        return dict(zip(keys, results))
+
     def group_similar_layers(
         self,
         layers: List[Dict[str, Any]],
@@ -676,25 +1037,67 @@ class LayerWiseStacker:
         segments = []
         current_segment_layers = [filtered_layers[0]]
 
-        # Classify first layer
-        shape_hint = None
-        if vision_results and len(vision_results) > 0:
-            shape_hint = vision_results[0].get('shape_detected')
+        # Vision hint of every layer
+        hints = [None] * len(filtered_layers)
+        if vision_results:
+            for i in range(min(len(filtered_layers), len(vision_results))):
+                hints[i] = vision_results[i].get('shape_detected')
+
+        # Segment representatives look their hint up by position in the
+        # unfiltered layer list (layer_id skips empty slices, so it is not
+        # a position); map layers to positions once instead of list.index
+        layer_positions = {}
+        if vision_results:
+            layer_positions = {id(layer): i for i, layer in enumerate(layers) if i < len(vision_results)}
+
+        def rep_hint(layer: Dict[str, Any]) -> Optional[str]:
+            position = layer_positions.get(id(layer))
+            if position is None:
+                return None
+            return vision_results[position].get('shape_detected')
+
+        # Fit every layer up front (hinted, and unhinted as the previous
+        # layer of a comparison); later fits of the same polygon and hint,
+        # e.g. segment representatives, are served from this table
+        fits = self._fit_layers(
+            list(zip(filtered_layers, hints)) +
+            [(layer, None) for layer in filtered_layers[:-1]]
+        )
 
-        first_primitive = self.classify_and_fit_2d(filtered_layers[0]['polygon'], shape_hint)
+        def fit_layer(layer: Dict[str, Any], hint: Optional[str] = None) -> Dict[str, Any]:
+            key = self._fit_key(layer, hint)
+            if key not in fits:
+                fits[key] = self.classify_and_fit_2d(
+                    layer['polygon'], hint, layer.get('metrics'), layer.get('coords'), layer.get('obb')
+                )
+            # Fits are shared by every layer with the same signature: hand
+            # out a shallow copy so annotating one segment's primitive does
+            # not touch the others
+            return dict(fits[key])
+
+        # Primitives of every layer (with its vision hint) and of every
+        # previous layer of a comparison (unhinted)
+        curr_primitives = [fit_layer(layer, hint) for layer, hint in zip(filtered_layers, hints)]
+        prev_primitives = [fit_layer(layer) for layer in filtered_layers[:-1]]
+
+        # Size similarity and centroid alignment of every consecutive pair
+        areas = np.fromiter((layer['area'] for layer in filtered_layers), dtype=np.float64, count=len(filtered_layers))
+        smaller = np.minimum(areas[:-1], areas[1:])
+        larger = np.maximum(areas[:-1], areas[1:])
+        area_ratios = np.divide(smaller, larger, out=np.zeros_like(smaller), where=larger > 0)
+        size_scores = self.fuzzy_size_match(area_ratios)
+
+        centroids = np.stack([layer['centroid'] for layer in filtered_layers])
+        centroid_dists = np.hypot(*np.diff(centroids, axis=0).T)
+        radii_prev = np.array([self._radius_proxy(prim, area) for prim, area in zip(prev_primitives, areas[:-1])])
+        radii_curr = np.array([self._radius_proxy(prim, area) for prim, area in zip(curr_primitives[1:], areas[1:])])
+        alignment_scores = self.fuzzy_alignment(centroid_dists, (radii_prev + radii_curr) / 2)
 
         for i in range(1, len(filtered_layers)):
             prev_layer = filtered_layers[i-1]
             curr_layer = filtered_layers[i]
-
-            # Get vision hint for current layer
-            shape_hint_curr = None
-            if vision_results and i < len(vision_results):
-                shape_hint_curr = vision_results[i].get('shape_detected')
-
-            # Fit primitive to current layer
-            curr_primitive = self.classify_and_fit_2d(curr_layer['polygon'], shape_hint_curr)
-            prev_primitive = self.classify_and_fit_2d(prev_layer['polygon'])
+            curr_primitive = curr_primitives[i]
+            prev_primitive = prev_primitives[i-1]
 
             # Create temporary segments for comparison
             temp_seg_prev = {
@@ -707,7 +1110,10 @@ class LayerWiseStacker:
             }
 
             # Fuzzy decision
-            should_merge, confidence, score = self.should_merge_segments(temp_seg_prev, temp_seg_curr)
+            should_merge, confidence, score = self.should_merge_segments(
+                temp_seg_prev, temp_seg_curr,
+                size_match=size_scores[i-1], alignment=alignment_scores[i-1]
+            )
 
             if should_merge:
                 # Continue current segment
@@ -718,13 +1124,7 @@ class LayerWiseStacker:
                 mid_idx = len(current_segment_layers) // 2
                 rep_layer = current_segment_layers[mid_idx]
 
-                shape_hint_rep = None
-                if vision_results:
-                    rep_vision_idx = layers.index(rep_layer)
-                    if rep_vision_idx < len(vision_results):
-                        shape_hint_rep = vision_results[rep_vision_idx].get('shape_detected')
-
-                segment_primitive = self.classify_and_fit_2d(rep_layer['polygon'], shape_hint_rep)
+                segment_primitive = fit_layer(rep_layer, rep_hint(rep_layer))
 
                 # Calculate proper height including layer thickness
                 z_start = current_segment_layers[0]['z_height']
@@ -751,13 +1151,7 @@ class LayerWiseStacker:
             mid_idx = len(current_segment_layers) // 2
             rep_layer = current_segment_layers[mid_idx]
 
-            shape_hint_final = None
-            if vision_results:
-                final_vision_idx = layers.index(rep_layer)
-                if final_vision_idx < len(vision_results):
-                    shape_hint_final = vision_results[final_vision_idx].get('shape_detected')
-
-            segment_primitive = self.classify_and_fit_2d(rep_layer['polygon'], shape_hint_final)
+            segment_primitive = fit_layer(rep_layer, rep_hint(rep_layer))
 
             # Calculate proper height including layer thickness
             z_start = current_segment_layers[0]['z_height']
@@ -777,105 +1171,77 @@ class LayerWiseStacker:
             })
 
         # Post-process: Merge segments shorter than min_segment_height
-        # with adjacent compatible segments
-        merged = True
-        iteration = 0
-        max_iterations = 10  # Prevent infinite loops
-
-        while merged and iteration < max_iterations:
-            merged = False
-            iteration += 1
-            new_segments = []
-            i = 0
-
-            while i < len(segments):
-                seg = segments[i]
-
-                # If segment is too short, try to merge with neighbors
-                if seg['height'] < self.min_segment_height:
-                    merged_this = False
-
-                    # Try merging with next segment
-                    if i < len(segments) - 1:
-                        next_seg = segments[i + 1]
-                        should_merge, _, _ = self.should_merge_segments(
-                            {'primitive_2d': seg['primitive_2d'], 'layers': seg['layers']},
-                            {'primitive_2d': next_seg['primitive_2d'], 'layers': next_seg['layers']}
-                        )
+        # with adjacent compatible segments in one sweep. A merged segment
+        # goes back to the front of the queue, so it keeps absorbing
+        # neighbours while it is still short
+        def compatible(seg_a: Dict[str, Any], seg_b: Dict[str, Any]) -> bool:
+            should_merge, _, _ = self.should_merge_segments(seg_a, seg_b)
+            return should_merge or seg_a['shape'] == seg_b['shape']
+
+        def combine(seg_a: Dict[str, Any], seg_b: Dict[str, Any]) -> Dict[str, Any]:
+            combined_layers = seg_a['layers'] + seg_b['layers']
+            mid_idx = len(combined_layers) // 2
+            combined_primitive = fit_layer(combined_layers[mid_idx])
+
+            z_start = combined_layers[0]['z_height']
+            z_end = combined_layers[-1]['z_height']
+            height = (z_end - z_start) + self.layer_height
 
-                        if should_merge or seg['shape'] == next_seg['shape']:
-                            # Merge with next
-                            combined_layers = seg['layers'] + next_seg['layers']
-                            mid_idx = len(combined_layers) // 2
-                            rep_layer = combined_layers[mid_idx]
-                            combined_primitive = self.classify_and_fit_2d(rep_layer['polygon'])
-
-                            z_start = combined_layers[0]['z_height']
-                            z_end = combined_layers[-1]['z_height']
-                            height = (z_end - z_start) + self.layer_height
-
-                            new_segments.append({
-                                'z_start': z_start,
-                                'z_end': z_end,
-                                'height': height,
-                                'num_layers': len(combined_layers),
-                                'layers': combined_layers,
-                                'primitive_2d': combined_primitive,
-                                'shape': combined_primitive['type']
-                            })
-                            i += 2  # Skip both current and next
-                            merged = True
-                            merged_this = True
-
-                    # Try merging with previous segment if not merged yet
-                    if not merged_this and len(new_segments) > 0:
-                        prev_seg = new_segments[-1]
-                        should_merge, _, _ = self.should_merge_segments(
-                            {'primitive_2d': prev_seg['primitive_2d'], 'layers': prev_seg['layers']},
-                            {'primitive_2d': seg['primitive_2d'], 'layers': seg['layers']}
-                        )
+            return {
+                'z_start': z_start,
+                'z_end': z_end,
+                'height': height,
+                'num_layers': len(combined_layers),
+                'layers': combined_layers,
+                'primitive_2d': combined_primitive,
+                'shape': combined_primitive['type']
+            }
 
-                        if should_merge or prev_seg['shape'] == seg['shape']:
-                            # Merge with previous
-                            combined_layers = prev_seg['layers'] + seg['layers']
-                            mid_idx = len(combined_layers) // 2
-                            rep_layer = combined_layers[mid_idx]
-                            combined_primitive = self.classify_and_fit_2d(rep_layer['polygon'])
-
-                            z_start = combined_layers[0]['z_height']
-                            z_end = combined_layers[-1]['z_height']
-                            height = (z_end - z_start) + self.layer_height
-
-                            # Replace previous segment
-                            new_segments[-1] = {
-                                'z_start': z_start,
-                                'z_end': z_end,
-                                'height': height,
-                                'num_layers': len(combined_layers),
-                                'layers': combined_layers,
-                                'primitive_2d': combined_primitive,
-                                'shape': combined_primitive['type']
-                            }
-                            i += 1
-                            merged = True
-                            merged_this = True
-
-                    if not merged_this:
-                        # Couldn't merge, keep as-is
-                        new_segments.append(seg)
-                        i += 1
-                else:
-                    # Segment is long enough, keep it
-                    new_segments.append(seg)
-                    i += 1
+        pending = segments[::-1]  # Next segment at the end
+        merged_segments = []
+        num_merges = 0
 
-            segments = new_segments
+        while pending:
+            seg = pending.pop()
 
-        if self.verbose and iteration > 1:
-            print(f"  Merged short segments in {iteration} iteration(s): {len(segments)} final segments")
+            # If segment is too short, try to merge with next, then previous
+            if seg['height'] < self.min_segment_height:
+                if pending and compatible(seg, pending[-1]):
+                    pending.append(combine(seg, pending.pop()))
+                    num_merges += 1
+                    continue
+
+                if merged_segments and compatible(merged_segments[-1], seg):
+                    pending.append(combine(merged_segments.pop(), seg))
+                    num_merges += 1
+                    continue
+
+            merged_segments.append(seg)
+
+        segments = merged_segments
+
+        if self.verbose and num_merges:
+            print(f"  Merged {num_merges} short segment(s): {len(segments)} final segments")
 
         return segments
 
+    def _unit_cylinder(self, sections: int = 32) -> trimesh.Trimesh:
+        """Radius-1, height-1 cylinder template (built once per section count)."""
+        template = self._cylinder_templates.get(sections)
+        if template is None:
+            template = trimesh.creation.cylinder(radius=1.0, height=1.0, sections=sections)
+            self._cylinder_templates[sections] = template
+        return template
+
+    def _adaptive_sections(self, radius: float) -> int:
+        """
+        Cylinder section count for a radius.
+
+        Aims for rim chords about one layer height long, clamped to 12-32
+        sections, so small bosses and pins get coarser meshes.
+        """
+        return int(np.clip(2 * np.pi * radius / self.layer_height, 12, 32))
+
     def extrude_segment(
         self,
         segment: Dict[str, Any],
@@ -897,28 +1263,25 @@ class LayerWiseStacker:
         height = segment['height']
         z_center = (segment['z_start'] + segment['z_end']) / 2
 
+        # (u, v, axis) coordinates → world order, and the rotation that
+        # stands a Z extrusion along the slicing axis
+        perm = AXIS_PERMUTATIONS.get(axis_name, AXIS_PERMUTATIONS['X'])
+        rot_axis = EXTRUSION_ROTATION_AXES.get(axis_name, EXTRUSION_ROTATION_AXES['X'])
+
         try:
             if prim_2d['type'] == 'circle':
                 # Circle → Cylinder
                 radius = prim_2d['radius']
-                cylinder = trimesh.creation.cylinder(
-                    radius=radius,
-                    height=height,
-                    sections=32
-                )
 
                 # Position at correct height
                 center_2d = prim_2d['center']
 
-                # Translate based on axis
-                if axis_name == 'Z':
-                    translation = [center_2d[0], center_2d[1], z_center]
-                elif axis_name == 'Y':
-                    translation = [center_2d[0], z_center, center_2d[1]]
-                else:  # X
-                    translation = [z_center, center_2d[0], center_2d[1]]
+                # Scale the unit cylinder and translate based on axis
+                transform = np.diag([radius, radius, height, 1.0])
+                transform[:3, 3] = np.array([center_2d[0], center_2d[1], z_center])[perm]
 
-                cylinder.apply_translation(translation)
+                cylinder = self._unit_cylinder(self._adaptive_sections(radius)).copy()
+                cylinder.apply_transform(transform)
                 return cylinder
 
             elif prim_2d['type'] == 'rectangle':
@@ -948,53 +1311,39 @@ class LayerWiseStacker:
                             height=height
                         )
 
-                        # Position based on axis
-                        if axis_name == 'Z':
-                            translation = [0, 0, z_center - height/2]
-                        elif axis_name == 'Y':
-                            # Rotate to align with Y axis
-                            rotation = trimesh.transformations.rotation_matrix(
-                                np.pi/2, [1, 0, 0]
-                            )
-                            extruded.apply_transform(rotation)
-                            translation = [0, z_center, 0]
-                        else:  # X
-                            # Rotate to align with X axis
-                            rotation = trimesh.transformations.rotation_matrix(
-                                np.pi/2, [0, 1, 0]
+                        # Position based on axis (extrude_polygon spans
+                        # 0..height along Z; other axes rotate it into place)
+                        if rot_axis is None:
+                            transform = np.eye(4)
+                            transform[:3, 3] = [0, 0, z_center - height/2]
+                        else:
+                            transform = trimesh.transformations.rotation_matrix(
+                                np.pi/2, rot_axis
                             )
-                            extruded.apply_transform(rotation)
-                            translation = [z_center, 0, 0]
+                            transform[:3, 3] = np.array([0, 0, z_center])[perm]
 
-                        extruded.apply_translation(translation)
+                        extruded.apply_transform(transform)
                         return extruded
 
                 # High rectangularity - use solid box primitive
                 width = prim_2d['width']
                 depth = prim_2d['height']
 
-                box = trimesh.creation.box(extents=[width, depth, height])
-
                 # Position and rotate
                 center_2d = prim_2d['center']
                 rotation_angle = np.radians(prim_2d['rotation'])
 
-                # Apply rotation around Z-axis (in 2D plane)
+                # Scale the unit box, rotate around Z-axis (in 2D plane) and
+                # translate based on axis, all in one transform
                 rotation_matrix = trimesh.transformations.rotation_matrix(
                     rotation_angle,
                     [0, 0, 1]
                 )
-                box.apply_transform(rotation_matrix)
+                transform = rotation_matrix @ np.diag([width, depth, height, 1.0])
+                transform[:3, 3] = np.array([center_2d[0], center_2d[1], z_center])[perm]
 
-                # Translate based on axis
-                if axis_name == 'Z':
-                    translation = [center_2d[0], center_2d[1], z_center]
-                elif axis_name == 'Y':
-                    translation = [center_2d[0], z_center, center_2d[1]]
-                else:  # X
-                    translation = [z_center, center_2d[0], center_2d[1]]
-
-                box.apply_translation(translation)
+                box = self._unit_box.copy()
+                box.apply_transform(transform)
                 return box
 
             elif prim_2d['type'] == 'ellipse':
@@ -1002,38 +1351,20 @@ class LayerWiseStacker:
                 major = prim_2d['major_axis'] / 2
                 minor = prim_2d['minor_axis'] / 2
 
-                # Create cylinder with radius = average
-                avg_radius = (major + minor) / 2
-                cylinder = trimesh.creation.cylinder(
-                    radius=avg_radius,
-                    height=height,
-                    sections=32
-                )
-
-                # Scale to ellipse
-                scale_x = major / avg_radius
-                scale_y = minor / avg_radius
-                scale_matrix = np.diag([scale_x, scale_y, 1.0, 1.0])
-                cylinder.apply_transform(scale_matrix)
-
-                # Rotate
+                # Scale the unit cylinder to the ellipse, rotate and
+                # translate, all in one transform
                 rotation_angle = np.radians(prim_2d['rotation'])
                 rotation_matrix = trimesh.transformations.rotation_matrix(
                     rotation_angle,
                     [0, 0, 1]
                 )
-                cylinder.apply_transform(rotation_matrix)
+                transform = rotation_matrix @ np.diag([major, minor, height, 1.0])
 
-                # Translate
                 center_2d = prim_2d['center']
-                if axis_name == 'Z':
-                    translation = [center_2d[0], center_2d[1], z_center]
-                elif axis_name == 'Y':
-                    translation = [center_2d[0], z_center, center_2d[1]]
-                else:  # X
-                    translation = [z_center, center_2d[0], center_2d[1]]
-
-                cylinder.apply_translation(translation)
+                transform[:3, 3] = np.array([center_2d[0], center_2d[1], z_center])[perm]
+
+                cylinder = self._unit_cylinder(self._adaptive_sections((major + minor) / 2)).copy()
+                cylinder.apply_transform(transform)
                 return cylinder
 
             else:
@@ -1075,7 +1406,22 @@ class LayerWiseStacker:
             if self.verbose:
                 print(f"  🔗 Concatenating {len(primitives)} primitives...")
 
-            combined = trimesh.util.concatenate(primitives)
+            # One preallocated vertex/face buffer; the primitives are already
+            # clean, so skip trimesh's merge/visual/metadata handling
+            n_vertices = sum(len(p.vertices) for p in primitives)
+            n_faces = sum(len(p.faces) for p in primitives)
+            vertices = np.empty((n_vertices, 3), dtype=np.float64)
+            faces = np.empty((n_faces, 3), dtype=np.int64)
+
+            vertex_offset = face_offset = 0
+            for primitive in primitives:
+                nv, nf = len(primitive.vertices), len(primitive.faces)
+                vertices[vertex_offset:vertex_offset + nv] = primitive.vertices
+                faces[face_offset:face_offset + nf] = primitive.faces + vertex_offset
+                vertex_offset += nv
+                face_offset += nf
+
+            combined = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
 
             # Validate result
             if self.verbose:
@@ -1108,8 +1454,8 @@ class LayerWiseStacker:
         """
         try:
             # Volume error
-            vol_orig = original.volume
-            vol_recon = reconstructed.volume
+            vol_orig = _mesh_volume(original)
+            vol_recon = _mesh_volume(reconstructed)
             vol_error = abs(vol_orig - vol_recon) / vol_orig if vol_orig > 0 else 1.0
 
             # Simplified quality: 1 - volume_error
@@ -1179,14 +1525,21 @@ class LayerWiseStacker:
         if self.verbose:
             print(f"\n⬆️  Extruding segments to 3D primitives...")
 
+        # Segments are independent; only worth a pool for longer stacks
+        n_workers = max(1, min(self.max_workers or os.cpu_count() or 1, len(segments)))
+        if n_workers > 1 and len(segments) >= 4:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                extruded = list(executor.map(lambda seg: self.extrude_segment(seg, axis, axis_name), segments))
+        else:
+            extruded = [self.extrude_segment(segment, axis, axis_name) for segment in segments]
+
         primitives = []
-        for i, segment in enumerate(segments):
-            primitive_3d = self.extrude_segment(segment, axis, axis_name)
+        for i, (segment, primitive_3d) in enumerate(zip(segments, extruded)):
             if primitive_3d is not None:
                 primitives.append(primitive_3d)
                 segment['primitive_3d'] = primitive_3d
                 if self.verbose:
-                    print(f"  ✅ Segment {i+1} extruded: {segment['shape']} (V={primitive_3d.volume:.1f}mm³)")
+                    print(f"  ✅ Segment {i+1} extruded: {segment['shape']} (V={_mesh_volume(primitive_3d):.1f}mm³)")
             else:
                 if self.verbose:
                     print(f"  ❌ Segment {i+1} extrusion failed")
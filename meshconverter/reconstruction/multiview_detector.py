@@ -8,6 +8,9 @@ from clean contours instead of noisy mesh cross-sections.
 This provides significantly better accuracy than direct mesh slicing.
 """
 
+import hashlib
+from collections import OrderedDict
+
 import trimesh
 import numpy as np
 import cv2
@@ -39,15 +42,22 @@ class MultiViewPrimitiveDetector:
     5. Return best-fit primitives for 3D reconstruction
     """
 
-    def __init__(self, image_size: int = 512, verbose: bool = True):
+    def __init__(self, image_size: int = 512, verbose: bool = True, cache_size: int = 32):
         """
         Args:
             image_size: Resolution for rendered views (pixels)
             verbose: Print progress messages
+            cache_size: Number of renders (and of contours) memoized
         """
         self.image_size = image_size
         self.verbose = verbose
 
+        # Memoized renders keyed by (hash(mesh), azimuth, elevation, image_size)
+        # and contours keyed by image digest (LRU); see clear_cache()
+        self.cache_size = cache_size
+        self._render_cache: "OrderedDict[Tuple[int, float, float, int], np.ndarray]" = OrderedDict()
+        self._contour_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
         # Define 3 orthogonal views
         self.orthogonal_views = [
             View2D(name='top', azimuth=0, elevation=90, axis='Z'),      # Looking down Z axis (XY plane)
@@ -55,6 +65,32 @@ class MultiViewPrimitiveDetector:
             View2D(name='side', azimuth=90, elevation=0, axis='X'),     # Looking along X axis (YZ plane)
         ]
 
+    def clear_cache(self) -> None:
+        """
+        Drop memoized renders and contours.
+
+        Renders are keyed by the mesh's content hash, so a modified mesh
+        is rendered again without this; it only frees the memory.
+        """
+        self._render_cache.clear()
+        self._contour_cache.clear()
+
+    def _cached(self, cache: OrderedDict, key: Any) -> Optional[np.ndarray]:
+        """Return a memoized render or contour, or None."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _store(self, cache: OrderedDict, key: Any, value: np.ndarray) -> None:
+        """Memoize a render or contour, evicting the least recently used entry."""
+        if self.cache_size <= 0:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
     def render_view(
         self,
         mesh: trimesh.Trimesh,
@@ -64,6 +100,8 @@ class MultiViewPrimitiveDetector:
         """
         Render mesh from a specific viewpoint to binary image.
 
+        Repeated views of the same mesh are served from the render cache.
+
         Args:
             mesh: Input mesh
             azimuth: Rotation around Z axis (degrees)
@@ -72,23 +110,76 @@ class MultiViewPrimitiveDetector:
         Returns:
             Binary image (0 or 255)
         """
+        key = (hash(mesh), float(azimuth), float(elevation), self.image_size)
+        img = self._cached(self._render_cache, key)
+        if img is None:
+            img = self._render_view(mesh, azimuth, elevation)
+            self._store(self._render_cache, key, img)
+        return img
+
+    def render_views_batched(
+        self,
+        mesh: trimesh.Trimesh,
+        views: List[Tuple[float, float]]
+    ) -> List[np.ndarray]:
+        """
+        Render several viewpoints of one mesh.
+
+        Vertices and faces are fetched once and rotated per view (no mesh
+        copy per view); views already in the render cache are reused.
+
+        Args:
+            mesh: Input mesh
+            views: (azimuth, elevation) pairs in degrees
+
+        Returns:
+            Binary images (0 or 255), one per view
+        """
+        vertices = mesh.vertices
+        faces = mesh.faces
+        mesh_key = hash(mesh)
+
+        images = []
+        for azimuth, elevation in views:
+            key = (mesh_key, float(azimuth), float(elevation), self.image_size)
+            img = self._cached(self._render_cache, key)
+            if img is None:
+                img = self._rasterize(vertices, faces, azimuth, elevation)
+                self._store(self._render_cache, key, img)
+            images.append(img)
+        return images
+
+    def _render_view(
+        self,
+        mesh: trimesh.Trimesh,
+        azimuth: float,
+        elevation: float
+    ) -> np.ndarray:
+        """Rasterize one view (uncached; see render_view)."""
+        return self._rasterize(mesh.vertices, mesh.faces, azimuth, elevation)
+
+    def _rasterize(
+        self,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        azimuth: float,
+        elevation: float
+    ) -> np.ndarray:
+        """Rotate vertices into the view and fill every triangle."""
         # Create rotation matrix
         az_rad = np.radians(azimuth)
         el_rad = np.radians(elevation)
 
-        # Rotate mesh
-        mesh_copy = mesh.copy()
-
         # Rotate around Z (azimuth)
         rot_z = trimesh.transformations.rotation_matrix(az_rad, [0, 0, 1])
-        mesh_copy.apply_transform(rot_z)
+        rotated = trimesh.transformations.transform_points(vertices, rot_z)
 
         # Rotate around X (elevation)
         rot_x = trimesh.transformations.rotation_matrix(el_rad, [1, 0, 0])
-        mesh_copy.apply_transform(rot_x)
+        rotated = trimesh.transformations.transform_points(rotated, rot_x)
 
         # Project to 2D (orthographic projection - just drop Z coordinate)
-        vertices_2d = mesh_copy.vertices[:, :2]  # Take X, Y only
+        vertices_2d = rotated[:, :2]  # Take X, Y only
 
         # Normalize to image space
         min_coords = vertices_2d.min(axis=0)
@@ -109,7 +200,7 @@ class MultiViewPrimitiveDetector:
         # Create binary image by drawing filled triangles
         img = np.zeros((self.image_size, self.image_size), dtype=np.uint8)
 
-        for face in mesh_copy.faces:
+        for face in faces:
             pts = vertices_pixels[face]
             cv2.fillConvexPoly(img, pts, 255)
 
@@ -125,6 +216,15 @@ class MultiViewPrimitiveDetector:
         Returns:
             Array of contour points (Nx2)
         """
+        key = hashlib.blake2b(binary_image.tobytes(), digest_size=16).digest() + repr(binary_image.shape).encode()
+        points = self._cached(self._contour_cache, key)
+        if points is None:
+            points = self._extract_contour_points(binary_image)
+            self._store(self._contour_cache, key, points)
+        return points
+
+    def _extract_contour_points(self, binary_image: np.ndarray) -> np.ndarray:
+        """Find and simplify the largest contour (uncached; see extract_contour_points)."""
         # Find contours
         contours, _ = cv2.findContours(
             binary_image,
@@ -11,8 +11,11 @@ Integrates GPT-4 Vision with layer-by-layer mesh reconstruction to:
 import trimesh
 import numpy as np
 import base64
+import hashlib
 import io
 import os
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple, Optional
 from PIL import Image, ImageDraw
 import json
@@ -28,12 +31,20 @@ except ImportError:
 class VisionLayerAnalyzer:
     """Analyze 2D layer cross-sections using GPT-4 Vision for outlier detection."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        image_detail: str = 'low',
+        cache_size: int = 128
+    ):
         """
         Initialize vision layer analyzer.
 
         Args:
             api_key: OpenAI API key (or set OPENAI_API_KEY env var)
+            image_detail: OpenAI image detail level for layer images ('low' or 'high').
+                'low' sends one 512px tile, which fits the rendered section.
+            cache_size: Number of layer results memoized by rendered-image hash
 
         Raises:
             ImportError: If openai package not installed
@@ -47,6 +58,31 @@ class VisionLayerAnalyzer:
             raise ValueError("OpenAI API key required (set OPENAI_API_KEY or pass api_key)")
 
         self.client = OpenAI(api_key=self.api_key)
+        self.image_detail = image_detail
+
+        # Rendered-image hash -> layer result (LRU, shared across worker threads)
+        self.cache_size = cache_size
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached_result(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of a memoized layer result, or None."""
+        with self._cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+            return dict(result)
+
+    def _store_result(self, key: bytes, result: Dict[str, Any]) -> None:
+        """Memoize a layer result, evicting the least recently used entry."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._result_cache[key] = dict(result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
 
     def render_2d_section_to_image(
         self,
@@ -166,6 +202,14 @@ class VisionLayerAnalyzer:
                 'reasoning': f'Render error: {str(e)}'
             }
 
+        # Identical renders (e.g. extruded shapes) reuse the earlier answer
+        cache_key = hashlib.blake2b(img_bytes, digest_size=16).digest()
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            if verbose:
+                print(f"    ♻️  Reusing result for identical layer image")
+            return cached
+
         # Encode to base64
         b64_img = base64.b64encode(img_bytes).decode('utf-8')
 
@@ -211,7 +255,7 @@ Return ONLY valid JSON, no other text."""
                             "type": "image_url",
                             "image_url": {
                                 "url": f"data:image/png;base64,{b64_img}",
-                                "detail": "high"
+                                "detail": self.image_detail
                             }
                         }
                     ]
@@ -238,6 +282,7 @@ Return ONLY valid JSON, no other text."""
                         conf = result.get('confidence', 0)
                         print(f"    ✅ Shape: {shape}, Outliers: {outlier_status} ({outlier_pct:.1f}%), Confidence: {conf}%")
 
+                    self._store_result(cache_key, result)
                     return result
 
                 except json.JSONDecodeError as e:
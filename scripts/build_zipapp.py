@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Build a single-file `mc.pyz` zipapp for the MeshConverter CLI.
+
+The zipapp bundles the packages the CLI imports (meshconverter, core,
+detection, primitives, validation) together with precompiled bytecode and
+an explicit `__main__.py` that imports only `meshconverter.cli:main`.
+Cold start then opens one zip file instead of stat-ing every package
+directory on sys.path.
+
+Third-party dependencies (trimesh, numpy, ...) are NOT bundled; they are
+resolved from the interpreter's site-packages as usual. The source-install
+path (`pip install -e .` + `mc`) is unchanged for development.
+
+Usage:
+    python scripts/build_zipapp.py                  # writes ./mc.pyz
+    python scripts/build_zipapp.py -o dist/mc.pyz
+    ./mc.pyz input.stl --classifier heuristic
+"""
+
+import argparse
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Packages imported (directly or transitively) by meshconverter.cli
+BUNDLED_PACKAGES = ['meshconverter', 'core', 'detection', 'primitives', 'validation']
+
+# Explicit entry point: skips zipapp's generated `-m` shim and any
+# package discovery beyond the single import below.
+MAIN_PY = '''\
+import sys
+from meshconverter.cli import main
+
+sys.exit(main())
+'''
+
+
+def stage_sources(staging_dir: Path) -> None:
+    """
+    Copy bundled packages into the staging directory.
+
+    Args:
+        staging_dir: Empty directory that becomes the zipapp root
+    """
+    ignore = shutil.ignore_patterns('__pycache__', '*.pyc', '*.pyo')
+    for package in BUNDLED_PACKAGES:
+        shutil.copytree(PROJECT_ROOT / package, staging_dir / package, ignore=ignore)
+
+    (staging_dir / '__main__.py').write_text(MAIN_PY)
+
+
+def build_zipapp(
+    output: Path,
+    interpreter: str = '/usr/bin/env python3',
+    compress: bool = False
+) -> Path:
+    """
+    Build the `mc.pyz` archive.
+
+    Args:
+        output: Destination .pyz path
+        interpreter: Shebang interpreter line
+        compress: Deflate archive members (smaller file, slower start)
+
+    Returns:
+        Path to the written archive
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix='mc_pyz_') as tmp:
+        staging_dir = Path(tmp)
+        stage_sources(staging_dir)
+
+        # Unchecked-hash pycs stay valid after being zipped (mtime is lost)
+        compileall.compile_dir(
+            str(staging_dir),
+            ddir=str(output),
+            quiet=1,
+            legacy=True,
+            invalidation_mode=compileall.py_compile.PycInvalidationMode.UNCHECKED_HASH
+        )
+
+        zipapp.create_archive(
+            staging_dir,
+            target=output,
+            interpreter=interpreter,
+            compressed=compress
+        )
+
+    return output
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build a single-file mc.pyz zipapp")
+    parser.add_argument('-o', '--output', default='mc.pyz', help='Output path (default: ./mc.pyz)')
+    parser.add_argument('-p', '--python', default='/usr/bin/env python3',
+                        help='Interpreter shebang (default: /usr/bin/env python3)')
+    parser.add_argument('--compress', action='store_true', help='Compress archive members')
+    args = parser.parse_args()
+
+    output = build_zipapp(Path(args.output), interpreter=args.python, compress=args.compress)
+    size_kb = output.stat().st_size / 1024
+    print(f"✅ Built {output} ({size_kb:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Lightweight client for the MeshConverter daemon (`mc --daemon`).
+
+Imports only the standard library, so start-up costs a few milliseconds
+instead of loading trimesh/numpy/scikit-learn on every call. If no daemon is
+running, one is spawned in the background (it exits after --idle-timeout
+minutes without requests).
+
+Usage:
+    python scripts/mc_client.py input.stl
+    python scripts/mc_client.py input.stl --classifier heuristic -o out/
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SOCKET_PATH = Path.home() / '.cache' / 'meshconverter' / 'daemon.sock'
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# How long to wait for a freshly spawned daemon to bind its socket
+SPAWN_TIMEOUT_S = 30.0
+
+
+def connect(socket_path: Path = SOCKET_PATH) -> socket.socket:
+    """Connect to a running daemon (raises OSError if none is listening)."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def spawn_daemon() -> None:
+    """Start `mc --daemon` detached from this process."""
+    subprocess.Popen(
+        [sys.executable, '-m', 'meshconverter.cli', '--daemon'],
+        cwd=str(PROJECT_ROOT),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def connect_or_spawn(socket_path: Path = SOCKET_PATH) -> socket.socket:
+    """Connect to the daemon, spawning it first if needed."""
+    try:
+        return connect(socket_path)
+    except OSError:
+        pass
+
+    spawn_daemon()
+    deadline = time.monotonic() + SPAWN_TIMEOUT_S
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        try:
+            return connect(socket_path)
+        except OSError:
+            continue
+
+    raise OSError(f"daemon did not start within {SPAWN_TIMEOUT_S:.0f}s")
+
+
+def main() -> int:
+    """Forward argv to the daemon and print its captured output."""
+    request = {'argv': sys.argv[1:], 'cwd': os.getcwd()}
+
+    try:
+        sock = connect_or_spawn()
+    except OSError as e:
+        print(f"❌ Error: could not reach MeshConverter daemon: {e}", file=sys.stderr)
+        return 1
+
+    with sock:
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    response = json.loads(b''.join(chunks))
+    sys.stdout.write(response.get('output', ''))
+    return int(response.get('exit_code', 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
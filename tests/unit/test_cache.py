@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the on-disk result cache.
+"""
+
+import pytest
+import numpy as np
+import trimesh
+
+from meshconverter import cache, cli
+
+
+class TestResultCache:
+    """Test cache keys and result round trips."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary directory."""
+        monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path / 'cache')
+        return tmp_path / 'cache'
+
+    @pytest.fixture
+    def box_path(self, tmp_path):
+        """Path to a 10x20x30 box STL."""
+        path = tmp_path / 'box.stl'
+        trimesh.creation.box((10, 20, 30)).export(str(path))
+        return str(path)
+
+    def test_key_includes_package_version(self, monkeypatch):
+        """Test results of another release are never reused."""
+        current = cache.cache_path('abc', 'voxel', 1.0)
+        monkeypatch.setattr(cache, '__version__', '0.0.1')
+
+        assert cache.cache_path('abc', 'voxel', 1.0) != current
+
+    def test_key_depends_on_content(self, tmp_path, box_path):
+        """Test the digest follows file content, not file name."""
+        copy = tmp_path / 'copy.stl'
+        copy.write_bytes(open(box_path, 'rb').read())
+
+        assert cache.file_digest(box_path) == cache.file_digest(str(copy))
+
+    def test_save_load_round_trip(self):
+        """Test NumPy values round-trip and non-JSON values are dropped."""
+        path = cache.cache_path('abc', 'heuristic')
+        result = {
+            'shape_type': 'box',
+            'confidence': np.int64(90),
+            'center': np.array([1.0, 2.0, 3.0]),
+            'mesh': trimesh.creation.box(),
+        }
+
+        assert cache.save_result(path, result)
+        loaded = cache.load_result(path)
+
+        assert loaded == {'shape_type': 'box', 'confidence': 90, 'center': [1.0, 2.0, 3.0]}
+
+    def test_load_missing(self):
+        """Test a missing entry loads as None."""
+        assert cache.load_result(cache.cache_path('missing')) is None
+
+    def test_cli_reuses_cached_classification(self, tmp_path, box_path, monkeypatch, capsys):
+        """Test a second CLI run is served from the cache."""
+        args = cli.build_parser().parse_args([box_path, '-c', 'heuristic', '-o', str(tmp_path / 'out')])
+        cli.run(args)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("classifier ran despite a cached result")
+
+        monkeypatch.setattr(cli, 'classify_mesh', fail)
+        capsys.readouterr()
+        cli.run(args)
+
+        output = capsys.readouterr().out
+        assert 'Using cached classification' in output
+        assert 'Shape: BOX' in output
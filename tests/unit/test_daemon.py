@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent worker (`mc --daemon`).
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+import trimesh
+
+from meshconverter import cache, daemon
+
+
+def _request(socket_path, payload: bytes) -> dict:
+    """Send one raw request and read the JSON response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(payload)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks))
+
+
+class TestDaemon:
+    """Test serving CLI requests over the unix socket."""
+
+    @pytest.fixture
+    def socket_path(self, tmp_path, monkeypatch):
+        """Running daemon on a temporary socket (short idle timeout)."""
+        monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path / 'cache')
+        monkeypatch.setattr(daemon, 'REQUEST_TIMEOUT_S', 0.5)
+        path = tmp_path / 'd.sock'
+
+        server = threading.Thread(
+            target=daemon.serve,
+            kwargs={'socket_path': path, 'idle_timeout': 2.0, 'verbose': False}
+        )
+        server.start()
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        yield path
+        server.join()
+
+    def test_classify_request(self, tmp_path, socket_path):
+        """Test one request runs the CLI in-process and returns its output."""
+        mesh_path = tmp_path / 'box.stl'
+        trimesh.creation.box((10, 20, 30)).export(str(mesh_path))
+        request = {'argv': ['box.stl', '-c', 'heuristic', '-o', 'out'], 'cwd': str(tmp_path)}
+
+        response = _request(socket_path, json.dumps(request).encode('utf-8') + b'\n')
+
+        assert response['exit_code'] == 0
+        assert 'Shape: BOX' in response['output']
+        assert (tmp_path / 'out').is_dir()
+
+    def test_second_daemon_leaves_socket(self, socket_path):
+        """Test a second daemon returns without taking over the socket."""
+        daemon.serve(socket_path=socket_path, idle_timeout=1.0, verbose=False)
+
+        response = _request(socket_path, json.dumps({'argv': []}).encode('utf-8') + b'\n')
+        assert response['exit_code'] == 2
+
+    def test_silent_client_times_out(self, socket_path):
+        """Test a client that never sends a request does not block others."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(socket_path))
+
+            response = _request(socket_path, json.dumps({'argv': []}).encode('utf-8') + b'\n')
+
+        assert response['exit_code'] == 2
+
+    @pytest.mark.parametrize("payload", [
+        b'not json\n',
+        b'[]\n',
+        b'"x"\n',
+        b'{"argv": "box.stl"}\n',
+        b'{"argv": [1]}\n',
+        b'{"argv": ["box.stl"], "cwd": 1}\n',
+    ])
+    def test_malformed_request(self, socket_path, payload):
+        """Test a malformed request gets a bad-request reply and the daemon keeps serving."""
+        response = _request(socket_path, payload)
+
+        assert response['exit_code'] == 2
+        assert 'bad request' in response['output']
+        assert socket_path.exists()
+        assert _request(socket_path, b'{"argv": []}\n')['exit_code'] == 2
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hybrid reconstruction helpers.
+"""
+
+import pytest
+import numpy as np
+import trimesh
+
+from meshconverter.reconstruction.hybrid_reconstructor import (
+    HybridReconstructor,
+    _build_extruded_mesh_loops,
+    _build_extruded_mesh_numpy,
+)
+
+
+class TestExtrudedMesh:
+    """Test polygon extrusion into a closed mesh."""
+
+    @pytest.fixture
+    def l_shape(self):
+        """Counter-clockwise L-shaped contour and its earcut triangles."""
+        earcut = pytest.importorskip("mapbox_earcut")
+        contour = np.array(
+            [[0, 0], [20, 0], [20, 5], [5, 5], [5, 15], [0, 15]], dtype=np.float32
+        )
+        triangles = earcut.triangulate_float32(contour, np.array([len(contour)], dtype=np.uint32))
+        return contour, np.asarray(triangles, dtype=np.int64)
+
+    @pytest.mark.parametrize("build", [_build_extruded_mesh_loops, _build_extruded_mesh_numpy])
+    @pytest.mark.parametrize("clockwise", [False, True])
+    def test_extrusion_is_watertight(self, l_shape, build, clockwise):
+        """Test the extrusion is closed with outward normals for either ring orientation."""
+        contour, triangles = l_shape
+        if clockwise:
+            contour = contour[::-1].copy()
+            earcut = pytest.importorskip("mapbox_earcut")
+            triangles = np.asarray(
+                earcut.triangulate_float32(contour, np.array([len(contour)], dtype=np.uint32)),
+                dtype=np.int64
+            )
+
+        vertices, faces = build(contour, triangles, np.float32(4.0))
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+        assert mesh.is_watertight
+        assert mesh.is_winding_consistent
+        # L area is 20*5 + 5*10 = 150
+        assert mesh.volume == pytest.approx(150.0 * 4.0, rel=1e-5)
+
+    def test_loops_match_numpy(self, l_shape):
+        """Test both builders emit the same faces."""
+        contour, triangles = l_shape
+
+        v_loops, f_loops = _build_extruded_mesh_loops(contour, triangles, np.float32(3.0))
+        v_numpy, f_numpy = _build_extruded_mesh_numpy(contour, triangles, np.float32(3.0))
+
+        np.testing.assert_array_equal(v_loops, v_numpy)
+        np.testing.assert_array_equal(f_loops, f_numpy)
+
+
+class TestLayeredSections:
+    """Test layered reconstruction keeps per-plane sections."""
+
+    def test_repeated_sections_keep_their_own_transform(self):
+        """Test prismatic layers share areas but not section objects."""
+        reconstructor = HybridReconstructor(verbose=False, adaptive_slicing=False)
+        mesh = trimesh.creation.box((10, 20, 30))
+
+        layers = reconstructor._reconstruct_layered(mesh, [])['layers']
+        sections = layers['sections']
+
+        assert len({id(section) for section in sections}) == len(sections)
+        assert np.allclose(layers['areas'], layers['areas'][0])
+        origins = np.array([section.metadata['to_3D'][:3, 3] for section in sections])
+        assert len(np.unique(np.round(origins, 6), axis=0)) == len(sections)
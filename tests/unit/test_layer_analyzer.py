@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for layer-slicing analysis.
+"""
+
+import pytest
+import numpy as np
+import trimesh
+from shapely.geometry import box as shapely_box
+
+from meshconverter.reconstruction.layer_analyzer import (
+    LayerAnalyzer,
+    LayerTable,
+    _best_match_loops,
+    _best_match_numpy,
+    _segment_components,
+    analyze_mesh_layers,
+)
+
+
+class TestSegmentComponents:
+    """Test region labelling by connected component."""
+
+    def test_two_squares_are_two_components(self):
+        """Test two disjoint square outlines get two labels."""
+        # Vertices 0-3 and 4-7 each form a closed square loop
+        loop = np.array([0, 1, 1, 2, 2, 3, 3, 0])
+        vertex_ids = np.concatenate([loop, loop + 4])
+
+        labels = _segment_components(vertex_ids)
+
+        assert len(set(labels[:4])) == 1
+        assert len(set(labels[4:])) == 1
+        assert labels[0] != labels[4]
+
+    def test_side_by_side_boxes(self):
+        """Test two sparse boxes in one slice become two boxes."""
+        a = trimesh.creation.box((10, 10, 20))
+        b = trimesh.creation.box((10, 10, 20))
+        b.apply_translation([30, 0, 0])
+
+        result = analyze_mesh_layers(trimesh.util.concatenate([a, b]), verbose=False)
+
+        assert len(result['detected_boxes']) == 2
+        centers = sorted(box['center'][0] for box in result['detected_boxes'])
+        assert centers == pytest.approx([0.0, 30.0], abs=0.5)
+
+    def test_hollow_section_is_one_box(self):
+        """Test the inner wall of a hollow section does not become a box."""
+        ring = shapely_box(-15, -15, 15, 15).difference(shapely_box(-10, -10, 10, 10))
+        mesh = trimesh.creation.extrude_polygon(ring, 20)
+
+        boxes = analyze_mesh_layers(mesh, verbose=False)['detected_boxes']
+
+        assert len(boxes) == 1
+        assert boxes[0]['dimensions'][:2] == pytest.approx([30.0, 30.0])
+
+
+class TestGrouping:
+    """Test grouping layer regions into boxes (STRtree matching)."""
+
+    @staticmethod
+    def _table(layers):
+        table = LayerTable(capacity=2)
+        for layer_id, (z, regions) in enumerate(layers):
+            bounds = np.array(regions, dtype=np.float32)
+            table.extend(z, layer_id, np.arange(len(bounds)), bounds)
+        return table
+
+    def test_side_by_side_columns(self):
+        """Test two columns of regions grow two boxes."""
+        left = [0, 0, 10, 10]
+        right = [20, 0, 30, 10]
+        table = self._table([(float(z), [left, right]) for z in range(6)])
+
+        boxes = LayerAnalyzer(layer_height=1.0)._group_layers_into_boxes(table)
+
+        assert len(boxes) == 2
+        assert all(box['n_layers'] == 6 for box in boxes)
+        assert sorted(box['center'][0] for box in boxes) == pytest.approx([5.0, 25.0])
+
+    def test_box_survives_one_layer_gap(self):
+        """Test a box stays open across a single missing layer."""
+        region = [0, 0, 10, 10]
+        layers = [(float(z), [region]) for z in (0, 1, 2, 4, 5, 6)]
+
+        boxes = LayerAnalyzer(layer_height=1.0)._group_layers_into_boxes(self._table(layers))
+
+        assert len(boxes) == 1
+        assert boxes[0]['z_range'] == pytest.approx([0.0, 6.0])
+
+    def test_stacked_boxes_split(self):
+        """Test a size change along Z starts a new box."""
+        small = [0, 0, 10, 10]
+        large = [-10, -10, 20, 20]
+        layers = [(float(z), [small]) for z in range(4)] + [(float(z), [large]) for z in range(4, 8)]
+
+        boxes = LayerAnalyzer(layer_height=1.0)._group_layers_into_boxes(self._table(layers))
+
+        assert len(boxes) == 2
+
+    def test_best_match_numpy_matches_loops(self):
+        """Test the NumPy matcher picks the same box as the loop kernel."""
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n_groups = int(rng.integers(1, 8))
+            lo = rng.uniform(0, 20, (n_groups, 2))
+            group_bounds = np.hstack([lo, lo + rng.uniform(5, 10, (n_groups, 2))]).astype(np.float32)
+            group_centers = (group_bounds[:, :2] + group_bounds[:, 2:]) / 2
+            group_areas = np.prod(group_bounds[:, 2:] - group_bounds[:, :2], axis=1)
+            group_zs = rng.uniform(0, 3, n_groups)
+
+            base = group_bounds[rng.integers(n_groups)]
+            bounds = (base + rng.normal(0, 0.3, 4)).astype(np.float32)
+            center = (bounds[:2] + bounds[2:]) / 2
+            area = float(np.prod(bounds[2:] - bounds[:2]))
+            candidates = np.arange(n_groups, dtype=np.int64)
+
+            args = (group_bounds, group_centers, group_areas, group_zs,
+                    candidates, bounds, center, area, 3.0, 2.0)
+            assert _best_match_numpy(*args) == _best_match_loops(*args)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the 2D layer fitting kernels of layer-wise stacking.
+"""
+
+import pytest
+import numpy as np
+import trimesh
+
+from meshconverter.reconstruction.layer_wise_stacker import (
+    LayerWiseStacker,
+    _circle_fit_loops,
+    _circle_fit_numpy,
+    _pca_extents_loops,
+    _pca_extents_numpy,
+)
+
+
+class TestFitKernels:
+    """Test the loop kernels (compiled with Numba) against their NumPy fallbacks."""
+
+    def test_circle_fit_matches_numpy(self):
+        """Test circle fits agree on noisy random circles."""
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            n = int(rng.integers(8, 200))
+            theta = rng.uniform(0, 2 * np.pi, n)
+            center = rng.uniform(-50, 50, 2)
+            radius = rng.uniform(1, 30)
+            coords = center + radius * np.column_stack([np.cos(theta), np.sin(theta)])
+            coords += rng.normal(0, 0.05 * radius, coords.shape)
+
+            assert _circle_fit_loops(coords) == pytest.approx(_circle_fit_numpy(coords), rel=1e-6, abs=1e-9)
+
+    def test_circle_fit_exact_circle(self):
+        """Test an exact circle is recovered with zero error."""
+        theta = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+        coords = np.column_stack([3 + 5 * np.cos(theta), -2 + 5 * np.sin(theta)])
+
+        cx, cy, r, rms = _circle_fit_loops(coords)
+
+        assert (cx, cy, r) == pytest.approx((3.0, -2.0, 5.0))
+        assert rms == pytest.approx(0.0, abs=1e-9)
+
+    def test_pca_extents_match_numpy(self):
+        """Test PCA extents and angles agree on random rotated rectangles."""
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            n = int(rng.integers(8, 200))
+            local = rng.uniform(-1, 1, (n, 2)) * rng.uniform(1, 20, 2)
+            angle = rng.uniform(0, np.pi)
+            rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+            coords = local @ rotation.T + rng.uniform(-50, 50, 2)
+
+            assert _pca_extents_loops(coords) == pytest.approx(_pca_extents_numpy(coords), rel=1e-6, abs=1e-6)
+
+    def test_pca_extents_isotropic(self):
+        """Test a square reports the Y axis in both implementations."""
+        coords = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+
+        assert _pca_extents_loops(coords) == pytest.approx((4.0, 4.0, 90.0))
+        assert _pca_extents_numpy(coords) == pytest.approx((4.0, 4.0, 90.0))
+
+
+class TestSimplifiedLayers:
+    """Test that polygon simplification does not change fit results."""
+
+    def test_fits_use_full_ring(self):
+        """Test the layer keeps every ring vertex while its polygon is simplified."""
+        mesh = trimesh.creation.cylinder(radius=20, height=30, sections=6)
+        stacker = LayerWiseStacker(layer_height=0.5, verbose=False)
+
+        layers = stacker.slice_mesh(mesh, np.array([0.0, 0.0, 1.0]), 0.5)
+
+        # Slices through face diagonals carry extra collinear vertices
+        simplified = [len(layer['polygon'].exterior.coords) - 1 for layer in layers]
+        full = [len(layer['coords']) for layer in layers]
+        assert all(f >= s for f, s in zip(full, simplified))
+        assert any(f > s for f, s in zip(full, simplified))
+
+    def test_hexagonal_prism_with_circle_hint(self):
+        """Test a hexagonal prism with a circle hint keeps its quality score."""
+        mesh = trimesh.creation.cylinder(radius=20, height=30, sections=6)
+        stacker = LayerWiseStacker(layer_height=0.5, verbose=False)
+
+        result = stacker.reconstruct(mesh, vision_results=[{'shape_detected': 'circle'}] * 100)
+
+        assert result['num_segments'] == 1
+        assert result['quality_score'] >= 95
+
+
+class TestLayerSignature:
+    """Test which slices share one fit."""
+
+    def test_rotated_section_gets_its_own_signature(self):
+        """Test a square over a 45° square does not reuse the lower fit."""
+        lower = trimesh.creation.box((20, 20, 10))
+        lower.apply_translation([0, 0, 5])
+        upper = trimesh.creation.box((20, 20, 10))
+        upper.apply_transform(trimesh.transformations.rotation_matrix(np.pi / 4, [0, 0, 1]))
+        upper.apply_translation([0, 0, 15])
+        mesh = trimesh.util.concatenate([lower, upper])
+
+        stacker = LayerWiseStacker(layer_height=1.0, verbose=False)
+        layers = stacker.slice_mesh(mesh, np.array([0.0, 0.0, 1.0]), 1.0)
+
+        below = {layer['signature'] for layer in layers if layer['z_height'] < 10}
+        above = {layer['signature'] for layer in layers if layer['z_height'] > 10}
+        assert below
+        assert above
+        assert below.isdisjoint(above)
+
+    def test_shared_fit_is_copied(self, monkeypatch):
+        """Test segments get their own copy of a memoized fit."""
+        stacker = LayerWiseStacker(layer_height=1.0, verbose=False)
+        layers = stacker.slice_mesh(trimesh.creation.box((20, 20, 30)), np.array([0.0, 0.0, 1.0]), 1.0)
+
+        memo = {}
+        fit_layers = stacker._fit_layers
+
+        def spy(requests):
+            memo.update(fit_layers(requests))
+            return memo
+
+        monkeypatch.setattr(stacker, '_fit_layers', spy)
+        segments = stacker.group_similar_layers(layers)
+
+        assert segments
+        shared = {id(fit) for fit in memo.values()}
+        assert all(id(segment['primitive_2d']) not in shared for segment in segments)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-view primitive detection.
+"""
+
+import numpy as np
+import trimesh
+
+from meshconverter.reconstruction.multiview_detector import MultiViewPrimitiveDetector
+
+
+class TestRenderCache:
+    """Test memoization of rendered views."""
+
+    def test_modified_mesh_is_rendered_again(self):
+        """Test an in-place edit of the mesh does not reuse the old render."""
+        detector = MultiViewPrimitiveDetector(image_size=64, verbose=False)
+        mesh = trimesh.creation.box((10, 10, 10))
+
+        before = detector.render_view(mesh, 0, 90)
+        mesh.vertices = mesh.vertices * np.array([2.0, 1.0, 1.0])
+        after = detector.render_view(mesh, 0, 90)
+
+        assert after is not before
+        assert detector.render_view(mesh, 0, 90) is after
+
+    def test_cache_is_bounded(self):
+        """Test old renders are evicted once the cache is full."""
+        detector = MultiViewPrimitiveDetector(image_size=32, verbose=False, cache_size=4)
+        mesh = trimesh.creation.box((10, 10, 10))
+
+        first = detector.render_view(mesh, 0, 0)
+        detector.render_views_batched(mesh, [(azimuth, 0) for azimuth in range(10, 60, 10)])
+
+        assert len(detector._render_cache) == 4
+        assert detector.render_view(mesh, 0, 0) is not first